@@ -1,20 +1,92 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import List, Optional
+import asyncio
+from contextlib import asynccontextmanager
+import os
+import time
+from typing import Any, AsyncIterator, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from monopoly.engine import GameEngine, GameRuleError, InsufficientFunds
-from monopoly.data import BOARD, PROPERTY_DATA
+from monopoly import analytics, codec
+from monopoly.engine import (
+    ActionListener,
+    GameRuleError,
+    InsufficientFunds,
+    PlayerBankrupt,
+    TradeOffer,
+    action_args_error,
+)
+from monopoly.persistence import GameJournal, JournalRecorder
+from monopoly.sessions import (
+    BOARD_ETAG,
+    BOARD_JSON,
+    GameNotFound,
+    GameRegistry,
+    GameSession,
+)
+from monopoly.telemetry import CONTENT_TYPE as METRICS_CONTENT_TYPE, Telemetry
+from monopoly.timers import DEFAULT_BID_TIMEOUT, DEFAULT_TURN_TIMEOUT, TurnTimers
 
 
-app = FastAPI()
+JOURNAL_PATH = os.environ.get("MONOPOLY_JOURNAL", "monopoly_games.sqlite3")
+TURN_TIMEOUT = float(os.environ.get("MONOPOLY_TURN_TIMEOUT", DEFAULT_TURN_TIMEOUT))
+BID_TIMEOUT = float(os.environ.get("MONOPOLY_BID_TIMEOUT", DEFAULT_BID_TIMEOUT))
+
+_JOURNAL = GameJournal(JOURNAL_PATH) if JOURNAL_PATH else None
+_REGISTRY = GameRegistry(journal=_JOURNAL)
+_TELEMETRY = Telemetry()
+_TIMERS = TurnTimers(
+    _REGISTRY, TURN_TIMEOUT, BID_TIMEOUT, on_timeout=lambda game_id, action: _TELEMETRY.timeouts.inc(action)
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    _REGISTRY.recover()
+    for session in _REGISTRY.sessions():
+        _TIMERS.touch(session)
+    timers = asyncio.create_task(_TIMERS.run())
+    yield
+    timers.cancel()
+    try:
+        await timers
+    except asyncio.CancelledError:
+        pass
+    if _JOURNAL is not None:
+        _JOURNAL.close()
+
+
+app = FastAPI(lifespan=lifespan)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-_ENGINE: Optional[GameEngine] = None
+LONG_POLL_TIMEOUT = 25.0
+SSE_KEEPALIVE = 15.0
+BOARD_CACHE_CONTROL = "public, max-age=86400, immutable"
+MAX_BATCH_ACTIONS = 32
+CLIENT_ACTIONS = frozenset(
+    {
+        "roll_dice",
+        "attempt_jail_roll",
+        "pay_jail_fine",
+        "use_get_out_of_jail_card",
+        "buy_property",
+        "decline_property",
+        "place_bid",
+        "pass_bid",
+        "create_trade_offer",
+        "accept_trade_offer",
+        "cancel_trade_offer",
+        "mortgage_property",
+        "unmortgage_property",
+        "build_house",
+        "sell_house",
+        "end_turn",
+    }
+)
 
 
 @app.get("/")
@@ -22,97 +94,319 @@ def index() -> FileResponse:
     return FileResponse("static/index.html")
 
 
-@app.post("/api/start")
-def start_game(payload: dict) -> dict:
-    global _ENGINE
+@app.get("/metrics")
+def metrics() -> Response:
+    return Response(content=_TELEMETRY.render(_REGISTRY), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/api/board")
+def get_board(request: Request) -> Response:
+    headers = {"ETag": BOARD_ETAG, "Cache-Control": BOARD_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), BOARD_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=BOARD_JSON, media_type="application/json", headers=headers)
+
+
+@app.get("/api/analytics")
+def get_analytics() -> Response:
+    return Response(
+        content=analytics.summary_json(),
+        media_type="application/json",
+        headers={"Cache-Control": BOARD_CACHE_CONTROL},
+    )
+
+
+@app.post("/api/games")
+def create_game(payload: dict) -> dict:
     players = payload.get("players")
     if not isinstance(players, list) or not (2 <= len(players) <= 4):
         raise HTTPException(status_code=400, detail="Provide 2-4 player names.")
     if any(not isinstance(name, str) or not name.strip() for name in players):
         raise HTTPException(status_code=400, detail="Player names must be non-empty strings.")
-    _ENGINE = GameEngine([name.strip() for name in players])
-    _ENGINE.start_turn()
+    session = _REGISTRY.create([name.strip() for name in players])
+    _TIMERS.touch(session)
+    return {"ok": True, "game_id": session.game_id}
+
+
+@app.delete("/api/games/{game_id}")
+def delete_game(game_id: str) -> dict:
+    try:
+        _REGISTRY.remove(game_id)
+    except GameNotFound as exc:
+        raise HTTPException(status_code=404, detail="Game not found.") from exc
+    _TIMERS.cancel(game_id)
     return {"ok": True}
 
 
-@app.get("/api/state")
-def get_state() -> dict:
-    if _ENGINE is None:
-        return {"started": False}
-    state = _ENGINE.state
+@app.get("/api/games/{game_id}/state")
+async def get_state(
+    game_id: str,
+    request: Request,
+    since: Optional[int] = None,
+    timeout: float = LONG_POLL_TIMEOUT,
+) -> Response:
+    session = _require_session(game_id)
+    binary = codec.accepts_binary(request.headers.get("accept"))
+    if since is not None:
+        await session.wait_for_change(since, max(0.0, min(timeout, LONG_POLL_TIMEOUT)))
+        payload, etag = await run_in_threadpool(_read_delta, session, since, binary)
+        return _state_response(payload, etag)
+    etag = _state_etag(session, binary)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=_state_headers(etag))
+    content, etag = await run_in_threadpool(_read_state, session, binary)
+    media_type = codec.MEDIA_TYPE if binary else "application/json"
+    return Response(content=content, media_type=media_type, headers=_state_headers(etag))
+
+
+# The session lock is a threading lock held across whole action batches, so the long-poll handler
+# takes it and serializes in the threadpool instead of blocking the event loop.
+def _read_delta(session: GameSession, since: int, binary: bool) -> Tuple[Union[dict, bytes], str]:
+    with session.lock:
+        started = time.perf_counter()
+        payload = session.encode(since) if binary else session.delta(since)
+        _TELEMETRY.serialization.observe("binary_delta" if binary else "delta", time.perf_counter() - started)
+        return payload, _state_etag(session, binary)
+
+
+def _read_state(session: GameSession, binary: bool) -> Tuple[bytes, str]:
+    with session.lock:
+        started = time.perf_counter()
+        payload = session.state_payload(binary)
+        _TELEMETRY.serialization.observe("binary_full" if binary else "full", time.perf_counter() - started)
+        return payload, _state_etag(session, binary)
+
+
+def _state_etag(session: GameSession, binary: bool) -> str:
+    return f'{session.etag[:-1]}-bin"' if binary else session.etag
+
+
+def _state_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+
+
+def _state_response(payload: Union[dict, bytes], etag: str) -> Response:
+    if isinstance(payload, bytes):
+        return Response(content=payload, media_type=codec.MEDIA_TYPE, headers=_state_headers(etag))
+    return JSONResponse(payload, headers=_state_headers(etag))
+
+
+@app.get("/api/games/{game_id}/legal_actions")
+def get_legal_actions(game_id: str, player_id: int) -> dict:
+    session = _require_session(game_id)
+    with session.lock:
+        if not 0 <= player_id < len(session.engine.state.players):
+            raise HTTPException(status_code=400, detail="Unknown player.")
+        actions = session.engine.legal_actions(player_id)
+        version = session.engine.state.version
+    return {"version": version, "actions": [{"action": name, "args": list(args)} for name, args in actions]}
+
+
+@app.get("/api/games/{game_id}/events")
+async def stream_events(game_id: str, request: Request, since: Optional[int] = None) -> StreamingResponse:
+    session = _require_session(game_id)
+    last_event_id = request.headers.get("last-event-id")
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    binary = codec.accepts_binary(request.headers.get("accept"), codec.STREAM_MEDIA_TYPE)
+    keepalive = codec.KEEPALIVE_FRAME if binary else ": keepalive\n\n"
+    with session.lock:
+        queue = session.subscribe(asyncio.get_running_loop(), since, binary)
+
+    async def stream() -> AsyncIterator[Union[str, bytes]]:
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield keepalive
+        finally:
+            session.bus.unsubscribe(queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type=codec.STREAM_MEDIA_TYPE if binary else "text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept"},
+    )
+
+
+@app.post("/api/games/{game_id}/actions")
+def apply_actions(game_id: str, payload: dict) -> dict:
+    batch = _parse_batch(payload.get("actions"))
+    session = _require_session(game_id)
+    results: List[Any] = []
+    bankrupt: List[int] = []
+    failed: Optional[dict] = None
+    with session.lock:
+        started = time.perf_counter()
+        since = session.version
+        engine = session.engine
+        checkpoint = engine.clone(keep_log=True)
+        listener = engine.action_listener
+        recorded: List[Tuple[str, Tuple[Any, ...], dict]] = []
+        if listener is not None:
+            engine.action_listener = lambda name, args, kwargs: recorded.append((name, args, kwargs))
+        completed = False
+        try:
+            for index, (name, args, kwargs) in enumerate(batch):
+                try:
+                    results.append(_action_result(engine.apply_action(name, args, kwargs)))
+                except PlayerBankrupt as exc:
+                    results.append(None)
+                    bankrupt.extend(bust.player_id for bust in exc.players())
+                except GameRuleError as exc:
+                    failed = {"index": index, "action": name, "detail": str(exc)}
+                    _TELEMETRY.action_errors.inc(name)
+                    break
+            completed = failed is None
+        finally:
+            engine.action_listener = listener
+            if completed:
+                _record(listener, recorded)
+            else:
+                engine.rollback(checkpoint)
+            session.commit()
+            _TIMERS.touch(session)
+            _TELEMETRY.actions.observe("batch", time.perf_counter() - started)
+        if failed is not None:
+            results.clear()
+            bankrupt.clear()
+        state = session.delta(since)
     return {
-        "started": True,
-        "players": [
-            {
-                "id": player.player_id,
-                "name": player.name,
-                "cash": player.cash,
-                "position": player.position,
-                "in_jail": player.in_jail,
-                "bankrupt": player.bankrupt,
-            }
-            for player in state.players
-        ],
-        "current_player": state.current_player_index,
-        "turn_phase": state.turn_state.phase,
-        "pending_property_id": state.turn_state.pending_property_id,
-        "last_roll": state.turn_state.last_roll,
-        "event_log": state.event_log[-10:],
-        "board": [asdict(space) for space in BOARD],
-        "properties": {
-            str(prop_id): {
-                "owner_id": prop_state.owner_id,
-                "houses": prop_state.houses,
-                "mortgaged": prop_state.mortgaged,
-                "name": PROPERTY_DATA[prop_id].name,
-            }
-            for prop_id, prop_state in state.properties.items()
-        },
-        "houses_available": state.houses_available,
-        "hotels_available": state.hotels_available,
+        "ok": failed is None,
+        "applied": len(results),
+        "results": results,
+        "bankrupt": bankrupt,
+        "failed": failed,
+        "state": state,
     }
 
 
-def _require_engine() -> GameEngine:
-    if _ENGINE is None:
-        raise HTTPException(status_code=400, detail="Game not started.")
-    return _ENGINE
+def _record(listener: Optional[ActionListener], calls: List[Tuple[str, Tuple[Any, ...], dict]]) -> None:
+    if listener is None:
+        return
+    if isinstance(listener, JournalRecorder):
+        listener.extend(calls)
+        return
+    for name, args, kwargs in calls:
+        listener(name, args, kwargs)
+
 
+def _parse_batch(actions: Any) -> List[Tuple[str, Tuple[Any, ...], dict]]:
+    if not isinstance(actions, list) or not (1 <= len(actions) <= MAX_BATCH_ACTIONS):
+        raise HTTPException(status_code=400, detail=f"Provide 1-{MAX_BATCH_ACTIONS} actions.")
+    batch = []
+    for index, item in enumerate(actions):
+        name = item.get("action") if isinstance(item, dict) else None
+        if name not in CLIENT_ACTIONS:
+            raise HTTPException(status_code=400, detail=f"Unknown action at index {index}.")
+        args = item.get("args", [])
+        kwargs = item.get("kwargs", {})
+        if not isinstance(args, list) or not isinstance(kwargs, dict):
+            raise HTTPException(status_code=400, detail=f"Malformed arguments at index {index}.")
+        error = action_args_error(name, tuple(args), kwargs)
+        if error is not None:
+            raise HTTPException(status_code=400, detail=f"{error} (index {index})")
+        batch.append((name, tuple(args), kwargs))
+    return batch
 
-def _wrap_action(action_name: str, action) -> dict:
-    engine = _require_engine()
+
+def _action_result(value: Any) -> Any:
+    if isinstance(value, TradeOffer):
+        return {"offer_id": value.offer_id}
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+@app.get("/api/games/{game_id}/spectate")
+async def spectate(game_id: str, request: Request) -> StreamingResponse:
+    session = _require_session(game_id)
+    binary = codec.accepts_binary(request.headers.get("accept"), codec.STREAM_MEDIA_TYPE)
+    keepalive = codec.KEEPALIVE_FRAME if binary else b": keepalive\n\n"
+    with session.lock:
+        spectator = session.spectate(asyncio.get_running_loop(), binary)
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(spectator.next(), timeout=SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield keepalive
+        finally:
+            session.spectators.leave(spectator)
+
+    return StreamingResponse(
+        stream(),
+        media_type=codec.STREAM_MEDIA_TYPE if binary else "text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept"},
+    )
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    return any(candidate.strip() in (etag, "*") for candidate in header.split(","))
+
+
+def _require_session(game_id: str) -> GameSession:
     try:
-        action(engine)
-    except (GameRuleError, InsufficientFunds) as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return _REGISTRY.get(game_id)
+    except GameNotFound as exc:
+        raise HTTPException(status_code=404, detail="Game not found.") from exc
+
+
+def _wrap_action(game_id: str, action_name: str, action) -> dict:
+    session = _require_session(game_id)
+    with session.lock:
+        started = time.perf_counter()
+        bankrupt = None
+        try:
+            action(session.engine)
+        except PlayerBankrupt as exc:
+            bankrupt = exc.player_id
+        except (GameRuleError, InsufficientFunds) as exc:
+            _TELEMETRY.action_errors.inc(action_name)
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        finally:
+            session.commit()
+            _TIMERS.touch(session)
+            _TELEMETRY.actions.observe(action_name, time.perf_counter() - started)
+    if bankrupt is not None:
+        return {"ok": True, "action": action_name, "bankrupt": bankrupt}
     return {"ok": True, "action": action_name}
 
 
-@app.post("/api/roll")
-def roll_dice() -> dict:
-    return _wrap_action("roll", lambda engine: engine.roll_dice())
+@app.post("/api/games/{game_id}/roll")
+def roll_dice(game_id: str) -> dict:
+    return _wrap_action(game_id, "roll", lambda engine: engine.roll_dice())
 
 
-@app.post("/api/jail/roll")
-def jail_roll() -> dict:
-    return _wrap_action("jail_roll", lambda engine: engine.attempt_jail_roll())
+@app.post("/api/games/{game_id}/jail/roll")
+def jail_roll(game_id: str) -> dict:
+    return _wrap_action(game_id, "jail_roll", lambda engine: engine.attempt_jail_roll())
 
 
-@app.post("/api/jail/pay")
-def jail_pay() -> dict:
-    return _wrap_action("jail_pay", lambda engine: engine.pay_jail_fine())
+@app.post("/api/games/{game_id}/jail/pay")
+def jail_pay(game_id: str) -> dict:
+    return _wrap_action(game_id, "jail_pay", lambda engine: engine.pay_jail_fine())
 
 
-@app.post("/api/buy")
-def buy_property() -> dict:
-    return _wrap_action("buy", lambda engine: engine.buy_property())
+@app.post("/api/games/{game_id}/buy")
+def buy_property(game_id: str) -> dict:
+    return _wrap_action(game_id, "buy", lambda engine: engine.buy_property())
 
 
-@app.post("/api/decline")
-def decline_property() -> dict:
-    return _wrap_action("decline", lambda engine: engine.decline_property())
+@app.post("/api/games/{game_id}/decline")
+def decline_property(game_id: str) -> dict:
+    return _wrap_action(game_id, "decline", lambda engine: engine.decline_property())
 
 
-@app.post("/api/end_turn")
-def end_turn() -> dict:
-    return _wrap_action("end_turn", lambda engine: engine.end_turn())
+@app.post("/api/games/{game_id}/end_turn")
+def end_turn(game_id: str) -> dict:
+    return _wrap_action(game_id, "end_turn", lambda engine: engine.end_turn())
@@ -1,3 +1,3 @@
-from .engine import GameEngine, GameRuleError, InsufficientFunds
+from .engine import GameEngine, GameRuleError, InsufficientFunds, PlayerBankrupt
 
-__all__ = ["GameEngine", "GameRuleError", "InsufficientFunds"]
+__all__ = ["GameEngine", "GameRuleError", "InsufficientFunds", "PlayerBankrupt"]
@@ -0,0 +1,42 @@
+from typing import Callable, Dict, Optional
+
+from .base import JAIL_CARD, JAIL_PAY, JAIL_ROLL, Policy, TradeProposal
+from .driver import GameDriver, GameResult
+from .heuristics import GreedyPolicy, InvestorPolicy, RandomPolicy, plan_builds
+from .mcts import MCTSPolicy, evaluate, net_worth
+
+POLICIES: Dict[str, Callable[[], Policy]] = {
+    Policy.name: Policy,
+    GreedyPolicy.name: GreedyPolicy,
+    InvestorPolicy.name: InvestorPolicy,
+    RandomPolicy.name: RandomPolicy,
+    MCTSPolicy.name: MCTSPolicy,
+}
+
+
+def make_policy(name: str, seed: Optional[int] = None) -> Policy:
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy {name!r}.")
+    if name in (RandomPolicy.name, MCTSPolicy.name):
+        return POLICIES[name](seed=seed)
+    return POLICIES[name]()
+
+
+__all__ = [
+    "GameDriver",
+    "GameResult",
+    "GreedyPolicy",
+    "InvestorPolicy",
+    "JAIL_CARD",
+    "JAIL_PAY",
+    "JAIL_ROLL",
+    "MCTSPolicy",
+    "POLICIES",
+    "Policy",
+    "RandomPolicy",
+    "TradeProposal",
+    "evaluate",
+    "make_policy",
+    "net_worth",
+    "plan_builds",
+]
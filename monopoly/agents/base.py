@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from ..engine import AuctionState, GameEngine, TradeOffer
+
+JAIL_ROLL = "roll"
+JAIL_PAY = "pay"
+JAIL_CARD = "card"
+
+
+@dataclass
+class TradeProposal:
+    to_player: int
+    give_cash: int = 0
+    give_properties: List[int] = field(default_factory=list)
+    receive_cash: int = 0
+    receive_properties: List[int] = field(default_factory=list)
+
+
+class Policy:
+    name = "passive"
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        return False
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        return None
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        return JAIL_ROLL
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        return []
+
+    def unmortgage(self, engine: GameEngine, player_id: int) -> List[int]:
+        return []
+
+    def mortgage(self, engine: GameEngine, player_id: int, amount_needed: int) -> List[int]:
+        return []
+
+    def propose_trade(self, engine: GameEngine, player_id: int) -> Optional[TradeProposal]:
+        return None
+
+    def accept_trade(self, engine: GameEngine, player_id: int, offer: TradeOffer) -> bool:
+        return False
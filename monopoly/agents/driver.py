@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from ..data import JAIL_FINE, PROPERTY_DATA
+from ..engine import GameEngine, GameRuleError, PlayerBankrupt, TurnPhase
+from .base import JAIL_CARD, JAIL_PAY, Policy
+
+
+@dataclass
+class GameResult:
+    winner: Optional[int]
+    turns: int
+    bankruptcies: List[Tuple[int, str]]
+
+
+class GameDriver:
+    def __init__(self, engine: GameEngine, policies: Sequence[Policy]) -> None:
+        if len(policies) != len(engine.state.players):
+            raise ValueError("Need exactly one policy per player.")
+        self.engine = engine
+        self.policies = list(policies)
+        self.turns = 0
+        self.bankruptcies: List[Tuple[int, str]] = []
+        self.active = sum(1 for player in engine.state.players if not player.bankrupt)
+
+    def finished(self) -> bool:
+        return self.active <= 1
+
+    def winner(self) -> Optional[int]:
+        if self.active != 1:
+            return None
+        return next(player.player_id for player in self.engine.state.players if not player.bankrupt)
+
+    def step(self) -> None:
+        engine = self.engine
+        phase = engine.state.turn_state.phase
+        player_id = engine.state.current_player_index
+        policy = self.policies[player_id]
+        try:
+            if phase is TurnPhase.AWAIT_ROLL:
+                self._manage(policy, player_id)
+                engine.roll_dice()
+            elif phase is TurnPhase.AWAIT_BUY_DECISION:
+                self._decide_purchase(policy, player_id)
+            elif phase is TurnPhase.AWAIT_JAIL_ACTION:
+                self._leave_jail(policy, player_id)
+            elif phase is TurnPhase.AWAIT_AUCTION:
+                self._run_auction()
+            elif self.active > 1:
+                self._trade(policy, player_id)
+                engine.end_turn()
+                self.turns += 1
+        except PlayerBankrupt as exc:
+            for bust in exc.players():
+                self.bankruptcies.append((bust.player_id, bust.cause))
+                self.active -= 1
+
+    def play_turn(self) -> None:
+        turns = self.turns
+        while self.turns == turns and not self.finished():
+            self.step()
+
+    def play_game(self, max_turns: int) -> GameResult:
+        while self.turns < max_turns and not self.finished():
+            self.step()
+        return GameResult(self.winner(), self.turns, self.bankruptcies)
+
+    def _manage(self, policy: Policy, player_id: int) -> None:
+        engine = self.engine
+        for prop_id in policy.unmortgage(engine, player_id):
+            try:
+                engine.unmortgage_property(player_id, prop_id)
+            except GameRuleError:
+                break
+        for prop_id in policy.build(engine, player_id):
+            try:
+                engine.build_house(player_id, prop_id)
+            except GameRuleError:
+                break
+
+    def _raise_cash(self, policy: Policy, player_id: int, amount_needed: int) -> None:
+        for prop_id in policy.mortgage(self.engine, player_id, amount_needed):
+            try:
+                self.engine.mortgage_property(player_id, prop_id)
+            except GameRuleError:
+                break
+
+    def _decide_purchase(self, policy: Policy, player_id: int) -> None:
+        engine = self.engine
+        prop_id = engine.state.turn_state.pending_property_id
+        player = engine.state.players[player_id]
+        if prop_id is not None and policy.should_buy(engine, player_id, prop_id):
+            price = PROPERTY_DATA[prop_id].price
+            if player.cash < price:
+                self._raise_cash(policy, player_id, price - player.cash)
+            if player.cash >= price:
+                engine.buy_property()
+                return
+        engine.decline_property()
+
+    def _leave_jail(self, policy: Policy, player_id: int) -> None:
+        engine = self.engine
+        player = engine.state.players[player_id]
+        action = policy.jail_action(engine, player_id)
+        if action == JAIL_CARD and player.get_out_of_jail_cards:
+            engine.use_get_out_of_jail_card(player.get_out_of_jail_cards[0][0])
+        elif action == JAIL_PAY and player.cash >= JAIL_FINE:
+            engine.pay_jail_fine()
+        else:
+            engine.attempt_jail_roll()
+
+    def _run_auction(self) -> None:
+        engine = self.engine
+        turn_state = engine.state.turn_state
+        while turn_state.pending_auction is not None:
+            auction = turn_state.pending_auction
+            passing = []
+            for bidder in sorted(auction.active_bidders):
+                if bidder == auction.highest_bidder:
+                    continue
+                amount = self.policies[bidder].bid(engine, bidder, auction)
+                if amount is None:
+                    passing.append(bidder)
+                    continue
+                try:
+                    engine.place_bid(bidder, amount)
+                except GameRuleError:
+                    passing.append(bidder)
+            for bidder in passing:
+                if turn_state.pending_auction is None:
+                    return
+                engine.pass_bid(bidder)
+
+    def _trade(self, policy: Policy, player_id: int) -> None:
+        engine = self.engine
+        proposal = policy.propose_trade(engine, player_id)
+        if proposal is None:
+            return
+        partner = proposal.to_player
+        if partner == player_id or engine.state.players[partner].bankrupt:
+            return
+        try:
+            offer = engine.create_trade_offer(
+                player_id,
+                partner,
+                proposal.give_cash,
+                list(proposal.give_properties),
+                proposal.receive_cash,
+                list(proposal.receive_properties),
+            )
+        except GameRuleError:
+            return
+        try:
+            if self.policies[partner].accept_trade(engine, partner, offer):
+                engine.accept_trade_offer(offer.offer_id, partner)
+        except GameRuleError:
+            pass
+        if offer.status == "open":
+            engine.cancel_trade_offer(offer.offer_id, player_id)
+        engine.discard_trade_offer(offer.offer_id)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional
+
+from ..data import JAIL_FINE, MAX_HOUSES, PROPERTY_DATA, PROPERTY_GROUPS
+from ..engine import AuctionState, GameEngine, TradeOffer, unmortgage_cost
+from .base import JAIL_CARD, JAIL_PAY, JAIL_ROLL, Policy, TradeProposal
+
+
+def plan_builds(engine: GameEngine, player_id: int, reserve: int, max_houses: int = 5) -> List[int]:
+    state = engine.state
+    cash = state.players[player_id].cash
+    houses_available = state.houses_available
+    hotels_available = state.hotels_available
+    plan: List[int] = []
+    for color, prop_ids in PROPERTY_GROUPS.items():
+        if not engine._owns_group(player_id, color) or engine._group_has_mortgage(color):
+            continue
+        levels: Dict[int, int] = {prop_id: state.properties[prop_id].houses for prop_id in prop_ids}
+        house_cost = PROPERTY_DATA[prop_ids[0]].house_cost or 0
+        while cash - house_cost >= reserve:
+            target = min(prop_ids, key=levels.__getitem__)
+            level = levels[target]
+            if level >= max_houses:
+                break
+            if level == 4:
+                if hotels_available < 1:
+                    break
+                hotels_available -= 1
+                houses_available = min(MAX_HOUSES, houses_available + 4)
+            else:
+                if houses_available < 1:
+                    break
+                houses_available -= 1
+            levels[target] = level + 1
+            cash -= house_cost
+            plan.append(target)
+    return plan
+
+
+def _owned(engine: GameEngine, player_id: int) -> List[int]:
+    return [prop_id for prop_id, prop in engine.state.properties.items() if prop.owner_id == player_id]
+
+
+def _completes_group(engine: GameEngine, player_id: int, property_id: int) -> bool:
+    color = PROPERTY_DATA[property_id].color
+    if color is None:
+        return False
+    properties = engine.state.properties
+    return all(properties[prop_id].owner_id == player_id for prop_id in PROPERTY_GROUPS[color] if prop_id != property_id)
+
+
+class GreedyPolicy(Policy):
+    name = "greedy"
+
+    def __init__(self, build_reserve: int = 200, jail_pay_threshold: int = JAIL_FINE * 4) -> None:
+        self.build_reserve = build_reserve
+        self.jail_pay_threshold = jail_pay_threshold
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        return engine.state.players[player_id].cash >= PROPERTY_DATA[property_id].price
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        if engine.state.players[player_id].cash >= self.jail_pay_threshold:
+            return JAIL_PAY
+        return JAIL_ROLL
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        return plan_builds(engine, player_id, self.build_reserve)
+
+
+class InvestorPolicy(Policy):
+    name = "investor"
+
+    def __init__(self, reserve: int = 150, bid_fraction: float = 0.9, trade_premium: float = 1.5) -> None:
+        self.reserve = reserve
+        self.bid_fraction = bid_fraction
+        self.trade_premium = trade_premium
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        cash = engine.state.players[player_id].cash
+        price = PROPERTY_DATA[property_id].price
+        if _completes_group(engine, player_id, property_id):
+            return cash >= price
+        return cash - price >= self.reserve
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        cash = engine.state.players[player_id].cash
+        limit = min(int(PROPERTY_DATA[auction.property_id].price * self.bid_fraction), cash - self.reserve)
+        amount = auction.highest_bid + 10
+        return amount if amount <= limit else None
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        player = engine.state.players[player_id]
+        if player.get_out_of_jail_cards:
+            return JAIL_CARD
+        unowned = sum(1 for prop in engine.state.properties.values() if prop.owner_id is None)
+        if unowned >= 8 and player.cash - JAIL_FINE >= self.reserve:
+            return JAIL_PAY
+        return JAIL_ROLL
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        plan = plan_builds(engine, player_id, self.reserve, max_houses=3)
+        return plan or plan_builds(engine, player_id, self.reserve * 2)
+
+    def unmortgage(self, engine: GameEngine, player_id: int) -> List[int]:
+        cash = engine.state.players[player_id].cash
+        chosen: List[int] = []
+        for prop_id in _owned(engine, player_id):
+            if not engine.state.properties[prop_id].mortgaged:
+                continue
+            cost = unmortgage_cost(prop_id)
+            if cash - cost >= self.reserve * 2:
+                chosen.append(prop_id)
+                cash -= cost
+        return chosen
+
+    def mortgage(self, engine: GameEngine, player_id: int, amount_needed: int) -> List[int]:
+        candidates = [
+            prop_id
+            for prop_id in _owned(engine, player_id)
+            if not engine.state.properties[prop_id].mortgaged
+            and not engine._group_has_houses(prop_id)
+            and not engine._owns_group(player_id, PROPERTY_DATA[prop_id].color)
+        ]
+        candidates.sort(key=lambda prop_id: PROPERTY_DATA[prop_id].mortgage)
+        chosen: List[int] = []
+        raised = 0
+        for prop_id in candidates:
+            if raised >= amount_needed:
+                break
+            chosen.append(prop_id)
+            raised += PROPERTY_DATA[prop_id].mortgage
+        return chosen if raised >= amount_needed else []
+
+    def propose_trade(self, engine: GameEngine, player_id: int) -> Optional[TradeProposal]:
+        state = engine.state
+        cash = state.players[player_id].cash
+        for prop_ids in PROPERTY_GROUPS.values():
+            missing = [prop_id for prop_id in prop_ids if state.properties[prop_id].owner_id != player_id]
+            if len(missing) != 1:
+                continue
+            holder = state.properties[missing[0]].owner_id
+            if holder is None or state.players[holder].bankrupt:
+                continue
+            offer = int(PROPERTY_DATA[missing[0]].price * self.trade_premium)
+            if cash - offer >= self.reserve:
+                return TradeProposal(to_player=holder, give_cash=offer, receive_properties=[missing[0]])
+        return None
+
+    def accept_trade(self, engine: GameEngine, player_id: int, offer: TradeOffer) -> bool:
+        if any(_completes_group(engine, player_id, prop_id) for prop_id in offer.receive_properties):
+            return False
+        if any(engine._group_has_houses(prop_id) for prop_id in offer.receive_properties):
+            return False
+        given = sum(PROPERTY_DATA[prop_id].price for prop_id in offer.receive_properties) + offer.receive_cash
+        received = sum(PROPERTY_DATA[prop_id].price for prop_id in offer.give_properties) + offer.give_cash
+        return received >= given * self.trade_premium
+
+
+class RandomPolicy(Policy):
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.random = random.Random(seed)
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        return self.random.random() < 0.5
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        cash = engine.state.players[player_id].cash
+        if self.random.random() < 0.3 and cash > auction.highest_bid + 1:
+            return self.random.randint(auction.highest_bid + 1, max(auction.highest_bid + 1, cash // 2))
+        return None
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        return self.random.choice((JAIL_ROLL, JAIL_PAY))
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        if self.random.random() < 0.5:
+            return []
+        return plan_builds(engine, player_id, reserve=self.random.randint(0, 500))
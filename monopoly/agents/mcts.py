@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, TimeoutError as FutureTimeout
+import math
+import random
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ..data import JAIL_FINE, PROPERTY_DATA
+from ..engine import AuctionState, GameEngine, GameRuleError, TradeOffer
+from .base import JAIL_CARD, JAIL_PAY, JAIL_ROLL, Policy, TradeProposal
+from .driver import GameDriver
+from .heuristics import GreedyPolicy, InvestorPolicy, plan_builds
+
+DEFAULT_TIME_BUDGET = 0.2
+DEFAULT_HORIZON = 40
+DEFAULT_TREE_DEPTH = 4
+POOL_DISPATCH_MARGIN = 0.02
+BID_FRACTIONS = (0.5, 0.8, 1.0, 1.3)
+SearchStats = List[Tuple[int, float]]
+
+
+def net_worth(engine: GameEngine, player_id: int) -> int:
+    player = engine.state.players[player_id]
+    if player.bankrupt:
+        return 0
+    worth = player.cash
+    for prop_id, prop in engine.state.properties.items():
+        if prop.owner_id != player_id:
+            continue
+        prop_data = PROPERTY_DATA[prop_id]
+        worth += prop_data.price - (prop_data.mortgage if prop.mortgaged else 0)
+        worth += prop.houses * (prop_data.house_cost or 0)
+    return worth
+
+
+def evaluate(engine: GameEngine, player_id: int) -> float:
+    worths = [net_worth(engine, pid) for pid in range(len(engine.state.players))]
+    total = sum(worths)
+    return worths[player_id] / total if total else 0.0
+
+
+def buy_candidates(engine: GameEngine, player_id: int, property_id: int) -> Optional[List[object]]:
+    if engine.state.players[player_id].cash < PROPERTY_DATA[property_id].price:
+        return None
+    return [True, False]
+
+
+def bid_candidates(engine: GameEngine, player_id: int, auction: AuctionState) -> List[object]:
+    cash = engine.state.players[player_id].cash
+    price = PROPERTY_DATA[auction.property_id].price
+    amounts = sorted({int(price * fraction) for fraction in BID_FRACTIONS})
+    candidates: List[object] = [None]
+    candidates.extend(amount for amount in amounts if auction.highest_bid < amount <= cash)
+    return candidates
+
+
+def jail_candidates(engine: GameEngine, player_id: int) -> List[object]:
+    player = engine.state.players[player_id]
+    candidates: List[object] = [JAIL_ROLL]
+    if player.cash >= JAIL_FINE:
+        candidates.append(JAIL_PAY)
+    if player.get_out_of_jail_cards:
+        candidates.append(JAIL_CARD)
+    return candidates
+
+
+def build_candidates(engine: GameEngine, player_id: int) -> List[object]:
+    plan = plan_builds(engine, player_id, reserve=0)
+    if not plan:
+        return [[]]
+    lengths = sorted({0, math.ceil(len(plan) / 3), math.ceil(2 * len(plan) / 3), len(plan)})
+    return [plan[:length] for length in lengths]
+
+
+class _Node:
+    __slots__ = ("visits", "total", "children")
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.total = 0.0
+        self.children: Dict[Tuple[str, Hashable], _Node] = {}
+
+    def select(self, decision: str, candidates: Sequence[object], exploration: float) -> Tuple[int, _Node, bool]:
+        children = [self.children.get((decision, _key(candidate))) for candidate in candidates]
+        for idx, child in enumerate(children):
+            if child is None:
+                child = self.children[decision, _key(candidates[idx])] = _Node()
+                return idx, child, True
+        log_total = math.log(sum(child.visits for child in children))
+        idx = max(
+            range(len(children)),
+            key=lambda i: children[i].total / children[i].visits
+            + exploration * math.sqrt(log_total / children[i].visits),
+        )
+        return idx, children[idx], False
+
+
+def _key(candidate: object) -> Hashable:
+    return tuple(candidate) if isinstance(candidate, list) else candidate
+
+
+class _Scripted(Policy):
+    def __init__(self, inner: Policy, decision: Optional[str], answer: object) -> None:
+        self.inner = inner
+        self.decision = decision
+        self.answer = answer
+
+    def _ask(self, decision: str, *args: Any) -> Any:
+        if decision == self.decision:
+            self.decision = None
+            return self.answer
+        return getattr(self.inner, decision)(*args)
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        return self._ask("should_buy", engine, player_id, property_id)
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        return self._ask("bid", engine, player_id, auction)
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        return self._ask("jail_action", engine, player_id)
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self._ask("build", engine, player_id)
+
+    def unmortgage(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self._ask("unmortgage", engine, player_id)
+
+    def mortgage(self, engine: GameEngine, player_id: int, amount_needed: int) -> List[int]:
+        return self._ask("mortgage", engine, player_id, amount_needed)
+
+    def propose_trade(self, engine: GameEngine, player_id: int) -> Optional[TradeProposal]:
+        return self._ask("propose_trade", engine, player_id)
+
+    def accept_trade(self, engine: GameEngine, player_id: int, offer: TradeOffer) -> bool:
+        return self._ask("accept_trade", engine, player_id, offer)
+
+
+class _TreeWalk(Policy):
+    # Walks the searching player's later decisions down the tree, one ply per decision, until it reaches
+    # max_depth or expands a new node; the rollout policy answers everything after that.
+    def __init__(self, inner: Policy, root: _Node, max_depth: int, exploration: float) -> None:
+        self.inner = inner
+        self.node = root
+        self.depth = max_depth
+        self.exploration = exploration
+        self.path = [root]
+
+    def _ask(self, decision: str, candidates: Optional[Sequence[object]], *args: Any) -> Any:
+        if candidates is None or self.depth <= 0:
+            return getattr(self.inner, decision)(*args)
+        if len(candidates) == 1:
+            return candidates[0]
+        idx, self.node, expanded = self.node.select(decision, candidates, self.exploration)
+        self.path.append(self.node)
+        self.depth = 0 if expanded else self.depth - 1
+        return candidates[idx]
+
+    def backup(self, value: float) -> None:
+        for node in self.path:
+            node.visits += 1
+            node.total += value
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        return self._ask("should_buy", buy_candidates(engine, player_id, property_id), engine, player_id, property_id)
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        return self._ask("bid", bid_candidates(engine, player_id, auction), engine, player_id, auction)
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        return self._ask("jail_action", jail_candidates(engine, player_id), engine, player_id)
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self._ask("build", build_candidates(engine, player_id), engine, player_id)
+
+    def unmortgage(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self.inner.unmortgage(engine, player_id)
+
+    def mortgage(self, engine: GameEngine, player_id: int, amount_needed: int) -> List[int]:
+        return self.inner.mortgage(engine, player_id, amount_needed)
+
+    def propose_trade(self, engine: GameEngine, player_id: int) -> Optional[TradeProposal]:
+        return self.inner.propose_trade(engine, player_id)
+
+    def accept_trade(self, engine: GameEngine, player_id: int, offer: TradeOffer) -> bool:
+        return self._ask("accept_trade", [True, False], engine, player_id, offer)
+
+
+def rollout(
+    engine: GameEngine,
+    player_id: int,
+    decision: str,
+    answer: object,
+    rng: random.Random,
+    horizon: int,
+    offer_id: Optional[int] = None,
+    rollout_policy: Callable[[], Policy] = GreedyPolicy,
+    node: Optional[_Node] = None,
+    max_depth: int = 0,
+    exploration: float = 0.5,
+) -> float:
+    sim = engine.clone(seed=rng.getrandbits(64))
+    policies = [rollout_policy() for _ in sim.state.players]
+    walk = _TreeWalk(policies[player_id], node or _Node(), max_depth, exploration)
+    policies[player_id] = walk
+    if decision == "accept_trade":
+        if answer:
+            try:
+                sim.accept_trade_offer(offer_id, player_id)
+            except GameRuleError:
+                pass
+    else:
+        policies[player_id] = _Scripted(walk, decision, answer)
+    GameDriver(sim, policies).play_game(horizon)
+    value = evaluate(sim, player_id)
+    walk.backup(value)
+    return value
+
+
+def search(
+    engine: GameEngine,
+    player_id: int,
+    decision: str,
+    candidates: Sequence[object],
+    time_budget: float,
+    max_rollouts: Optional[int] = None,
+    horizon: int = DEFAULT_HORIZON,
+    seed: Optional[int] = None,
+    exploration: float = 0.5,
+    offer_id: Optional[int] = None,
+    rollout_policy: Callable[[], Policy] = GreedyPolicy,
+    max_depth: int = DEFAULT_TREE_DEPTH,
+) -> SearchStats:
+    # Open-loop UCT: each root candidate owns a subtree keyed by the searching player's later
+    # (decision, answer) pairs, grown by one node per rollout and scored by the rollout's evaluation.
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + time_budget
+    roots = [_Node() for _ in candidates]
+    rollouts = 0
+    while (max_rollouts is None or rollouts < max_rollouts) and time.perf_counter() < deadline:
+        if rollouts < len(candidates):
+            choice = rollouts
+        else:
+            log_total = math.log(rollouts)
+            choice = max(
+                range(len(candidates)),
+                key=lambda idx: roots[idx].total / roots[idx].visits
+                + exploration * math.sqrt(log_total / roots[idx].visits),
+            )
+        rollout(
+            engine,
+            player_id,
+            decision,
+            candidates[choice],
+            rng,
+            horizon,
+            offer_id,
+            rollout_policy,
+            roots[choice],
+            max_depth,
+            exploration,
+        )
+        rollouts += 1
+    return [(root.visits, root.total) for root in roots]
+
+
+def _ready() -> None:
+    pass
+
+
+class MCTSPolicy(Policy):
+    name = "mcts"
+
+    def __init__(
+        self,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        workers: int = 0,
+        max_rollouts: Optional[int] = None,
+        horizon: int = DEFAULT_HORIZON,
+        seed: Optional[int] = None,
+        fallback: Optional[Policy] = None,
+        rollout_policy: Callable[[], Policy] = GreedyPolicy,
+        executor_factory: Callable[[int], Executor] = ProcessPoolExecutor,
+        max_depth: int = DEFAULT_TREE_DEPTH,
+    ) -> None:
+        self.time_budget = time_budget
+        self.workers = workers
+        self.max_rollouts = max_rollouts
+        self.horizon = horizon
+        self.random = random.Random(seed)
+        self.fallback = fallback or InvestorPolicy()
+        self.rollout_policy = rollout_policy
+        self.max_depth = max_depth
+        self._executor_factory = executor_factory
+        self._executor: Optional[Executor] = None
+        if workers > 1:
+            self._pool()
+
+    def _pool(self) -> Executor:
+        # Workers are started and answer once up front so no decision's budget is spent spawning them.
+        if self._executor is None:
+            self._executor = self._executor_factory(self.workers)
+            for future in [self._executor.submit(_ready) for _ in range(self.workers)]:
+                future.result()
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> MCTSPolicy:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def choose(
+        self,
+        engine: GameEngine,
+        player_id: int,
+        decision: str,
+        candidates: Sequence[object],
+        offer_id: Optional[int] = None,
+    ) -> object:
+        if len(candidates) == 1:
+            return candidates[0]
+        deadline = time.perf_counter() + self.time_budget
+        root = engine.clone()
+        if self.workers <= 1:
+            stats = search(
+                root,
+                player_id,
+                decision,
+                candidates,
+                self.time_budget,
+                self.max_rollouts,
+                self.horizon,
+                self.random.getrandbits(64),
+                offer_id=offer_id,
+                rollout_policy=self.rollout_policy,
+                max_depth=self.max_depth,
+            )
+        else:
+            executor = self._pool()
+            share = None if self.max_rollouts is None else -(-self.max_rollouts // self.workers)
+            budget = max(self.time_budget - POOL_DISPATCH_MARGIN, 0.0)
+            futures = [
+                executor.submit(
+                    search,
+                    root,
+                    player_id,
+                    decision,
+                    candidates,
+                    budget,
+                    share,
+                    self.horizon,
+                    self.random.getrandbits(64),
+                    offer_id=offer_id,
+                    rollout_policy=self.rollout_policy,
+                    max_depth=self.max_depth,
+                )
+                for _ in range(self.workers)
+            ]
+            stats = [(0, 0.0)] * len(candidates)
+            for future in futures:
+                try:
+                    found = future.result(timeout=max(deadline - time.perf_counter(), 0.0))
+                except FutureTimeout:
+                    future.cancel()
+                    continue
+                stats = [(v1 + v2, t1 + t2) for (v1, t1), (v2, t2) in zip(stats, found)]
+        best = max(range(len(candidates)), key=lambda idx: (stats[idx][0], stats[idx][1]))
+        return candidates[best]
+
+    def should_buy(self, engine: GameEngine, player_id: int, property_id: int) -> bool:
+        candidates = buy_candidates(engine, player_id, property_id)
+        if candidates is None:
+            return self.fallback.should_buy(engine, player_id, property_id)
+        return bool(self.choose(engine, player_id, "should_buy", candidates))
+
+    def bid(self, engine: GameEngine, player_id: int, auction: AuctionState) -> Optional[int]:
+        return self.choose(engine, player_id, "bid", bid_candidates(engine, player_id, auction))
+
+    def jail_action(self, engine: GameEngine, player_id: int) -> str:
+        return self.choose(engine, player_id, "jail_action", jail_candidates(engine, player_id))
+
+    def build(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self.choose(engine, player_id, "build", build_candidates(engine, player_id))
+
+    def unmortgage(self, engine: GameEngine, player_id: int) -> List[int]:
+        return self.fallback.unmortgage(engine, player_id)
+
+    def mortgage(self, engine: GameEngine, player_id: int, amount_needed: int) -> List[int]:
+        return self.fallback.mortgage(engine, player_id, amount_needed)
+
+    def propose_trade(self, engine: GameEngine, player_id: int) -> Optional[TradeProposal]:
+        return self.fallback.propose_trade(engine, player_id)
+
+    def accept_trade(self, engine: GameEngine, player_id: int, offer: TradeOffer) -> bool:
+        return bool(self.choose(engine, player_id, "accept_trade", [True, False], offer_id=offer.offer_id))
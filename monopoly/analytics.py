@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+import json
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from . import cards
+from .data import BOARD, PROPERTY_DATA, RAILROADS, UTILITIES, SpaceType
+from .tables import BOARD_SIZE, HOUSE_COST, KIND_RAILROAD, KIND_UTILITY, RENT_TABLE, SPACE_KIND
+
+JAIL_POSITION = 10
+JAIL_ATTEMPTS = 3
+DOUBLES_STATES = 3
+JAIL = -1
+NUM_STATES = BOARD_SIZE * DOUBLES_STATES + JAIL_ATTEMPTS
+DICE = [(die1, die2) for die1 in range(1, 7) for die2 in range(1, 7)]
+
+Outcome = Tuple[float, int]
+
+
+@dataclass(frozen=True)
+class LevelValue:
+    level: str
+    rent: float
+    investment: int
+    expected_rent_per_roll: float
+    roi_per_roll: float
+
+
+@dataclass(frozen=True)
+class PropertyValue:
+    property_id: int
+    name: str
+    landing_probability: float
+    levels: List[LevelValue]
+
+
+def _board_state(position: int, doubles: int) -> int:
+    return position * DOUBLES_STATES + doubles
+
+
+def _jail_state(attempts: int) -> int:
+    return BOARD_SIZE * DOUBLES_STATES + attempts
+
+
+def _nearest(position: int, targets: List[int]) -> int:
+    return min(((target - position) % BOARD_SIZE, target) for target in targets)[1]
+
+
+def _card_outcomes(card: cards.Card, position: int) -> List[Outcome]:
+    if card.action == "move":
+        return [(1.0, card.destination or 0)]
+    if card.action == "move_nearest_railroad":
+        return [(1.0, _nearest(position, RAILROADS))]
+    if card.action == "move_nearest_utility":
+        return [(1.0, _nearest(position, UTILITIES))]
+    if card.action == "move_back":
+        return _landing_outcomes((position - (card.amount or 0)) % BOARD_SIZE)
+    if card.action == "go_to_jail":
+        return [(1.0, JAIL)]
+    return [(1.0, position)]
+
+
+def _deck_outcomes(deck: List[cards.Card], position: int) -> List[Outcome]:
+    outcomes: List[Outcome] = []
+    for card in deck:
+        outcomes.extend((probability / len(deck), final) for probability, final in _card_outcomes(card, position))
+    return outcomes
+
+
+def _landing_outcomes(position: int) -> List[Outcome]:
+    space_type = BOARD[position].type
+    if space_type == SpaceType.GO_TO_JAIL:
+        return [(1.0, JAIL)]
+    if space_type == SpaceType.CHANCE:
+        return _deck_outcomes(cards.standard_chance_cards(), position)
+    if space_type == SpaceType.COMMUNITY_CHEST:
+        return _deck_outcomes(cards.standard_community_chest_cards(), position)
+    return [(1.0, position)]
+
+
+@lru_cache(maxsize=None)
+def _landing_table() -> Tuple[Tuple[Outcome, ...], ...]:
+    return tuple(tuple(_landing_outcomes(position)) for position in range(BOARD_SIZE))
+
+
+@lru_cache(maxsize=None)
+def transition_matrices() -> Tuple[np.ndarray, np.ndarray]:
+    landing = _landing_table()
+    transitions = np.zeros((NUM_STATES, NUM_STATES))
+    dice_mass = np.zeros((NUM_STATES, BOARD_SIZE))
+
+    def land(source: int, start: int, die1: int, die2: int, doubles_next: int) -> None:
+        roll_probability = 1.0 / len(DICE)
+        for probability, final in landing[(start + die1 + die2) % BOARD_SIZE]:
+            weight = roll_probability * probability
+            if final == JAIL:
+                transitions[source, _jail_state(0)] += weight
+            else:
+                transitions[source, _board_state(final, doubles_next)] += weight
+                dice_mass[source, final] += weight * (die1 + die2)
+
+    for position in range(BOARD_SIZE):
+        for doubles in range(DOUBLES_STATES):
+            source = _board_state(position, doubles)
+            for die1, die2 in DICE:
+                if die1 != die2:
+                    land(source, position, die1, die2, 0)
+                elif doubles + 1 == DOUBLES_STATES:
+                    transitions[source, _jail_state(0)] += 1.0 / len(DICE)
+                else:
+                    land(source, position, die1, die2, doubles + 1)
+    for attempts in range(JAIL_ATTEMPTS):
+        source = _jail_state(attempts)
+        for die1, die2 in DICE:
+            if die1 == die2 or attempts + 1 == JAIL_ATTEMPTS:
+                land(source, JAIL_POSITION, die1, die2, 0)
+            else:
+                transitions[source, _jail_state(attempts + 1)] += 1.0 / len(DICE)
+    transitions.setflags(write=False)
+    dice_mass.setflags(write=False)
+    return transitions, dice_mass
+
+
+@lru_cache(maxsize=None)
+def stationary_distribution() -> np.ndarray:
+    transitions, _ = transition_matrices()
+    system = transitions.T - np.eye(NUM_STATES)
+    system[-1, :] = 1.0
+    rhs = np.zeros(NUM_STATES)
+    rhs[-1] = 1.0
+    distribution = np.linalg.solve(system, rhs)
+    distribution.setflags(write=False)
+    return distribution
+
+
+@lru_cache(maxsize=None)
+def landing_probabilities() -> np.ndarray:
+    distribution = stationary_distribution()
+    per_square = distribution[: BOARD_SIZE * DOUBLES_STATES].reshape(BOARD_SIZE, DOUBLES_STATES).sum(axis=1)
+    per_square.setflags(write=False)
+    return per_square
+
+
+def jail_probability() -> float:
+    return float(stationary_distribution()[BOARD_SIZE * DOUBLES_STATES :].sum())
+
+
+@lru_cache(maxsize=None)
+def expected_dice_on_landing() -> np.ndarray:
+    _, dice_mass = transition_matrices()
+    landed = landing_probabilities()
+    weighted = stationary_distribution() @ dice_mass
+    expected = np.divide(weighted, landed, out=np.zeros(BOARD_SIZE), where=landed > 0)
+    expected.setflags(write=False)
+    return expected
+
+
+def _levels(prop_id: int) -> List[Tuple[str, float, int]]:
+    price = PROPERTY_DATA[prop_id].price
+    row = RENT_TABLE[prop_id]
+    kind = SPACE_KIND[prop_id]
+    if kind == KIND_RAILROAD:
+        return [(f"{count}_railroads", row[count], price) for count in range(1, len(row))]
+    if kind == KIND_UTILITY:
+        dice = float(expected_dice_on_landing()[prop_id])
+        return [(f"{count}_utilities", row[count] * dice, price) for count in range(1, len(row))]
+    labels = ["base", "monopoly", "1_house", "2_houses", "3_houses", "4_houses", "hotel"]
+    return [
+        (label, row[level], price + max(level - 1, 0) * HOUSE_COST[prop_id])
+        for level, label in enumerate(labels)
+    ]
+
+
+@lru_cache(maxsize=None)
+def property_values() -> Tuple[PropertyValue, ...]:
+    landed = landing_probabilities()
+    values = []
+    for prop_id, prop_data in PROPERTY_DATA.items():
+        probability = float(landed[prop_id])
+        levels = [
+            LevelValue(
+                level=label,
+                rent=float(rent),
+                investment=investment,
+                expected_rent_per_roll=probability * rent,
+                roi_per_roll=probability * rent / investment,
+            )
+            for label, rent, investment in _levels(prop_id)
+        ]
+        values.append(PropertyValue(prop_id, prop_data.name, probability, levels))
+    return tuple(values)
+
+
+@lru_cache(maxsize=None)
+def summary() -> Dict[str, object]:
+    return {
+        "landing_probabilities": [float(value) for value in landing_probabilities()],
+        "jail_probability": jail_probability(),
+        "properties": [asdict(value) for value in property_values()],
+    }
+
+
+@lru_cache(maxsize=None)
+def summary_json() -> bytes:
+    return json.dumps(summary(), separators=(",", ":")).encode()
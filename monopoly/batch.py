@@ -0,0 +1,505 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from . import cards
+from .data import (
+    GO_SALARY,
+    HOUSE_SELL_VALUE,
+    JAIL_FINE,
+    MAX_HOTELS,
+    MAX_HOUSES,
+    MORTGAGE_INTEREST_RATE,
+    RAILROADS,
+    START_CASH,
+    UTILITIES,
+)
+from .engine import GameRuleError
+from .tables import (
+    BOARD_SIZE,
+    GROUP_MEMBERS,
+    GROUP_OF,
+    HOUSE_COST,
+    KIND_CHANCE,
+    KIND_COMMUNITY,
+    KIND_GO_TO_JAIL,
+    KIND_RAILROAD,
+    KIND_STREET,
+    KIND_TAX,
+    KIND_UTILITY,
+    MORTGAGE,
+    PRICE,
+    RENT_TABLE,
+    SPACE_KIND,
+    TAX,
+)
+
+NO_OWNER = -1
+NO_PROPERTY = -1
+JAIL_POSITION = 10
+JAIL_ATTEMPTS = 3
+JAIL_PAY_THRESHOLD = JAIL_FINE * 4
+AUCTION_FRACTION = 0.8
+CARD_RAILROAD_MULTIPLIER = 2
+CARD_UTILITY_MULTIPLIER = 10
+
+CHANCE = 0
+COMMUNITY = 1
+DECK_CARDS = (cards.standard_chance_cards(), cards.standard_community_chest_cards())
+DECK_SIZE = len(DECK_CARDS[CHANCE])
+
+CARD_ACTIONS = (
+    "collect",
+    "pay",
+    "move",
+    "move_nearest_railroad",
+    "move_nearest_utility",
+    "move_back",
+    "go_to_jail",
+    "get_out_of_jail",
+    "pay_each",
+    "collect_each",
+    "repair",
+)
+(
+    CARD_COLLECT,
+    CARD_PAY,
+    CARD_MOVE,
+    CARD_NEAREST_RAILROAD,
+    CARD_NEAREST_UTILITY,
+    CARD_MOVE_BACK,
+    CARD_GO_TO_JAIL,
+    CARD_JAIL_FREE,
+    CARD_PAY_EACH,
+    CARD_COLLECT_EACH,
+    CARD_REPAIR,
+) = range(len(CARD_ACTIONS))
+
+_KIND = np.array(SPACE_KIND, dtype=np.int8)
+_TAX = np.array(TAX, dtype=np.int32)
+_PRICE = np.array(PRICE, dtype=np.int32)
+_GROUP_OF = np.array(GROUP_OF, dtype=np.int8)
+_GROUP_MEMBERS = np.array([members + members[:1] * (3 - len(members)) for members in GROUP_MEMBERS], dtype=np.intp)
+_RENT = np.zeros((BOARD_SIZE, max(len(row) for row in RENT_TABLE)), dtype=np.int32)
+for _pos, _row in enumerate(RENT_TABLE):
+    _RENT[_pos, : len(_row)] = _row
+_RAILROADS = np.array(RAILROADS, dtype=np.intp)
+_UTILITIES = np.array(UTILITIES, dtype=np.intp)
+_NEAREST_RAILROAD = np.array(
+    [min(((target - pos) % BOARD_SIZE, target) for target in RAILROADS)[1] for pos in range(BOARD_SIZE)], dtype=np.int16
+)
+_NEAREST_UTILITY = np.array(
+    [min(((target - pos) % BOARD_SIZE, target) for target in UTILITIES)[1] for pos in range(BOARD_SIZE)], dtype=np.int16
+)
+_CARD_ACTION = np.array([[CARD_ACTIONS.index(card.action) for card in deck] for deck in DECK_CARDS], dtype=np.int8)
+_CARD_AMOUNT = np.array([[card.amount or 0 for card in deck] for deck in DECK_CARDS], dtype=np.int32)
+_CARD_PER_HOUSE = np.array([[card.per_house or 0 for card in deck] for deck in DECK_CARDS], dtype=np.int32)
+_CARD_PER_HOTEL = np.array([[card.per_hotel or 0 for card in deck] for deck in DECK_CARDS], dtype=np.int32)
+_CARD_DESTINATION = np.array([[card.destination or 0 for card in deck] for deck in DECK_CARDS], dtype=np.int16)
+_JAIL_CARD = np.array([int(np.flatnonzero(row == CARD_JAIL_FREE)[0]) for row in _CARD_ACTION], dtype=np.int8)
+_HOUSE_REFUND = np.array([int(cost * HOUSE_SELL_VALUE) for cost in HOUSE_COST], dtype=np.int32)
+_HOTEL_REFUND = np.array([int(cost * 5 * HOUSE_SELL_VALUE) for cost in HOUSE_COST], dtype=np.int32)
+_TRANSFER_FEE = np.array([int(value * MORTGAGE_INTEREST_RATE) for value in MORTGAGE], dtype=np.int32)
+
+Landing = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class BatchGameEngine:
+    def __init__(
+        self,
+        num_games: int,
+        num_players: int = 4,
+        seed: Optional[int] = None,
+        auction_fraction: float = AUCTION_FRACTION,
+    ) -> None:
+        if not (2 <= num_players <= 4):
+            raise GameRuleError("Game supports 2-4 players.")
+        if num_games < 1:
+            raise ValueError("Need at least one game.")
+        self.num_games = num_games
+        self.num_players = num_players
+        self.auction_fraction = auction_fraction
+        self.rng = np.random.default_rng(seed)
+        shape = (num_games, num_players)
+        self.cash = np.zeros(shape, dtype=np.int32)
+        self.position = np.zeros(shape, dtype=np.int16)
+        self.in_jail = np.zeros(shape, dtype=bool)
+        self.jail_turns = np.zeros(shape, dtype=np.int8)
+        self.bankrupt = np.zeros(shape, dtype=bool)
+        self.jail_cards = np.zeros(shape + (2,), dtype=bool)
+        self.owner = np.zeros((num_games, BOARD_SIZE), dtype=np.int8)
+        self.houses = np.zeros((num_games, BOARD_SIZE), dtype=np.int8)
+        self.mortgaged = np.zeros((num_games, BOARD_SIZE), dtype=bool)
+        self.houses_available = np.zeros(num_games, dtype=np.int16)
+        self.hotels_available = np.zeros(num_games, dtype=np.int16)
+        self.deck_order = np.zeros((num_games, 2, DECK_SIZE), dtype=np.int8)
+        self.deck_head = np.zeros((num_games, 2), dtype=np.int8)
+        self.current = np.zeros(num_games, dtype=np.int8)
+        self.last_roll = np.zeros(num_games, dtype=np.int8)
+        self.pending_property = np.zeros(num_games, dtype=np.int8)
+        self.pending_player = np.zeros(num_games, dtype=np.int8)
+        self.turns = np.zeros(num_games, dtype=np.int64)
+        self.done = np.zeros(num_games, dtype=bool)
+        self.reset()
+
+    def reset(self, games: Optional[np.ndarray] = None) -> None:
+        rows = np.arange(self.num_games) if games is None else np.flatnonzero(games)
+        self.cash[rows] = START_CASH
+        self.position[rows] = 0
+        self.in_jail[rows] = False
+        self.jail_turns[rows] = 0
+        self.bankrupt[rows] = False
+        self.jail_cards[rows] = False
+        self.owner[rows] = NO_OWNER
+        self.houses[rows] = 0
+        self.mortgaged[rows] = False
+        self.houses_available[rows] = MAX_HOUSES
+        self.hotels_available[rows] = MAX_HOTELS
+        order = np.broadcast_to(np.arange(DECK_SIZE, dtype=np.int8), (len(rows), 2, DECK_SIZE))
+        self.deck_order[rows] = self.rng.permuted(order, axis=2)
+        self.deck_head[rows] = 0
+        self.current[rows] = 0
+        self.last_roll[rows] = 0
+        self.pending_property[rows] = NO_PROPERTY
+        self.pending_player[rows] = 0
+        self.turns[rows] = 0
+        self.done[rows] = False
+
+    def winners(self) -> np.ndarray:
+        alive = ~self.bankrupt
+        return np.where(self.done & alive.any(axis=1), alive.argmax(axis=1), NO_OWNER)
+
+    def step(self, buy: Optional[np.ndarray] = None, pay_jail: Optional[np.ndarray] = None) -> None:
+        self._settle_purchases(buy)
+        games = np.flatnonzero(~self.done)
+        if not len(games):
+            return
+        players = self.current[games].astype(np.intp)
+        dice = self._roll(len(games))
+        total = dice.sum(axis=1)
+        doubles = dice[:, 0] == dice[:, 1]
+        self.last_roll[games] = total
+        jailed = self.in_jail[games, players]
+        moving = ~jailed
+        again = doubles & moving
+        if jailed.any():
+            self._jail_turn(games, players, np.flatnonzero(jailed), doubles, moving, again, pay_jail)
+        if moving.any():
+            mover_games, mover_players, steps = games[moving], players[moving], total[moving]
+            target = self.position[mover_games, mover_players] + steps
+            passed = target >= BOARD_SIZE
+            self.cash[mover_games[passed], mover_players[passed]] += GO_SALARY
+            self.position[mover_games, mover_players] = target % BOARD_SIZE
+            self._land(mover_games, mover_players, steps)
+        self.turns[games] += 1
+        again &= ~self.in_jail[games, players] & ~self.bankrupt[games, players]
+        self._advance(games[~again])
+        self.done[games] = (~self.bankrupt[games]).sum(axis=1) <= 1
+
+    def build_house(self, game: int, player_id: int, property_id: int) -> None:
+        if self.owner[game, property_id] != player_id:
+            raise GameRuleError("Player does not own the property.")
+        group = GROUP_OF[property_id]
+        if group < 0:
+            raise GameRuleError("Can only build on color properties.")
+        members = GROUP_MEMBERS[group]
+        if any(self.owner[game, prop] != player_id for prop in members):
+            raise GameRuleError("Must own full color group to build.")
+        if self.mortgaged[game, members].any():
+            raise GameRuleError("Cannot build with mortgaged property in group.")
+        current = int(self.houses[game, property_id])
+        if current >= 5:
+            raise GameRuleError("Property already has a hotel.")
+        if current > self.houses[game, members].min():
+            raise GameRuleError("Must build evenly across the group.")
+        if current == 4:
+            if self.hotels_available[game] < 1:
+                raise GameRuleError("No hotels available.")
+        elif self.houses_available[game] < 1:
+            raise GameRuleError("No houses available.")
+        if self.cash[game, player_id] < HOUSE_COST[property_id]:
+            raise GameRuleError("Insufficient funds to build.")
+        self.cash[game, player_id] -= HOUSE_COST[property_id]
+        if current == 4:
+            self.hotels_available[game] -= 1
+            self.houses_available[game] = min(MAX_HOUSES, self.houses_available[game] + 4)
+        else:
+            self.houses_available[game] -= 1
+        self.houses[game, property_id] = current + 1
+
+    def _roll(self, count: int) -> np.ndarray:
+        return self.rng.integers(1, 7, size=(count, 2), dtype=np.int16)
+
+    def _settle_purchases(self, buy: Optional[np.ndarray]) -> None:
+        games = np.flatnonzero(self.pending_property >= 0)
+        if not len(games):
+            return
+        props = self.pending_property[games].astype(np.intp)
+        players = self.pending_player[games].astype(np.intp)
+        price = _PRICE[props]
+        wanted = self.cash[games, players] >= price
+        if buy is not None:
+            wanted &= buy[games]
+        self.cash[games[wanted], players[wanted]] -= price[wanted]
+        self.owner[games[wanted], props[wanted]] = players[wanted]
+        self.pending_property[games] = NO_PROPERTY
+        for game, prop in zip(games[~wanted].tolist(), props[~wanted].tolist()):
+            self._auction(game, prop)
+
+    def _auction(self, game: int, property_id: int) -> None:
+        ceiling = int(PRICE[property_id] * self.auction_fraction)
+        bids = [
+            (min(int(self.cash[game, pid]), ceiling), -pid)
+            for pid in range(self.num_players)
+            if not self.bankrupt[game, pid]
+        ]
+        bids.sort(reverse=True)
+        best, winner = bids[0]
+        if best <= 0:
+            return
+        runner_up = bids[1][0] if len(bids) > 1 else 0
+        self.cash[game, -winner] -= min(best, runner_up + 1)
+        self.owner[game, property_id] = -winner
+
+    def _jail_turn(
+        self,
+        games: np.ndarray,
+        players: np.ndarray,
+        rows: np.ndarray,
+        doubles: np.ndarray,
+        moving: np.ndarray,
+        again: np.ndarray,
+        pay_jail: Optional[np.ndarray],
+    ) -> None:
+        jail_games, jail_players = games[rows], players[rows]
+        held = self.jail_cards[jail_games, jail_players]
+        has_card = held.any(axis=1)
+        cash = self.cash[jail_games, jail_players]
+        if pay_jail is None:
+            pays = cash >= JAIL_PAY_THRESHOLD
+        else:
+            pays = pay_jail[jail_games] & (cash >= JAIL_FINE)
+        pays &= ~has_card
+        deck = np.where(held[:, CHANCE], CHANCE, COMMUNITY)
+        self.jail_cards[jail_games[has_card], jail_players[has_card], deck[has_card]] = False
+        self.cash[jail_games[pays], jail_players[pays]] -= JAIL_FINE
+        early = has_card | pays
+        rolled_out = ~early & doubles[rows]
+        attempts = self.jail_turns[jail_games, jail_players] + 1
+        forced = ~early & ~rolled_out & (attempts >= JAIL_ATTEMPTS)
+        stuck = ~early & ~rolled_out & ~forced
+        self.jail_turns[jail_games[stuck], jail_players[stuck]] = attempts[stuck]
+        if forced.any():
+            paid = self._charge(jail_games[forced], jail_players[forced], np.full(int(forced.sum()), JAIL_FINE))
+            forced[np.flatnonzero(forced)[~paid]] = False
+        freed = early | rolled_out | forced
+        self.in_jail[jail_games[freed], jail_players[freed]] = False
+        self.jail_turns[jail_games[freed], jail_players[freed]] = 0
+        moving[rows[freed]] = True
+        again[rows[early]] = doubles[rows[early]]
+
+    def _land(self, games: np.ndarray, players: np.ndarray, steps: np.ndarray) -> None:
+        railroad_multiplier = np.ones(len(games), dtype=np.int32)
+        utility_card = np.zeros(len(games), dtype=bool)
+        while len(games):
+            pos = self.position[games, players].astype(np.intp)
+            kind = _KIND[pos]
+            owned = (kind >= KIND_STREET) & (kind <= KIND_UTILITY)
+            if owned.any():
+                self._land_property(
+                    games[owned], players[owned], pos[owned], steps[owned], railroad_multiplier[owned], utility_card[owned]
+                )
+            taxed = kind == KIND_TAX
+            if taxed.any():
+                self._charge(games[taxed], players[taxed], _TAX[pos[taxed]])
+            jailed = kind == KIND_GO_TO_JAIL
+            if jailed.any():
+                self._send_to_jail(games[jailed], players[jailed])
+            drawn = (kind == KIND_CHANCE) | (kind == KIND_COMMUNITY)
+            if not drawn.any():
+                return
+            deck = np.where(kind[drawn] == KIND_CHANCE, CHANCE, COMMUNITY)
+            games, players, steps, railroad_multiplier, utility_card = self._draw_card(
+                games[drawn], players[drawn], pos[drawn], deck, steps[drawn]
+            )
+
+    def _land_property(
+        self,
+        games: np.ndarray,
+        players: np.ndarray,
+        pos: np.ndarray,
+        steps: np.ndarray,
+        railroad_multiplier: np.ndarray,
+        utility_card: np.ndarray,
+    ) -> None:
+        owner = self.owner[games, pos].astype(np.intp)
+        unowned = owner == NO_OWNER
+        self.pending_property[games[unowned]] = pos[unowned]
+        self.pending_player[games[unowned]] = players[unowned]
+        charged = ~unowned & (owner != players) & ~self.mortgaged[games, pos]
+        if not charged.any():
+            return
+        games, players, pos, owner = games[charged], players[charged], pos[charged], owner[charged]
+        rent = self._rent(games, pos, owner, steps[charged], railroad_multiplier[charged], utility_card[charged])
+        self._charge(games, players, rent, owner)
+
+    def _rent(
+        self,
+        games: np.ndarray,
+        pos: np.ndarray,
+        owner: np.ndarray,
+        steps: np.ndarray,
+        railroad_multiplier: np.ndarray,
+        utility_card: np.ndarray,
+    ) -> np.ndarray:
+        kind = _KIND[pos]
+        level = np.zeros(len(games), dtype=np.intp)
+        street = kind == KIND_STREET
+        if street.any():
+            street_games, street_pos = games[street], pos[street]
+            members = _GROUP_MEMBERS[_GROUP_OF[street_pos]]
+            monopoly = (self.owner[street_games[:, None], members] == owner[street, None]).all(axis=1)
+            houses = self.houses[street_games, street_pos]
+            level[street] = np.where(houses > 0, houses + 1, monopoly)
+        for kind_id, spaces in ((KIND_RAILROAD, _RAILROADS), (KIND_UTILITY, _UTILITIES)):
+            rows = kind == kind_id
+            if rows.any():
+                kind_games = games[rows]
+                active = (self.owner[kind_games[:, None], spaces] == owner[rows, None]) & ~self.mortgaged[kind_games[:, None], spaces]
+                level[rows] = active.sum(axis=1)
+        rent = _RENT[pos, level]
+        rent = np.where(kind == KIND_RAILROAD, rent * railroad_multiplier, rent)
+        utility_rate = np.where(utility_card, CARD_UTILITY_MULTIPLIER, rent)
+        return np.where(kind == KIND_UTILITY, steps * utility_rate, rent)
+
+    def _draw_card(
+        self, games: np.ndarray, players: np.ndarray, pos: np.ndarray, deck: np.ndarray, steps: np.ndarray
+    ) -> Landing:
+        head = self.deck_head[games, deck].astype(np.intp)
+        card = self.deck_order[games, deck, head].astype(np.intp)
+        held = self.jail_cards[games, :, deck].any(axis=1)
+        skip = held & (card == _JAIL_CARD[deck])
+        if skip.any():
+            head[skip] = (head[skip] + 1) % DECK_SIZE
+            card[skip] = self.deck_order[games[skip], deck[skip], head[skip]]
+        self.deck_head[games, deck] = (head + 1) % DECK_SIZE
+        action = _CARD_ACTION[deck, card]
+        amount = _CARD_AMOUNT[deck, card]
+
+        rows = action == CARD_COLLECT
+        self.cash[games[rows], players[rows]] += amount[rows]
+        rows = action == CARD_PAY
+        if rows.any():
+            self._charge(games[rows], players[rows], amount[rows])
+        rows = action == CARD_GO_TO_JAIL
+        if rows.any():
+            self._send_to_jail(games[rows], players[rows])
+        rows = action == CARD_JAIL_FREE
+        self.jail_cards[games[rows], players[rows], deck[rows]] = True
+        rows = action == CARD_PAY_EACH
+        if rows.any():
+            self._pay_each(games[rows], players[rows], amount[rows])
+        rows = action == CARD_COLLECT_EACH
+        if rows.any():
+            self._collect_each(games[rows], players[rows], amount[rows])
+        rows = action == CARD_REPAIR
+        if rows.any():
+            self._repair(games[rows], players[rows], deck[rows], card[rows])
+
+        destination = np.where(action == CARD_MOVE, _CARD_DESTINATION[deck, card], pos)
+        destination = np.where(action == CARD_NEAREST_RAILROAD, _NEAREST_RAILROAD[pos], destination)
+        destination = np.where(action == CARD_NEAREST_UTILITY, _NEAREST_UTILITY[pos], destination)
+        moved = (action == CARD_MOVE) | (action == CARD_NEAREST_RAILROAD) | (action == CARD_NEAREST_UTILITY)
+        passed = moved & (destination < pos)
+        self.cash[games[passed], players[passed]] += GO_SALARY
+        back = action == CARD_MOVE_BACK
+        destination = np.where(back, (pos - amount) % BOARD_SIZE, destination)
+        moved |= back
+        self.position[games[moved], players[moved]] = destination[moved]
+        railroad_multiplier = np.where(action == CARD_NEAREST_RAILROAD, CARD_RAILROAD_MULTIPLIER, 1)
+        utility_card = action == CARD_NEAREST_UTILITY
+        return games[moved], players[moved], steps[moved], railroad_multiplier[moved], utility_card[moved]
+
+    def _others(self, games: np.ndarray, players: np.ndarray) -> np.ndarray:
+        others = ~self.bankrupt[games]
+        others[np.arange(len(games)), players] = False
+        return others
+
+    def _pay_each(self, games: np.ndarray, players: np.ndarray, amount: np.ndarray) -> None:
+        others = self._others(games, players)
+        paid = self._charge(games, players, amount * others.sum(axis=1))
+        self.cash[games[paid]] += amount[paid, None] * others[paid]
+
+    def _collect_each(self, games: np.ndarray, players: np.ndarray, amount: np.ndarray) -> None:
+        others = self._others(games, players)
+        payers = others & (self.cash[games] >= amount[:, None])
+        self.cash[games] -= amount[:, None] * payers
+        self.cash[games, players] += amount * payers.sum(axis=1)
+        for row, player_id in zip(*np.nonzero(others & ~payers)):
+            self._bankrupt(int(games[row]), int(player_id))
+
+    def _repair(self, games: np.ndarray, players: np.ndarray, deck: np.ndarray, card: np.ndarray) -> None:
+        houses = np.where(self.owner[games] == players[:, None], self.houses[games], 0)
+        hotels = (houses == 5).sum(axis=1)
+        count = houses.sum(axis=1) - 5 * hotels
+        self._charge(games, players, _CARD_PER_HOUSE[deck, card] * count + _CARD_PER_HOTEL[deck, card] * hotels)
+
+    def _charge(
+        self, games: np.ndarray, players: np.ndarray, amount: np.ndarray, creditor: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        paid = self.cash[games, players] >= amount
+        self.cash[games[paid], players[paid]] -= amount[paid]
+        if creditor is not None:
+            self.cash[games[paid], creditor[paid]] += amount[paid]
+        if not paid.all():
+            failed = np.flatnonzero(~paid)
+            creditors = creditor[failed].tolist() if creditor is not None else [NO_OWNER] * len(failed)
+            for game, player_id, owed_to in zip(games[failed].tolist(), players[failed].tolist(), creditors):
+                self._bankrupt(game, player_id, owed_to)
+        return paid
+
+    def _send_to_jail(self, games: np.ndarray, players: np.ndarray) -> None:
+        self.position[games, players] = JAIL_POSITION
+        self.in_jail[games, players] = True
+        self.jail_turns[games, players] = 0
+
+    def _bankrupt(self, game: int, player_id: int, creditor: int = NO_OWNER) -> None:
+        owned = np.flatnonzero(self.owner[game] == player_id)
+        houses = self.houses[game, owned].astype(np.int32)
+        hotels = houses == 5
+        self.cash[game, player_id] += int(_HOTEL_REFUND[owned[hotels]].sum() + (_HOUSE_REFUND[owned] * houses)[~hotels].sum())
+        self.hotels_available[game] = min(MAX_HOTELS, int(self.hotels_available[game]) + int(hotels.sum()))
+        self.houses_available[game] = min(
+            MAX_HOUSES, int(self.houses_available[game]) + int(houses[~hotels].sum()) + 4 * int(hotels.sum())
+        )
+        self.houses[game, owned] = 0
+        if creditor != NO_OWNER:
+            self.cash[game, creditor] += self.cash[game, player_id]
+            self.owner[game, owned] = creditor
+            fee = int(_TRANSFER_FEE[owned[self.mortgaged[game, owned]]].sum())
+            self.cash[game, creditor] -= min(fee, int(self.cash[game, creditor]))
+        else:
+            self.owner[game, owned] = NO_OWNER
+            self.mortgaged[game, owned] = False
+        self.cash[game, player_id] = 0
+        self.bankrupt[game, player_id] = True
+        self.in_jail[game, player_id] = False
+        self.jail_cards[game, player_id] = False
+        if self.pending_property[game] != NO_PROPERTY and self.pending_player[game] == player_id:
+            self.pending_property[game] = NO_PROPERTY
+
+    def _advance(self, games: np.ndarray) -> None:
+        if not len(games):
+            return
+        current = self.current[games].astype(np.intp)
+        bankrupt = self.bankrupt[games]
+        nxt = current.copy()
+        found = np.zeros(len(games), dtype=bool)
+        for offset in range(1, self.num_players + 1):
+            candidate = (current + offset) % self.num_players
+            take = ~found & ~bankrupt[np.arange(len(games)), candidate]
+            nxt[take] = candidate[take]
+            found |= take
+        self.current[games] = nxt
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .engine import NO_CODE, PHASE_CODES, PROPERTY_IDS, TURN_PHASES, GameEngine
+from .events import MAX_ARGS, SPILL_RECORD, Record
+
+MEDIA_TYPE = "application/vnd.monopoly.state"
+STREAM_MEDIA_TYPE = "application/vnd.monopoly.stream"
+STATE_MAGIC = b"MNS1"
+FLAG_FULL = 1
+IN_JAIL = 1
+BANKRUPT = 2
+STATE_HEADER = struct.Struct("<4sBIIBBBBBBBBBH")
+DELTA_PLAYER = struct.Struct("<BiBB")
+DELTA_PROPERTY = struct.Struct("<BBBB")
+FRAME_LENGTH = struct.Struct("<I")
+KEEPALIVE_FRAME = FRAME_LENGTH.pack(0)
+PROPERTY_COUNT = len(PROPERTY_IDS)
+_CASH_ARRAYS = {count: struct.Struct(f"<{count}i") for count in range(1, 5)}
+
+
+def accepts_binary(header: Optional[str], media_type: str = MEDIA_TYPE) -> bool:
+    if not header:
+        return False
+    return any(candidate.split(";")[0].strip() == media_type for candidate in header.split(","))
+
+
+def _header(engine: GameEngine, flags: int, since: int, players: int, properties: int, events: int) -> bytes:
+    state = engine.state
+    turn_state = state.turn_state
+    pending = turn_state.pending_property_id
+    die1, die2 = turn_state.last_roll or (0, 0)
+    return STATE_HEADER.pack(
+        STATE_MAGIC,
+        flags,
+        state.version,
+        since,
+        state.current_player_index,
+        PHASE_CODES[turn_state.phase],
+        NO_CODE if pending is None else pending,
+        die1,
+        die2,
+        state.houses_available,
+        state.hotels_available,
+        players,
+        properties,
+        events,
+    )
+
+
+def _flags(in_jail: bool, bankrupt: bool) -> int:
+    return (IN_JAIL if in_jail else 0) | (BANKRUPT if bankrupt else 0)
+
+
+def _events(records: Sequence[Record]) -> bytes:
+    return b"".join(
+        SPILL_RECORD.pack(code, player_id, len(args), *args, *(0,) * (MAX_ARGS - len(args)))
+        for code, player_id, args in records
+    )
+
+
+def encode_state(engine: GameEngine, events: int) -> bytes:
+    state = engine.state
+    players = state.players
+    records = state.event_log.recent(events)
+    properties = state.properties.values()
+    return b"".join(
+        (
+            _header(engine, FLAG_FULL, 0, len(players), PROPERTY_COUNT, len(records)),
+            _CASH_ARRAYS[len(players)].pack(*[player.cash for player in players]),
+            bytes([player.position for player in players]),
+            bytes([_flags(player.in_jail, player.bankrupt) for player in players]),
+            bytes([NO_CODE if prop.owner_id is None else prop.owner_id for prop in properties]),
+            bytes([prop.houses for prop in properties]),
+            bytes([prop.mortgaged for prop in properties]),
+            _events(records),
+        )
+    )
+
+
+def encode_delta(
+    engine: GameEngine, since: int, players: Iterable[int], properties: Iterable[int], events: int
+) -> bytes:
+    state = engine.state
+    parts: List[bytes] = []
+    for player_id in sorted(players):
+        player = state.players[player_id]
+        parts.append(DELTA_PLAYER.pack(player_id, player.cash, player.position, _flags(player.in_jail, player.bankrupt)))
+    player_count = len(parts)
+    for prop_id in sorted(properties):
+        prop = state.properties[prop_id]
+        owner = NO_CODE if prop.owner_id is None else prop.owner_id
+        parts.append(DELTA_PROPERTY.pack(prop_id, owner, prop.houses, prop.mortgaged))
+    property_count = len(parts) - player_count
+    records = state.event_log.recent(events)
+    parts.append(_events(records))
+    return _header(engine, 0, since, player_count, property_count, len(records)) + b"".join(parts)
+
+
+def frame(message: bytes) -> bytes:
+    return FRAME_LENGTH.pack(len(message)) + message
+
+
+def decode(data: bytes) -> Dict[str, Any]:
+    (
+        magic,
+        flags,
+        version,
+        since,
+        current,
+        phase,
+        pending,
+        die1,
+        die2,
+        houses,
+        hotels,
+        player_count,
+        property_count,
+        event_count,
+    ) = STATE_HEADER.unpack_from(data)
+    if magic != STATE_MAGIC:
+        raise ValueError("Not an encoded game state.")
+    payload: Dict[str, Any] = {
+        "full": bool(flags & FLAG_FULL),
+        "version": version,
+        "current_player": current,
+        "turn_phase": TURN_PHASES[phase],
+        "pending_property_id": None if pending == NO_CODE else pending,
+        "last_roll": None if die1 == 0 else (die1, die2),
+        "houses_available": houses,
+        "hotels_available": hotels,
+    }
+    offset = STATE_HEADER.size
+    players: List[Dict[str, Any]] = []
+    properties: Dict[int, Dict[str, Any]] = {}
+    if payload["full"]:
+        cash = _CASH_ARRAYS[player_count].unpack_from(data, offset)
+        offset += _CASH_ARRAYS[player_count].size
+        positions = data[offset : offset + player_count]
+        status = data[offset + player_count : offset + 2 * player_count]
+        offset += 2 * player_count
+        for player_id in range(player_count):
+            players.append(_player(player_id, cash[player_id], positions[player_id], status[player_id]))
+        owners = data[offset : offset + property_count]
+        levels = data[offset + property_count : offset + 2 * property_count]
+        mortgaged = data[offset + 2 * property_count : offset + 3 * property_count]
+        offset += 3 * property_count
+        for index, prop_id in enumerate(PROPERTY_IDS[:property_count]):
+            properties[prop_id] = _property(owners[index], levels[index], mortgaged[index])
+    else:
+        payload["since"] = since
+        for _ in range(player_count):
+            player_id, cash_value, position, status_value = DELTA_PLAYER.unpack_from(data, offset)
+            offset += DELTA_PLAYER.size
+            players.append(_player(player_id, cash_value, position, status_value))
+        for _ in range(property_count):
+            prop_id, owner, level, mortgaged_flag = DELTA_PROPERTY.unpack_from(data, offset)
+            offset += DELTA_PROPERTY.size
+            properties[prop_id] = _property(owner, level, mortgaged_flag)
+    records = []
+    for code, player_id, count, *args in SPILL_RECORD.iter_unpack(data[offset : offset + event_count * SPILL_RECORD.size]):
+        records.append((code, player_id, tuple(args[:count])))
+    payload.update({"players": players, "properties": properties, "events": records})
+    return payload
+
+
+def _player(player_id: int, cash: int, position: int, status: int) -> Dict[str, Any]:
+    return {
+        "id": player_id,
+        "cash": cash,
+        "position": position,
+        "in_jail": bool(status & IN_JAIL),
+        "bankrupt": bool(status & BANKRUPT),
+    }
+
+
+def _property(owner: int, houses: int, mortgaged: int) -> Dict[str, Any]:
+    return {"owner_id": None if owner == NO_CODE else owner, "houses": houses, "mortgaged": bool(mortgaged)}
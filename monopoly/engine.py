@@ -2,8 +2,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+import functools
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 import random
+import struct
 
 from . import cards
 from .data import (
@@ -21,6 +38,19 @@ from .data import (
     UTILITIES,
     SpaceType,
 )
+from .events import (
+    DECK_NAMES,
+    DECKS,
+    DEFAULT_CAPACITY,
+    NO_PLAYER,
+    EventLog,
+    EventSink,
+    EventType,
+    card_code,
+    deck_codes,
+)
+from .liquidation import plan_liquidation
+from .tables import KIND_RAILROAD, KIND_UTILITY, RENT_TABLE, SPACE_KIND, street_rent_level
 
 
 class TurnPhase(str, Enum):
@@ -88,10 +118,11 @@ class GameState:
     current_player_index: int = 0
     turn_state: TurnState = field(default_factory=TurnState)
     trade_offers: Dict[int, TradeOffer] = field(default_factory=dict)
-    event_log: List[str] = field(default_factory=list)
+    event_log: EventLog = field(default_factory=EventLog)
     next_offer_id: int = 1
     houses_available: int = MAX_HOUSES
     hotels_available: int = MAX_HOTELS
+    version: int = 0
 
 
 class GameRuleError(Exception):
@@ -105,22 +136,461 @@ class InsufficientFunds(GameRuleError):
         self.amount_due = amount_due
 
 
+class PlayerBankrupt(InsufficientFunds):
+    def __init__(self, player_id: int, amount_due: int, creditor_id: Optional[int], cause: str):
+        super().__init__(player_id, amount_due)
+        self.creditor_id = creditor_id
+        self.cause = cause
+        self.others: List[PlayerBankrupt] = []
+
+    def players(self) -> List[PlayerBankrupt]:
+        return [self, *self.others]
+
+
+ActionListener = Callable[[str, Tuple[Any, ...], Dict[str, Any]], None]
+EventListener = Callable[[int, int, Tuple[int, ...]], None]
+LegalAction = Tuple[str, Tuple[Any, ...]]
+GroupLevels = Tuple[int, int, int]
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+RECORDED_ACTIONS: Set[str] = set()
+
+
+def _recorded(method: _Method) -> _Method:
+    name = method.__name__
+    RECORDED_ACTIONS.add(name)
+
+    @functools.wraps(method)
+    def wrapper(self: GameEngine, *args: Any, **kwargs: Any) -> Any:
+        listener = self.action_listener
+        if listener is None or self._in_action:
+            return method(self, *args, **kwargs)
+        self._in_action = True
+        try:
+            result = method(self, *args, **kwargs)
+        except GameRuleError:
+            listener(name, args, kwargs)
+            raise
+        finally:
+            self._in_action = False
+        listener(name, args, kwargs)
+        return result
+
+    return cast(_Method, wrapper)
+
+
+SNAPSHOT_MAGIC = b"MNP1"
+SNAPSHOT_HAS_RNG = 1
+NO_CODE = 255
+TURN_PHASES = tuple(TurnPhase)
+PHASE_CODES = {phase: code for code, phase in enumerate(TURN_PHASES)}
+OFFER_STATUSES = ("open", "accepted", "cancelled")
+OFFER_STATUS_CODES = {status: code for code, status in enumerate(OFFER_STATUSES)}
+PROPERTY_IDS = tuple(PROPERTY_DATA)
+SNAPSHOT_HEADER = struct.Struct("<4sBBBBbBBBBBIIbIbBBBH")
+SNAPSHOT_PLAYER = struct.Struct("<iBBBBBH")
+SNAPSHOT_OFFER = struct.Struct("<IbbiiBBB")
+SNAPSHOT_RNG = struct.Struct("<625I")
+SNAPSHOT_GAUSS = struct.Struct("<Bd")
+
+
+def unmortgage_cost(property_id: int) -> int:
+    return int(PROPERTY_DATA[property_id].mortgage * (1 + MORTGAGE_INTEREST_RATE))
+
+
 class GameEngine:
-    def __init__(self, player_names: List[str], seed: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        player_names: List[str],
+        seed: Optional[int] = None,
+        log_capacity: int = DEFAULT_CAPACITY,
+        log_sink: Optional[EventSink] = None,
+    ) -> None:
         if not (2 <= len(player_names) <= 4):
             raise GameRuleError("Game supports 2-4 players.")
         self.random = random.Random(seed)
         players = [Player(player_id=i, name=name) for i, name in enumerate(player_names)]
         properties = {prop_id: PropertyState() for prop_id in PROPERTY_DATA.keys()}
-        chance_deck = cards.standard_chance_cards()
-        community_deck = cards.standard_community_chest_cards()
+        chance_deck = list(DECKS[0])
+        community_deck = list(DECKS[1])
         self.random.shuffle(chance_deck)
         self.random.shuffle(community_deck)
-        self.state = GameState(players=players, properties=properties, chance_deck=chance_deck, community_deck=community_deck)
-        self._log("Game started.")
+        self.state = GameState(
+            players=players,
+            properties=properties,
+            chance_deck=chance_deck,
+            community_deck=community_deck,
+            event_log=EventLog(player_names, log_capacity, log_sink),
+        )
+        self._ownership_cache: Optional[Tuple[Dict[str, int], List[int], List[int]]] = None
+        self._group_cache: Optional[Dict[str, GroupLevels]] = None
+        self.action_listener: Optional[ActionListener] = None
+        self.event_listener: Optional[EventListener] = None
+        self._in_action = False
+        self._log(EventType.GAME_STARTED)
+
+    def _log(self, code: EventType, player_id: int = NO_PLAYER, *args: int) -> None:
+        self.state.version += 1
+        event_log = self.state.event_log
+        if event_log.enabled:
+            event_log.append(code, player_id, args)
+        if self.event_listener is not None:
+            self.event_listener(code, player_id, args)
+
+    def _observe(self, code: EventType, player_id: int, *args: int) -> None:
+        if self.event_listener is not None:
+            self.event_listener(code, player_id, args)
+
+    def clone(self, keep_log: bool = False, seed: Optional[int] = None) -> GameEngine:
+        state = self.state
+        turn_state = state.turn_state
+        auction = turn_state.pending_auction
+        if auction is not None:
+            auction = AuctionState(auction.property_id, auction.highest_bid, auction.highest_bidder, set(auction.active_bidders))
+        engine = GameEngine.__new__(GameEngine)
+        if seed is None:
+            engine.random = random.Random()
+            engine.random.setstate(self.random.getstate())
+        else:
+            engine.random = random.Random(seed)
+        engine.state = GameState(
+            players=[
+                Player(
+                    player.player_id,
+                    player.name,
+                    player.cash,
+                    player.position,
+                    player.in_jail,
+                    player.jail_turns,
+                    list(player.get_out_of_jail_cards),
+                    player.bankrupt,
+                )
+                for player in state.players
+            ],
+            properties={
+                prop_id: PropertyState(prop.owner_id, prop.houses, prop.mortgaged)
+                for prop_id, prop in state.properties.items()
+            },
+            chance_deck=list(state.chance_deck),
+            community_deck=list(state.community_deck),
+            current_player_index=state.current_player_index,
+            turn_state=TurnState(
+                turn_state.phase,
+                turn_state.pending_property_id,
+                auction,
+                turn_state.last_roll,
+                turn_state.doubles_count,
+            ),
+            trade_offers={
+                offer_id: TradeOffer(
+                    offer.offer_id,
+                    offer.from_player,
+                    offer.to_player,
+                    offer.give_cash,
+                    list(offer.give_properties),
+                    offer.receive_cash,
+                    list(offer.receive_properties),
+                    offer.status,
+                )
+                for offer_id, offer in state.trade_offers.items()
+            },
+            event_log=state.event_log.copy() if keep_log else EventLog(state.event_log.player_names, 0),
+            next_offer_id=state.next_offer_id,
+            houses_available=state.houses_available,
+            hotels_available=state.hotels_available,
+            version=state.version,
+        )
+        engine._ownership_cache = self._ownership_cache
+        engine._group_cache = None if self._group_cache is None else dict(self._group_cache)
+        engine.action_listener = None
+        engine.event_listener = None
+        engine._in_action = False
+        return engine
+
+    def rollback(self, checkpoint: GameEngine) -> None:
+        sink = self.state.event_log.sink
+        self.random = checkpoint.random
+        self.state = checkpoint.state
+        self.state.event_log.sink = sink
+        self._ownership_cache = checkpoint._ownership_cache
+        self._group_cache = checkpoint._group_cache
+
+    def snapshot(self, include_rng: bool = True) -> bytes:
+        state = self.state
+        turn_state = state.turn_state
+        pending = turn_state.pending_property_id
+        die1, die2 = turn_state.last_roll or (0, 0)
+        auction = turn_state.pending_auction
+        if auction is None:
+            auction_fields = (-1, 0, -1, 0)
+        else:
+            bidders = 0
+            for bidder in auction.active_bidders:
+                bidders |= 1 << bidder
+            highest_bidder = -1 if auction.highest_bidder is None else auction.highest_bidder
+            auction_fields = (auction.property_id, auction.highest_bid, highest_bidder, bidders)
+        parts = [
+            SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_HAS_RNG if include_rng else 0,
+                len(state.players),
+                state.current_player_index,
+                PHASE_CODES[turn_state.phase],
+                -1 if pending is None else pending,
+                die1,
+                die2,
+                turn_state.doubles_count,
+                state.houses_available,
+                state.hotels_available,
+                state.next_offer_id,
+                state.version,
+                *auction_fields,
+                len(state.chance_deck),
+                len(state.community_deck),
+                len(state.trade_offers),
+            )
+        ]
+        for player in state.players:
+            name = player.name.encode()
+            held = player.get_out_of_jail_cards
+            parts.append(
+                SNAPSHOT_PLAYER.pack(
+                    player.cash, player.position, player.in_jail, player.jail_turns, player.bankrupt, len(held), len(name)
+                )
+            )
+            parts.append(name)
+            for deck_name, card in held:
+                parts.append(bytes(card_code(deck_name, card)))
+        parts.append(
+            bytes(
+                [
+                    value
+                    for prop in state.properties.values()
+                    for value in (NO_CODE if prop.owner_id is None else prop.owner_id, prop.houses, prop.mortgaged)
+                ]
+            )
+        )
+        parts.append(deck_codes(0, state.chance_deck))
+        parts.append(deck_codes(1, state.community_deck))
+        for offer in state.trade_offers.values():
+            parts.append(
+                SNAPSHOT_OFFER.pack(
+                    offer.offer_id,
+                    offer.from_player,
+                    -1 if offer.to_player is None else offer.to_player,
+                    offer.give_cash,
+                    offer.receive_cash,
+                    OFFER_STATUS_CODES[offer.status],
+                    len(offer.give_properties),
+                    len(offer.receive_properties),
+                )
+            )
+            parts.append(bytes(offer.give_properties))
+            parts.append(bytes(offer.receive_properties))
+        if include_rng:
+            _, internal, gauss_next = self.random.getstate()
+            parts.append(SNAPSHOT_RNG.pack(*internal))
+            parts.append(SNAPSHOT_GAUSS.pack(gauss_next is not None, gauss_next or 0.0))
+        return b"".join(parts)
+
+    @classmethod
+    def restore(
+        cls,
+        data: bytes,
+        seed: Optional[int] = None,
+        log_capacity: int = DEFAULT_CAPACITY,
+        log_sink: Optional[EventSink] = None,
+    ) -> GameEngine:
+        if data[:4] != SNAPSHOT_MAGIC:
+            raise ValueError("Not a game snapshot.")
+        (
+            _,
+            flags,
+            num_players,
+            current_player_index,
+            phase,
+            pending,
+            die1,
+            die2,
+            doubles_count,
+            houses_available,
+            hotels_available,
+            next_offer_id,
+            version,
+            auction_property,
+            highest_bid,
+            highest_bidder,
+            bidders,
+            chance_count,
+            community_count,
+            offer_count,
+        ) = SNAPSHOT_HEADER.unpack_from(data)
+        offset = SNAPSHOT_HEADER.size
+        players = []
+        for player_id in range(num_players):
+            cash, position, in_jail, jail_turns, bankrupt, held_count, name_length = SNAPSHOT_PLAYER.unpack_from(
+                data, offset
+            )
+            offset += SNAPSHOT_PLAYER.size
+            name = data[offset : offset + name_length].decode()
+            offset += name_length
+            held = []
+            for _ in range(held_count):
+                deck = data[offset]
+                held.append((DECK_NAMES[deck], DECKS[deck][data[offset + 1]]))
+                offset += 2
+            players.append(Player(player_id, name, cash, position, bool(in_jail), jail_turns, held, bool(bankrupt)))
+        raw = data[offset : offset + 3 * len(PROPERTY_IDS)]
+        properties = {
+            prop_id: PropertyState(None if owner_id == NO_CODE else owner_id, houses, mortgaged == 1)
+            for prop_id, owner_id, houses, mortgaged in zip(PROPERTY_IDS, raw[0::3], raw[1::3], raw[2::3])
+        }
+        offset += len(raw)
+        chance_cards, community_cards = DECKS
+        chance_deck = [chance_cards[idx] for idx in data[offset : offset + chance_count]]
+        offset += chance_count
+        community_deck = [community_cards[idx] for idx in data[offset : offset + community_count]]
+        offset += community_count
+        trade_offers = {}
+        for _ in range(offer_count):
+            offer_id, from_player, to_player, give_cash, receive_cash, status, gives, receives = (
+                SNAPSHOT_OFFER.unpack_from(data, offset)
+            )
+            offset += SNAPSHOT_OFFER.size
+            give_properties = list(data[offset : offset + gives])
+            offset += gives
+            receive_properties = list(data[offset : offset + receives])
+            offset += receives
+            trade_offers[offer_id] = TradeOffer(
+                offer_id,
+                from_player,
+                None if to_player < 0 else to_player,
+                give_cash,
+                give_properties,
+                receive_cash,
+                receive_properties,
+                OFFER_STATUSES[status],
+            )
+        auction = None
+        if auction_property >= 0:
+            auction = AuctionState(
+                auction_property,
+                highest_bid,
+                None if highest_bidder < 0 else highest_bidder,
+                {player_id for player_id in range(num_players) if bidders >> player_id & 1},
+            )
+        engine = cls.__new__(cls)
+        engine.random = random.Random(seed)
+        if flags & SNAPSHOT_HAS_RNG:
+            internal = SNAPSHOT_RNG.unpack_from(data, offset)
+            has_gauss, gauss_next = SNAPSHOT_GAUSS.unpack_from(data, offset + SNAPSHOT_RNG.size)
+            engine.random.setstate((3, internal, gauss_next if has_gauss else None))
+        engine.state = GameState(
+            players=players,
+            properties=properties,
+            chance_deck=chance_deck,
+            community_deck=community_deck,
+            current_player_index=current_player_index,
+            turn_state=TurnState(
+                TURN_PHASES[phase],
+                None if pending < 0 else pending,
+                auction,
+                (die1, die2) if die1 else None,
+                doubles_count,
+            ),
+            trade_offers=trade_offers,
+            event_log=EventLog([player.name for player in players], log_capacity, log_sink),
+            next_offer_id=next_offer_id,
+            houses_available=houses_available,
+            hotels_available=hotels_available,
+            version=version,
+        )
+        engine._ownership_cache = None
+        engine._group_cache = None
+        engine.action_listener = None
+        engine.event_listener = None
+        engine._in_action = False
+        return engine
+
+    def apply_action(self, name: str, args: Tuple[Any, ...] = (), kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        kwargs = kwargs or {}
+        error = action_args_error(name, args, kwargs, len(self.state.players))
+        if error is not None:
+            raise GameRuleError(error)
+        return getattr(self, name)(*args, **kwargs)
+
+    def legal_actions(self, player_id: int) -> List[LegalAction]:
+        state = self.state
+        player = state.players[player_id]
+        if player.bankrupt:
+            return []
+        actions: List[LegalAction] = []
+        turn_state = state.turn_state
+        phase = turn_state.phase
+        if player_id == state.current_player_index:
+            if phase == TurnPhase.AWAIT_ROLL:
+                actions.append(("roll_dice", ()))
+            elif phase == TurnPhase.AWAIT_JAIL_ACTION:
+                actions.append(("attempt_jail_roll", ()))
+                if player.cash >= JAIL_FINE:
+                    actions.append(("pay_jail_fine", ()))
+                for deck_name in DECK_NAMES:
+                    if any(name == deck_name for name, _ in player.get_out_of_jail_cards):
+                        actions.append(("use_get_out_of_jail_card", (deck_name,)))
+            elif phase == TurnPhase.AWAIT_BUY_DECISION and turn_state.pending_property_id is not None:
+                if player.cash >= PROPERTY_DATA[turn_state.pending_property_id].price:
+                    actions.append(("buy_property", ()))
+                actions.append(("decline_property", ()))
+            elif phase == TurnPhase.TURN_OVER:
+                actions.append(("end_turn", ()))
+        auction = turn_state.pending_auction
+        if phase == TurnPhase.AWAIT_AUCTION and auction is not None and player_id in auction.active_bidders:
+            if player.cash > auction.highest_bid:
+                actions.append(("place_bid", (player_id, auction.highest_bid + 1)))
+            actions.append(("pass_bid", (player_id,)))
+        for offer_id, offer in state.trade_offers.items():
+            if offer.status != "open":
+                continue
+            if offer.from_player == player_id:
+                actions.append(("cancel_trade_offer", (offer_id, player_id)))
+            elif offer.to_player in (None, player_id) and self._offer_is_valid(offer, player_id):
+                actions.append(("accept_trade_offer", (offer_id, player_id)))
+        for prop_id, prop_state in state.properties.items():
+            if prop_state.owner_id != player_id:
+                continue
+            if prop_state.mortgaged:
+                if self.can_unmortgage(player_id, prop_id):
+                    actions.append(("unmortgage_property", (player_id, prop_id)))
+                continue
+            if self.can_mortgage(player_id, prop_id):
+                actions.append(("mortgage_property", (player_id, prop_id)))
+            if self.can_build_house(player_id, prop_id):
+                actions.append(("build_house", (player_id, prop_id)))
+            if self.can_sell_house(player_id, prop_id):
+                actions.append(("sell_house", (player_id, prop_id)))
+        return actions
+
+    def _offer_is_valid(self, offer: TradeOffer, accepting_player: int) -> bool:
+        properties = self.state.properties
+        giver = self.state.players[offer.from_player]
+        receiver = self.state.players[accepting_player]
+        if giver.bankrupt or giver.cash < offer.give_cash or receiver.cash < offer.receive_cash:
+            return False
+        if any(properties[prop_id].owner_id != offer.from_player for prop_id in offer.give_properties):
+            return False
+        if any(properties[prop_id].owner_id != accepting_player for prop_id in offer.receive_properties):
+            return False
+        net = offer.give_cash - offer.receive_cash
+        return (
+            receiver.cash + net >= self._transfer_interest(offer.give_properties)
+            and giver.cash - net >= self._transfer_interest(offer.receive_properties)
+        )
 
-    def _log(self, message: str) -> None:
-        self.state.event_log.append(message)
+    def _transfer_interest(self, property_ids: List[int]) -> int:
+        return sum(
+            int(PROPERTY_DATA[prop_id].mortgage * MORTGAGE_INTEREST_RATE)
+            for prop_id in property_ids
+            if self.state.properties[prop_id].mortgaged
+        )
 
     def current_player(self) -> Player:
         return self.state.players[self.state.current_player_index]
@@ -133,6 +603,7 @@ class GameEngine:
                 return
         raise GameRuleError("No active players remain.")
 
+    @_recorded
     def start_turn(self) -> None:
         player = self.current_player()
         if player.bankrupt:
@@ -142,15 +613,16 @@ class GameEngine:
             self.state.turn_state = TurnState(phase=TurnPhase.AWAIT_JAIL_ACTION)
         else:
             self.state.turn_state = TurnState(phase=TurnPhase.AWAIT_ROLL)
-        self._log(f"Turn started for {player.name}.")
+        self._log(EventType.TURN_STARTED, player.player_id)
 
+    @_recorded
     def roll_dice(self) -> Tuple[int, int]:
         if self.state.turn_state.phase != TurnPhase.AWAIT_ROLL:
             raise GameRuleError("Not ready to roll dice.")
         die1 = self.random.randint(1, 6)
         die2 = self.random.randint(1, 6)
         self.state.turn_state.last_roll = (die1, die2)
-        self._log(f"{self.current_player().name} rolled {die1} and {die2}.")
+        self._log(EventType.ROLLED, self.state.current_player_index, die1, die2)
         if die1 == die2:
             self.state.turn_state.doubles_count += 1
             if self.state.turn_state.doubles_count == 3:
@@ -161,13 +633,14 @@ class GameEngine:
         self._resolve_landing()
         return die1, die2
 
+    @_recorded
     def attempt_jail_roll(self) -> Tuple[int, int]:
         if self.state.turn_state.phase != TurnPhase.AWAIT_JAIL_ACTION:
             raise GameRuleError("Not awaiting jail action.")
         player = self.current_player()
         die1 = self.random.randint(1, 6)
         die2 = self.random.randint(1, 6)
-        self._log(f"{player.name} rolled {die1} and {die2} in jail.")
+        self._log(EventType.JAIL_ROLLED, player.player_id, die1, die2)
         if die1 == die2:
             player.in_jail = False
             player.jail_turns = 0
@@ -177,7 +650,7 @@ class GameEngine:
             return die1, die2
         player.jail_turns += 1
         if player.jail_turns >= 3:
-            self._pay_bank(player.player_id, JAIL_FINE)
+            self._settle(player.player_id, JAIL_FINE, None, "jail_fine")
             player.in_jail = False
             player.jail_turns = 0
             self.state.turn_state = TurnState(phase=TurnPhase.AWAIT_ROLL)
@@ -185,6 +658,7 @@ class GameEngine:
             self._resolve_landing()
         return die1, die2
 
+    @_recorded
     def pay_jail_fine(self) -> None:
         if self.state.turn_state.phase != TurnPhase.AWAIT_JAIL_ACTION:
             raise GameRuleError("Not awaiting jail action.")
@@ -193,7 +667,9 @@ class GameEngine:
         player.in_jail = False
         player.jail_turns = 0
         self.state.turn_state.phase = TurnPhase.AWAIT_ROLL
+        self._log(EventType.JAIL_FINE_PAID, player.player_id, JAIL_FINE)
 
+    @_recorded
     def use_get_out_of_jail_card(self, deck_name: str) -> None:
         player = self.current_player()
         for idx, (name, card) in enumerate(player.get_out_of_jail_cards):
@@ -206,10 +682,11 @@ class GameEngine:
                 player.in_jail = False
                 player.jail_turns = 0
                 self.state.turn_state.phase = TurnPhase.AWAIT_ROLL
-                self._log(f"{player.name} used a Get Out of Jail Free card.")
+                self._log(EventType.JAIL_CARD_USED, player.player_id)
                 return
         raise GameRuleError("No matching Get Out of Jail Free card.")
 
+    @_recorded
     def buy_property(self) -> None:
         if self.state.turn_state.phase != TurnPhase.AWAIT_BUY_DECISION:
             raise GameRuleError("No property available to buy.")
@@ -219,11 +696,12 @@ class GameEngine:
             raise GameRuleError("No property pending.")
         prop_data = PROPERTY_DATA[prop_id]
         self._pay_bank(player.player_id, prop_data.price)
-        self.state.properties[prop_id].owner_id = player.player_id
+        self._set_owner(prop_id, player.player_id)
         self.state.turn_state.pending_property_id = None
         self.state.turn_state.phase = TurnPhase.TURN_OVER
-        self._log(f"{player.name} bought {prop_data.name} for ${prop_data.price}.")
+        self._log(EventType.PROPERTY_BOUGHT, player.player_id, prop_id, prop_data.price)
 
+    @_recorded
     def decline_property(self) -> None:
         if self.state.turn_state.phase != TurnPhase.AWAIT_BUY_DECISION:
             raise GameRuleError("No property to decline.")
@@ -235,8 +713,9 @@ class GameEngine:
         self.state.turn_state.pending_property_id = None
         self.state.turn_state.pending_auction = auction
         self.state.turn_state.phase = TurnPhase.AWAIT_AUCTION
-        self._log(f"Auction started for {PROPERTY_DATA[prop_id].name}.")
+        self._log(EventType.AUCTION_STARTED, NO_PLAYER, prop_id)
 
+    @_recorded
     def place_bid(self, player_id: int, amount: int) -> None:
         if self.state.turn_state.phase != TurnPhase.AWAIT_AUCTION:
             raise GameRuleError("No auction running.")
@@ -252,8 +731,9 @@ class GameEngine:
             raise GameRuleError("Bid must exceed highest bid.")
         auction.highest_bid = amount
         auction.highest_bidder = player_id
-        self._log(f"{player.name} bid ${amount}.")
+        self._log(EventType.BID_PLACED, player_id, amount)
 
+    @_recorded
     def pass_bid(self, player_id: int) -> None:
         if self.state.turn_state.phase != TurnPhase.AWAIT_AUCTION:
             raise GameRuleError("No auction running.")
@@ -261,7 +741,7 @@ class GameEngine:
         if auction is None:
             raise GameRuleError("No auction state.")
         auction.active_bidders.discard(player_id)
-        self._log(f"Player {player_id} passed in auction.")
+        self._log(EventType.BID_PASSED, player_id)
         if len(auction.active_bidders) <= 1:
             self._finalize_auction(auction)
 
@@ -269,13 +749,14 @@ class GameEngine:
         if auction.highest_bidder is not None:
             winner = self.state.players[auction.highest_bidder]
             self._pay_bank(winner.player_id, auction.highest_bid)
-            self.state.properties[auction.property_id].owner_id = winner.player_id
-            self._log(f"{winner.name} won auction for ${auction.highest_bid}.")
+            self._set_owner(auction.property_id, winner.player_id)
+            self._log(EventType.AUCTION_WON, winner.player_id, auction.highest_bid)
         else:
-            self._log("Auction ended with no bids.")
+            self._log(EventType.AUCTION_UNSOLD)
         self.state.turn_state.pending_auction = None
         self.state.turn_state.phase = TurnPhase.TURN_OVER
 
+    @_recorded
     def create_trade_offer(
         self,
         from_player: int,
@@ -297,16 +778,26 @@ class GameEngine:
         )
         self.state.trade_offers[offer.offer_id] = offer
         self.state.next_offer_id += 1
-        self._log(f"Trade offer {offer.offer_id} created by player {from_player}.")
+        self._log(EventType.TRADE_CREATED, from_player, offer.offer_id)
         return offer
 
+    @_recorded
     def cancel_trade_offer(self, offer_id: int, player_id: int) -> None:
         offer = self._get_offer(offer_id)
         if offer.from_player != player_id:
             raise GameRuleError("Only offer creator can cancel.")
         offer.status = "cancelled"
-        self._log(f"Trade offer {offer_id} cancelled.")
+        self._log(EventType.TRADE_CANCELLED, player_id, offer_id)
+
+    @_recorded
+    def discard_trade_offer(self, offer_id: int) -> None:
+        offer = self._get_offer(offer_id)
+        if offer.status == "open":
+            raise GameRuleError("Offer is still open.")
+        del self.state.trade_offers[offer_id]
+        self.state.version += 1
 
+    @_recorded
     def accept_trade_offer(self, offer_id: int, accepting_player: int) -> None:
         offer = self._get_offer(offer_id)
         if offer.status != "open":
@@ -315,127 +806,121 @@ class GameEngine:
             raise GameRuleError("Offer not addressed to this player.")
         self._validate_trade_assets(offer.from_player, offer.give_cash, offer.give_properties)
         self._validate_trade_assets(accepting_player, offer.receive_cash, offer.receive_properties)
+        self._require_trade_interest(accepting_player, offer.give_cash - offer.receive_cash, offer.give_properties)
+        self._require_trade_interest(offer.from_player, offer.receive_cash - offer.give_cash, offer.receive_properties)
         self._transfer_cash(offer.from_player, accepting_player, offer.give_cash)
         self._transfer_cash(accepting_player, offer.from_player, offer.receive_cash)
         self._transfer_properties(offer.from_player, accepting_player, offer.give_properties)
         self._transfer_properties(accepting_player, offer.from_player, offer.receive_properties)
         offer.status = "accepted"
-        self._log(f"Trade offer {offer_id} accepted by player {accepting_player}.")
+        self._log(EventType.TRADE_ACCEPTED, accepting_player, offer_id)
 
+    @_recorded
     def mortgage_property(self, player_id: int, property_id: int) -> None:
-        self._require_owner(player_id, property_id)
-        prop_state = self.state.properties[property_id]
-        if prop_state.mortgaged:
-            raise GameRuleError("Property already mortgaged.")
-        if self._group_has_houses(property_id):
-            raise GameRuleError("Cannot mortgage while houses exist in group.")
+        error = self._mortgage_error(player_id, property_id)
+        if error is not None:
+            raise GameRuleError(error)
         mortgage_value = PROPERTY_DATA[property_id].mortgage
-        prop_state.mortgaged = True
+        self._set_mortgaged(property_id, True)
         self.state.players[player_id].cash += mortgage_value
-        self._log(f"Player {player_id} mortgaged {PROPERTY_DATA[property_id].name} for ${mortgage_value}.")
+        self._log(EventType.MORTGAGED, player_id, property_id, mortgage_value)
 
+    @_recorded
     def unmortgage_property(self, player_id: int, property_id: int) -> None:
-        self._require_owner(player_id, property_id)
-        prop_state = self.state.properties[property_id]
-        if not prop_state.mortgaged:
-            raise GameRuleError("Property is not mortgaged.")
-        cost = int(PROPERTY_DATA[property_id].mortgage * (1 + MORTGAGE_INTEREST_RATE))
+        error = self._unmortgage_error(player_id, property_id)
+        if error is not None:
+            raise GameRuleError(error)
+        cost = unmortgage_cost(property_id)
         self._pay_bank(player_id, cost)
-        prop_state.mortgaged = False
-        self._log(f"Player {player_id} unmortgaged {PROPERTY_DATA[property_id].name} for ${cost}.")
+        self._set_mortgaged(property_id, False)
+        self._log(EventType.UNMORTGAGED, player_id, property_id, cost)
 
+    @_recorded
     def build_house(self, player_id: int, property_id: int) -> None:
-        self._require_owner(player_id, property_id)
+        error = self._build_error(player_id, property_id)
+        if error is not None:
+            raise GameRuleError(error)
         prop_data = PROPERTY_DATA[property_id]
-        if prop_data.type != SpaceType.PROPERTY:
-            raise GameRuleError("Can only build on color properties.")
-        if not self._owns_group(player_id, prop_data.color):
-            raise GameRuleError("Must own full color group to build.")
-        if self._group_has_mortgage(prop_data.color):
-            raise GameRuleError("Cannot build with mortgaged property in group.")
         prop_state = self.state.properties[property_id]
-        if prop_state.houses >= 5:
-            raise GameRuleError("Property already has a hotel.")
-        if not self._can_build_evenly(property_id):
-            raise GameRuleError("Must build evenly across the group.")
-        if prop_state.houses == 4:
-            if self.state.hotels_available < 1:
-                raise GameRuleError("No hotels available.")
-        else:
-            if self.state.houses_available < 1:
-                raise GameRuleError("No houses available.")
         self._pay_bank(player_id, prop_data.house_cost or 0)
         if prop_state.houses == 4:
             self.state.hotels_available -= 1
             self.state.houses_available = min(MAX_HOUSES, self.state.houses_available + 4)
-            prop_state.houses = 5
         else:
             self.state.houses_available -= 1
-            prop_state.houses += 1
-        self._log(f"Player {player_id} built on {prop_data.name}.")
+        self._set_houses(property_id, prop_state.houses + 1)
+        self._log(EventType.HOUSE_BUILT, player_id, property_id)
 
+    @_recorded
     def sell_house(self, player_id: int, property_id: int) -> None:
-        self._require_owner(player_id, property_id)
+        error = self._sell_error(player_id, property_id)
+        if error is not None:
+            raise GameRuleError(error)
         prop_data = PROPERTY_DATA[property_id]
         prop_state = self.state.properties[property_id]
-        if prop_state.houses == 0:
-            raise GameRuleError("No houses to sell.")
-        if not self._can_sell_evenly(property_id):
-            raise GameRuleError("Must sell evenly across the group.")
         if prop_state.houses == 5:
-            if self.state.houses_available < 4:
-                raise GameRuleError("Not enough houses available to sell a hotel.")
-            prop_state.houses = 4
             self.state.hotels_available = min(MAX_HOTELS, self.state.hotels_available + 1)
             self.state.houses_available -= 4
             sale_value = int((prop_data.house_cost or 0) * 5 * HOUSE_SELL_VALUE)
         else:
-            prop_state.houses -= 1
             self.state.houses_available = min(MAX_HOUSES, self.state.houses_available + 1)
             sale_value = int((prop_data.house_cost or 0) * HOUSE_SELL_VALUE)
+        self._set_houses(property_id, prop_state.houses - 1)
         self.state.players[player_id].cash += sale_value
-        self._log(f"Player {player_id} sold a house on {prop_data.name} for ${sale_value}.")
+        self._log(EventType.HOUSE_SOLD, player_id, property_id, sale_value)
 
+    @_recorded
     def declare_bankruptcy(self, player_id: int, creditor_id: Optional[int] = None) -> None:
         player = self.state.players[player_id]
         if player.bankrupt:
             raise GameRuleError("Player already bankrupt.")
-        self._liquidate_houses(player_id)
+        if creditor_id == player_id:
+            raise GameRuleError("Player cannot be their own creditor.")
+        holdings = [
+            prop_id for prop_id, prop_state in self.state.properties.items() if prop_state.owner_id == player_id
+        ]
         if creditor_id is not None:
             creditor = self.state.players[creditor_id]
-            creditor.cash += player.cash
+            interest = self._transfer_interest(holdings)
+            proceeds = player.cash + sum(self._house_sale_value(prop_id) for prop_id in holdings)
+            if creditor.cash + proceeds < interest:
+                raise InsufficientFunds(creditor_id, interest)
+        self._liquidate_houses(player_id)
+        if creditor_id is not None:
+            creditor.cash += player.cash - interest
             player.cash = 0
-            for prop_id, prop_state in self.state.properties.items():
-                if prop_state.owner_id == player_id:
-                    prop_state.owner_id = creditor_id
-                    self._handle_mortgage_transfer(creditor_id, prop_id)
-            self._log(f"Player {player_id} bankrupt to player {creditor_id}.")
+            for prop_id in holdings:
+                self._set_owner(prop_id, creditor_id)
+            self._log(EventType.BANKRUPT_TO_PLAYER, player_id, creditor_id)
         else:
-            for prop_id, prop_state in self.state.properties.items():
-                if prop_state.owner_id == player_id:
-                    prop_state.owner_id = None
-                    prop_state.mortgaged = False
-                    prop_state.houses = 0
-            self._log(f"Player {player_id} bankrupt to bank.")
+            for prop_id in holdings:
+                self._set_owner(prop_id, None)
+                self._set_mortgaged(prop_id, False)
+                self._set_houses(prop_id, 0)
+            self._log(EventType.BANKRUPT_TO_BANK, player_id)
         player.bankrupt = True
         player.in_jail = False
+        if player_id == self.state.current_player_index:
+            self.state.turn_state = TurnState(phase=TurnPhase.TURN_OVER)
 
+    @_recorded
     def end_turn(self) -> None:
         if self.state.turn_state.phase != TurnPhase.TURN_OVER:
             raise GameRuleError("Turn not complete.")
         if self.state.turn_state.doubles_count > 0 and not self.current_player().in_jail:
             self.state.turn_state = TurnState(phase=TurnPhase.AWAIT_ROLL)
-            self._log(f"{self.current_player().name} rolls again for doubles.")
+            self._log(EventType.ROLL_AGAIN, self.state.current_player_index)
             return
         self._advance_turn_index()
         self.start_turn()
 
+    @_recorded
     def send_player_to_jail(self, player_id: int) -> None:
         player = self.state.players[player_id]
         player.position = 10
         player.in_jail = True
         player.jail_turns = 0
-        self._log(f"{player.name} sent to jail.")
+        self._log(EventType.SENT_TO_JAIL, player_id)
 
     def _move_current_player(self, steps: int, collect_go: bool) -> None:
         player = self.current_player()
@@ -443,19 +928,20 @@ class GameEngine:
         new_pos = (start + steps) % len(BOARD)
         if collect_go and (start + steps) >= len(BOARD):
             player.cash += GO_SALARY
-            self._log(f"{player.name} collected ${GO_SALARY} for passing GO.")
+            self._log(EventType.PASSED_GO, player.player_id, GO_SALARY)
         player.position = new_pos
 
     def _move_player_to(self, player_id: int, destination: int, collect_go: bool) -> None:
         player = self.state.players[player_id]
         if collect_go and destination < player.position:
             player.cash += GO_SALARY
-            self._log(f"{player.name} collected ${GO_SALARY} for passing GO.")
+            self._log(EventType.PASSED_GO, player.player_id, GO_SALARY)
         player.position = destination
 
     def _resolve_landing(self) -> None:
         player = self.current_player()
         space = BOARD[player.position]
+        self._observe(EventType.LANDED, player.player_id, player.position)
         if space.type in (SpaceType.PROPERTY, SpaceType.RAILROAD, SpaceType.UTILITY):
             prop_id = space.property_id
             if prop_id is None:
@@ -467,14 +953,15 @@ class GameEngine:
                 return
             if prop_state.owner_id != player.player_id and not prop_state.mortgaged:
                 rent = self._calculate_rent(prop_id, player.player_id)
-                self._pay_player(player.player_id, prop_state.owner_id, rent)
+                self._settle(player.player_id, rent, prop_state.owner_id, "rent")
+                self._observe(EventType.RENT_PAID, player.player_id, prop_id, rent)
             self.state.turn_state.phase = TurnPhase.TURN_OVER
         elif space.type == SpaceType.CHANCE:
             self._draw_card("chance")
         elif space.type == SpaceType.COMMUNITY_CHEST:
             self._draw_card("community")
         elif space.type == SpaceType.TAX:
-            self._pay_bank(player.player_id, space.tax_amount or 0)
+            self._settle(player.player_id, space.tax_amount or 0, None, "tax")
             self.state.turn_state.phase = TurnPhase.TURN_OVER
         elif space.type == SpaceType.GO_TO_JAIL:
             self.send_player_to_jail(player.player_id)
@@ -486,15 +973,17 @@ class GameEngine:
         deck = self.state.chance_deck if deck_name == "chance" else self.state.community_deck
         card = deck.pop(0)
         player = self.current_player()
-        self._log(f"{player.name} drew card: {card.description}.")
-        if card.action == "get_out_of_jail":
-            player.get_out_of_jail_cards.append((deck_name, card))
-            self._log(f"{player.name} kept a Get Out of Jail Free card.")
-        else:
-            deck.append(card)
-            self._apply_card(card, player.player_id)
-        if self.state.turn_state.phase != TurnPhase.AWAIT_BUY_DECISION:
-            self.state.turn_state.phase = TurnPhase.TURN_OVER
+        self._log(EventType.CARD_DRAWN, player.player_id, *card_code(deck_name, card))
+        try:
+            if card.action == "get_out_of_jail":
+                player.get_out_of_jail_cards.append((deck_name, card))
+                self._log(EventType.JAIL_CARD_KEPT, player.player_id)
+            else:
+                deck.append(card)
+                self._apply_card(card, player.player_id)
+        finally:
+            if self.state.turn_state.phase != TurnPhase.AWAIT_BUY_DECISION:
+                self.state.turn_state.phase = TurnPhase.TURN_OVER
 
     def _apply_card(self, card: cards.Card, player_id: int) -> None:
         if card.action == "move":
@@ -515,33 +1004,42 @@ class GameEngine:
         elif card.action == "collect":
             self.state.players[player_id].cash += card.amount or 0
         elif card.action == "pay":
-            self._pay_bank(player_id, card.amount or 0)
+            self._settle(player_id, card.amount or 0, None, "card")
         elif card.action == "pay_each":
             for other in self.state.players:
                 if other.player_id != player_id and not other.bankrupt:
-                    self._pay_player(player_id, other.player_id, card.amount or 0)
+                    self._settle(player_id, card.amount or 0, other.player_id, "card")
         elif card.action == "collect_each":
-            total = 0
+            bankrupt: Optional[PlayerBankrupt] = None
             for other in self.state.players:
                 if other.player_id != player_id and not other.bankrupt:
-                    self._pay_player(other.player_id, player_id, card.amount or 0)
-                    total += card.amount or 0
+                    try:
+                        self._settle(other.player_id, card.amount or 0, player_id, "card")
+                    except PlayerBankrupt as exc:
+                        if bankrupt is None:
+                            bankrupt = exc
+                        else:
+                            bankrupt.others.append(exc)
+            if bankrupt is not None:
+                raise bankrupt
         elif card.action == "go_to_jail":
             self.send_player_to_jail(player_id)
         elif card.action == "repair":
             house_count, hotel_count = self._count_houses_hotels(player_id)
             cost = (card.per_house or 0) * house_count + (card.per_hotel or 0) * hotel_count
-            self._pay_bank(player_id, cost)
+            self._settle(player_id, cost, None, "card")
 
     def _resolve_landing_with_rent_multiplier(self, multiplier: int) -> None:
         player = self.current_player()
         space = BOARD[player.position]
+        self._observe(EventType.LANDED, player.player_id, player.position)
         if space.property_id is None:
             return
         prop_state = self.state.properties[space.property_id]
         if prop_state.owner_id is not None and prop_state.owner_id != player.player_id:
             rent = self._calculate_rent(space.property_id, player.player_id)
-            self._pay_player(player.player_id, prop_state.owner_id, rent * multiplier)
+            self._settle(player.player_id, rent * multiplier, prop_state.owner_id, "rent")
+            self._observe(EventType.RENT_PAID, player.player_id, space.property_id, rent * multiplier)
             self.state.turn_state.phase = TurnPhase.TURN_OVER
         elif prop_state.owner_id is None:
             self.state.turn_state.phase = TurnPhase.AWAIT_BUY_DECISION
@@ -550,37 +1048,81 @@ class GameEngine:
     def _resolve_landing_with_utility_multiplier(self, multiplier: int) -> None:
         player = self.current_player()
         space = BOARD[player.position]
+        self._observe(EventType.LANDED, player.player_id, player.position)
         if space.property_id is None:
             return
         prop_state = self.state.properties[space.property_id]
         if prop_state.owner_id is not None and prop_state.owner_id != player.player_id:
             last_roll = self.state.turn_state.last_roll or (0, 0)
             dice_sum = sum(last_roll)
-            self._pay_player(player.player_id, prop_state.owner_id, dice_sum * multiplier)
+            self._settle(player.player_id, dice_sum * multiplier, prop_state.owner_id, "rent")
+            self._observe(EventType.RENT_PAID, player.player_id, space.property_id, dice_sum * multiplier)
             self.state.turn_state.phase = TurnPhase.TURN_OVER
         elif prop_state.owner_id is None:
             self.state.turn_state.phase = TurnPhase.AWAIT_BUY_DECISION
             self.state.turn_state.pending_property_id = space.property_id
 
     def _calculate_rent(self, property_id: int, tenant_id: int) -> int:
-        prop_data = PROPERTY_DATA[property_id]
         prop_state = self.state.properties[property_id]
         owner_id = prop_state.owner_id
         if owner_id is None or owner_id == tenant_id:
             return 0
-        if prop_data.type == SpaceType.RAILROAD:
-            count = self._count_owned(owner_id, RAILROADS)
-            return prop_data.rents[count - 1]
-        if prop_data.type == SpaceType.UTILITY:
-            count = self._count_owned(owner_id, UTILITIES)
-            multiplier = 10 if count == 2 else 4
+        monopolies, railroads, utilities = self._ownership_counts()
+        kind = SPACE_KIND[property_id]
+        if kind == KIND_RAILROAD:
+            return RENT_TABLE[property_id][railroads[owner_id]]
+        if kind == KIND_UTILITY:
             dice_sum = sum(self.state.turn_state.last_roll or (0, 0))
-            return dice_sum * multiplier
-        rent_index = prop_state.houses
-        rent = prop_data.rents[rent_index]
-        if prop_state.houses == 0 and self._owns_group(owner_id, prop_data.color):
-            rent *= 2
-        return rent
+            return dice_sum * RENT_TABLE[property_id][utilities[owner_id]]
+        monopoly = monopolies.get(PROPERTY_DATA[property_id].color) == owner_id
+        return RENT_TABLE[property_id][street_rent_level(prop_state.houses, monopoly)]
+
+    def _ownership_counts(self) -> Tuple[Dict[str, int], List[int], List[int]]:
+        if self._ownership_cache is None:
+            properties = self.state.properties
+            monopolies: Dict[str, int] = {}
+            for color, prop_ids in PROPERTY_GROUPS.items():
+                owner_id = properties[prop_ids[0]].owner_id
+                if owner_id is not None and all(properties[prop_id].owner_id == owner_id for prop_id in prop_ids):
+                    monopolies[color] = owner_id
+            railroads = [0] * len(self.state.players)
+            utilities = [0] * len(self.state.players)
+            for counts, prop_ids in ((railroads, RAILROADS), (utilities, UTILITIES)):
+                for prop_id in prop_ids:
+                    prop_state = properties[prop_id]
+                    if prop_state.owner_id is not None and not prop_state.mortgaged:
+                        counts[prop_state.owner_id] += 1
+            self._ownership_cache = (monopolies, railroads, utilities)
+        return self._ownership_cache
+
+    def _set_owner(self, property_id: int, owner_id: Optional[int]) -> None:
+        self.state.properties[property_id].owner_id = owner_id
+        self._ownership_cache = None
+
+    def _set_mortgaged(self, property_id: int, mortgaged: bool) -> None:
+        self.state.properties[property_id].mortgaged = mortgaged
+        self._ownership_cache = None
+        self._refresh_group(property_id)
+
+    def _set_houses(self, property_id: int, houses: int) -> None:
+        self.state.properties[property_id].houses = houses
+        self._refresh_group(property_id)
+
+    def _group_levels(self) -> Dict[str, GroupLevels]:
+        if self._group_cache is None:
+            self._group_cache = {color: self._measure_group(color) for color in PROPERTY_GROUPS}
+        return self._group_cache
+
+    def _measure_group(self, color: str) -> GroupLevels:
+        properties = self.state.properties
+        houses = [properties[prop_id].houses for prop_id in PROPERTY_GROUPS[color]]
+        mortgaged = sum(properties[prop_id].mortgaged for prop_id in PROPERTY_GROUPS[color])
+        return min(houses), max(houses), mortgaged
+
+    def _refresh_group(self, property_id: int) -> None:
+        color = PROPERTY_DATA[property_id].color
+        if color is not None and self._group_cache is not None:
+            self._group_cache[color] = self._measure_group(color)
 
     def _pay_bank(self, player_id: int, amount: int) -> None:
         if amount <= 0:
@@ -590,14 +1132,37 @@ class GameEngine:
             raise InsufficientFunds(player_id, amount)
         player.cash -= amount
 
-    def _pay_player(self, from_player: int, to_player: int, amount: int) -> None:
+    def _settle(self, player_id: int, amount: int, creditor_id: Optional[int], cause: str) -> None:
         if amount <= 0:
             return
-        payer = self.state.players[from_player]
-        if payer.cash < amount:
-            raise InsufficientFunds(from_player, amount)
-        payer.cash -= amount
-        self.state.players[to_player].cash += amount
+        player = self.state.players[player_id]
+        if player.cash < amount:
+            self._raise_funds(player_id, amount - player.cash)
+            if player.cash < amount:
+                self._go_bankrupt(player_id, amount, creditor_id, cause)
+        player.cash -= amount
+        if creditor_id is not None:
+            self.state.players[creditor_id].cash += amount
+
+    def _raise_funds(self, player_id: int, shortfall: int) -> None:
+        holdings = [
+            (prop_id, prop_state.houses, prop_state.mortgaged)
+            for prop_id, prop_state in self.state.properties.items()
+            if prop_state.owner_id == player_id
+        ]
+        plan = plan_liquidation(shortfall, holdings, self.state.houses_available)
+        for action, prop_id in plan or ():
+            try:
+                getattr(self, action)(player_id, prop_id)
+            except GameRuleError:
+                return
+
+    def _go_bankrupt(self, player_id: int, amount: int, creditor_id: Optional[int], cause: str) -> None:
+        try:
+            self.declare_bankruptcy(player_id, creditor_id)
+        except InsufficientFunds:
+            self.declare_bankruptcy(player_id)
+        raise PlayerBankrupt(player_id, amount, creditor_id, cause)
 
     def _transfer_cash(self, from_player: int, to_player: int, amount: int) -> None:
         if amount <= 0:
@@ -611,7 +1176,7 @@ class GameEngine:
     def _transfer_properties(self, from_player: int, to_player: int, property_ids: List[int]) -> None:
         for prop_id in property_ids:
             self._require_owner(from_player, prop_id)
-            self.state.properties[prop_id].owner_id = to_player
+            self._set_owner(prop_id, to_player)
             self._handle_mortgage_transfer(to_player, prop_id)
 
     def _handle_mortgage_transfer(self, new_owner_id: int, property_id: int) -> None:
@@ -624,9 +1189,92 @@ class GameEngine:
         player = self.state.players[player_id]
         if player.cash < cash:
             raise InsufficientFunds(player_id, cash)
+        if len(set(properties)) != len(properties):
+            raise GameRuleError("Property listed more than once.")
         for prop_id in properties:
             self._require_owner(player_id, prop_id)
 
+    def _require_trade_interest(self, player_id: int, cash_change: int, property_ids: List[int]) -> None:
+        interest = self._transfer_interest(property_ids)
+        if self.state.players[player_id].cash + cash_change < interest:
+            raise InsufficientFunds(player_id, interest)
+
+    def can_mortgage(self, player_id: int, property_id: int) -> bool:
+        return self._mortgage_error(player_id, property_id) is None
+
+    def can_unmortgage(self, player_id: int, property_id: int) -> bool:
+        if self._unmortgage_error(player_id, property_id) is not None:
+            return False
+        return self.state.players[player_id].cash >= unmortgage_cost(property_id)
+
+    def can_build_house(self, player_id: int, property_id: int) -> bool:
+        if self._build_error(player_id, property_id) is not None:
+            return False
+        return self.state.players[player_id].cash >= (PROPERTY_DATA[property_id].house_cost or 0)
+
+    def can_sell_house(self, player_id: int, property_id: int) -> bool:
+        return self._sell_error(player_id, property_id) is None
+
+    def _owner_error(self, player_id: int, property_id: int) -> Optional[str]:
+        prop_state = self.state.properties.get(property_id)
+        if prop_state is None or prop_state.owner_id != player_id:
+            return "Player does not own the property."
+        return None
+
+    def _mortgage_error(self, player_id: int, property_id: int) -> Optional[str]:
+        error = self._owner_error(player_id, property_id)
+        if error is not None:
+            return error
+        if self.state.properties[property_id].mortgaged:
+            return "Property already mortgaged."
+        if self._group_has_houses(property_id):
+            return "Cannot mortgage while houses exist in group."
+        return None
+
+    def _unmortgage_error(self, player_id: int, property_id: int) -> Optional[str]:
+        error = self._owner_error(player_id, property_id)
+        if error is not None:
+            return error
+        if not self.state.properties[property_id].mortgaged:
+            return "Property is not mortgaged."
+        return None
+
+    def _build_error(self, player_id: int, property_id: int) -> Optional[str]:
+        error = self._owner_error(player_id, property_id)
+        if error is not None:
+            return error
+        prop_data = PROPERTY_DATA[property_id]
+        if prop_data.type != SpaceType.PROPERTY:
+            return "Can only build on color properties."
+        if not self._owns_group(player_id, prop_data.color):
+            return "Must own full color group to build."
+        if self._group_has_mortgage(prop_data.color):
+            return "Cannot build with mortgaged property in group."
+        houses = self.state.properties[property_id].houses
+        if houses >= 5:
+            return "Property already has a hotel."
+        if not self._can_build_evenly(property_id):
+            return "Must build evenly across the group."
+        if houses == 4:
+            if self.state.hotels_available < 1:
+                return "No hotels available."
+        elif self.state.houses_available < 1:
+            return "No houses available."
+        return None
+
+    def _sell_error(self, player_id: int, property_id: int) -> Optional[str]:
+        error = self._owner_error(player_id, property_id)
+        if error is not None:
+            return error
+        houses = self.state.properties[property_id].houses
+        if houses == 0:
+            return "No houses to sell."
+        if not self._can_sell_evenly(property_id):
+            return "Must sell evenly across the group."
+        if houses == 5 and self.state.houses_available < 4:
+            return "Not enough houses available to sell a hotel."
+        return None
+
     def _require_owner(self, player_id: int, property_id: int) -> None:
         if self.state.properties[property_id].owner_id != player_id:
             raise GameRuleError("Player does not own the property.")
@@ -634,37 +1282,30 @@ class GameEngine:
     def _owns_group(self, player_id: int, color: Optional[str]) -> bool:
         if color is None:
             return False
-        return all(self.state.properties[prop_id].owner_id == player_id for prop_id in PROPERTY_GROUPS[color])
+        return self._ownership_counts()[0].get(color) == player_id
 
     def _group_has_houses(self, property_id: int) -> bool:
         color = PROPERTY_DATA[property_id].color
         if color is None:
             return False
-        return any(self.state.properties[prop_id].houses > 0 for prop_id in PROPERTY_GROUPS[color])
+        return self._group_levels()[color][1] > 0
 
     def _group_has_mortgage(self, color: Optional[str]) -> bool:
         if color is None:
             return False
-        return any(self.state.properties[prop_id].mortgaged for prop_id in PROPERTY_GROUPS[color])
+        return self._group_levels()[color][2] > 0
 
     def _can_build_evenly(self, property_id: int) -> bool:
         color = PROPERTY_DATA[property_id].color
         if color is None:
             return False
-        houses = [self.state.properties[prop].houses for prop in PROPERTY_GROUPS[color]]
-        target = self.state.properties[property_id].houses
-        return target <= min(houses)
+        return self.state.properties[property_id].houses <= self._group_levels()[color][0]
 
     def _can_sell_evenly(self, property_id: int) -> bool:
         color = PROPERTY_DATA[property_id].color
         if color is None:
             return False
-        houses = [self.state.properties[prop].houses for prop in PROPERTY_GROUPS[color]]
-        target = self.state.properties[property_id].houses
-        return target >= max(houses)
-
-    def _count_owned(self, player_id: int, prop_ids: List[int]) -> int:
-        return sum(1 for prop_id in prop_ids if self.state.properties[prop_id].owner_id == player_id and not self.state.properties[prop_id].mortgaged)
+        return self.state.properties[property_id].houses >= self._group_levels()[color][1]
 
     def _find_nearest(self, player_id: int, targets: List[int]) -> int:
         player = self.state.players[player_id]
@@ -683,22 +1324,79 @@ class GameEngine:
                     houses += prop_state.houses
         return houses, hotels
 
+    def _house_sale_value(self, property_id: int) -> int:
+        houses = self.state.properties[property_id].houses
+        house_cost = PROPERTY_DATA[property_id].house_cost or 0
+        if houses == 5:
+            return int(house_cost * 5 * HOUSE_SELL_VALUE)
+        return int(house_cost * HOUSE_SELL_VALUE) * houses
+
     def _liquidate_houses(self, player_id: int) -> None:
         for prop_id, prop_state in self.state.properties.items():
             if prop_state.owner_id == player_id and prop_state.houses > 0:
-                prop_data = PROPERTY_DATA[prop_id]
                 if prop_state.houses == 5:
-                    sale_value = int((prop_data.house_cost or 0) * 5 * HOUSE_SELL_VALUE)
                     self.state.hotels_available = min(MAX_HOTELS, self.state.hotels_available + 1)
                     self.state.houses_available = min(MAX_HOUSES, self.state.houses_available + 4)
-                    self.state.players[player_id].cash += sale_value
                 else:
-                    sale_value = int((prop_data.house_cost or 0) * HOUSE_SELL_VALUE)
                     self.state.houses_available = min(MAX_HOUSES, self.state.houses_available + prop_state.houses)
-                    self.state.players[player_id].cash += sale_value * prop_state.houses
-                prop_state.houses = 0
+                self.state.players[player_id].cash += self._house_sale_value(prop_id)
+                self._set_houses(prop_id, 0)
 
     def _get_offer(self, offer_id: int) -> TradeOffer:
         if offer_id not in self.state.trade_offers:
             raise GameRuleError("Offer not found.")
         return self.state.trade_offers[offer_id]
+
+
+def _accepts(hint: Any, value: Any) -> bool:
+    if hint is int:
+        return type(value) is int
+    if hint is str:
+        return isinstance(value, str)
+    if hint is type(None):
+        return value is None
+    origin = get_origin(hint)
+    if origin is Union:
+        return any(_accepts(option, value) for option in get_args(hint))
+    if origin is list:
+        (item,) = get_args(hint)
+        return isinstance(value, list) and all(_accepts(item, entry) for entry in value)
+    return True
+
+
+def _action_params(name: str) -> Tuple[inspect.Signature, Dict[str, Any]]:
+    method = getattr(GameEngine, name)
+    hints = get_type_hints(method)
+    hints.pop("return", None)
+    return inspect.signature(method), hints
+
+
+ACTION_PARAMS: Dict[str, Tuple[inspect.Signature, Dict[str, Any]]] = {
+    name: _action_params(name) for name in sorted(RECORDED_ACTIONS)
+}
+PLAYER_PARAMS = frozenset({"player_id", "from_player", "to_player", "accepting_player", "creditor_id"})
+PROPERTY_PARAMS = frozenset({"property_id", "give_properties", "receive_properties"})
+
+
+def action_args_error(
+    name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any], num_players: Optional[int] = None
+) -> Optional[str]:
+    params = ACTION_PARAMS.get(name)
+    if params is None:
+        return f"Unknown action {name!r}."
+    signature, hints = params
+    try:
+        bound = signature.bind(None, *args, **kwargs)
+    except TypeError as exc:
+        return f"Invalid arguments for {name}: {exc}."
+    for param, value in bound.arguments.items():
+        hint = hints.get(param)
+        if hint is not None and not _accepts(hint, value):
+            return f"Invalid {param} for {name}."
+        if param in PLAYER_PARAMS and num_players is not None and value is not None and not 0 <= value < num_players:
+            return f"Unknown player for {name}."
+        if param in PROPERTY_PARAMS:
+            prop_ids = value if isinstance(value, list) else [value]
+            if any(prop_id not in PROPERTY_DATA for prop_id in prop_ids):
+                return f"Unknown property for {name}."
+    return None
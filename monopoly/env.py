@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .agents import GameDriver, Policy
+from .data import BOARD, JAIL_FINE, PROPERTY_DATA, START_CASH, SpaceType
+from .engine import PHASE_CODES, TURN_PHASES, GameEngine, GameRuleError, PlayerBankrupt, TurnPhase
+
+MAX_PLAYERS = 4
+DEFAULT_MAX_TURNS = 1000
+CASH_SCALE = float(START_CASH)
+BID_INCREMENTS = (10, 50, 100)
+
+PROPERTY_IDS = sorted(PROPERTY_DATA)
+STREET_IDS = [prop_id for prop_id in PROPERTY_IDS if PROPERTY_DATA[prop_id].type == SpaceType.PROPERTY]
+PROPERTY_SLOT = {prop_id: slot for slot, prop_id in enumerate(PROPERTY_IDS)}
+STREET_SLOT = {prop_id: slot for slot, prop_id in enumerate(STREET_IDS)}
+NUM_PROPERTIES = len(PROPERTY_IDS)
+BOARD_SIZE = len(BOARD)
+
+ROLL = 0
+BUY = 1
+DECLINE = 2
+JAIL_PAY = 3
+JAIL_CARD = 4
+JAIL_ROLL = 5
+END_TURN = 6
+PASS_BID = 7
+BID = 8
+BUILD = BID + len(BID_INCREMENTS)
+SELL = BUILD + len(STREET_IDS)
+MORTGAGE = SELL + len(STREET_IDS)
+UNMORTGAGE = MORTGAGE + NUM_PROPERTIES
+NUM_ACTIONS = UNMORTGAGE + NUM_PROPERTIES
+
+OWNER_OFFSET = 0
+HOUSES_OFFSET = OWNER_OFFSET + NUM_PROPERTIES * MAX_PLAYERS
+MORTGAGED_OFFSET = HOUSES_OFFSET + NUM_PROPERTIES
+PLAYER_OFFSET = MORTGAGED_OFFSET + NUM_PROPERTIES
+PLAYER_SIZE = BOARD_SIZE + 5
+PHASE_OFFSET = PLAYER_OFFSET + PLAYER_SIZE * MAX_PLAYERS
+PENDING_OFFSET = PHASE_OFFSET + len(TURN_PHASES)
+AUCTION_OFFSET = PENDING_OFFSET + NUM_PROPERTIES
+OBSERVATION_SIZE = AUCTION_OFFSET + 2 + MAX_PLAYERS
+
+
+def action_name(action: int) -> str:
+    simple = ("roll", "buy", "decline", "jail_pay", "jail_card", "jail_roll", "end_turn", "pass_bid")
+    if action < BID:
+        return simple[action]
+    if action < BUILD:
+        return f"bid+{BID_INCREMENTS[action - BID]}"
+    if action < SELL:
+        return f"build:{STREET_IDS[action - BUILD]}"
+    if action < MORTGAGE:
+        return f"sell:{STREET_IDS[action - SELL]}"
+    if action < UNMORTGAGE:
+        return f"mortgage:{PROPERTY_IDS[action - MORTGAGE]}"
+    return f"unmortgage:{PROPERTY_IDS[action - UNMORTGAGE]}"
+
+
+def encode_observation(engine: GameEngine, player_id: int, out: np.ndarray) -> np.ndarray:
+    state = engine.state
+    players = state.players
+    count = len(players)
+    out.fill(0.0)
+    for slot, prop_id in enumerate(PROPERTY_IDS):
+        prop = state.properties[prop_id]
+        if prop.owner_id is not None:
+            out[OWNER_OFFSET + slot * MAX_PLAYERS + (prop.owner_id - player_id) % count] = 1.0
+        out[HOUSES_OFFSET + slot] = prop.houses / 5.0
+        if prop.mortgaged:
+            out[MORTGAGED_OFFSET + slot] = 1.0
+    for player in players:
+        base = PLAYER_OFFSET + PLAYER_SIZE * ((player.player_id - player_id) % count)
+        out[base] = player.cash / CASH_SCALE
+        out[base + 1 + player.position] = 1.0
+        base += 1 + BOARD_SIZE
+        out[base] = player.in_jail
+        out[base + 1] = player.jail_turns / 3.0
+        out[base + 2] = len(player.get_out_of_jail_cards)
+        out[base + 3] = player.bankrupt
+    turn = state.turn_state
+    out[PHASE_OFFSET + PHASE_CODES[turn.phase]] = 1.0
+    auction = turn.pending_auction
+    pending = auction.property_id if auction is not None else turn.pending_property_id
+    if pending is not None:
+        out[PENDING_OFFSET + PROPERTY_SLOT[pending]] = 1.0
+    if auction is not None:
+        out[AUCTION_OFFSET] = auction.highest_bid / CASH_SCALE
+        out[AUCTION_OFFSET + 1] = auction.highest_bidder == player_id
+        for bidder in auction.active_bidders:
+            out[AUCTION_OFFSET + 2 + (bidder - player_id) % count] = 1.0
+    return out
+
+
+def encode_action_mask(engine: GameEngine, player_id: int, out: np.ndarray) -> np.ndarray:
+    state = engine.state
+    turn = state.turn_state
+    phase = turn.phase
+    player = state.players[player_id]
+    out.fill(False)
+    if player.bankrupt:
+        return out
+    if phase is TurnPhase.AWAIT_AUCTION:
+        auction = turn.pending_auction
+        if auction is not None and player_id in auction.active_bidders:
+            out[PASS_BID] = True
+            for idx, step in enumerate(BID_INCREMENTS):
+                out[BID + idx] = player.cash >= auction.highest_bid + step
+        return out
+    if player_id != state.current_player_index:
+        return out
+    if phase is TurnPhase.AWAIT_ROLL:
+        out[ROLL] = True
+    elif phase is TurnPhase.AWAIT_BUY_DECISION:
+        prop_id = turn.pending_property_id
+        out[BUY] = prop_id is not None and player.cash >= PROPERTY_DATA[prop_id].price
+        out[DECLINE] = True
+    elif phase is TurnPhase.AWAIT_JAIL_ACTION:
+        out[JAIL_PAY] = player.cash >= JAIL_FINE
+        out[JAIL_CARD] = bool(player.get_out_of_jail_cards)
+        out[JAIL_ROLL] = True
+    elif phase is TurnPhase.TURN_OVER:
+        out[END_TURN] = True
+    properties = state.properties
+    for slot, prop_id in enumerate(PROPERTY_IDS):
+        if properties[prop_id].owner_id != player_id:
+            continue
+        out[MORTGAGE + slot] = engine.can_mortgage(player_id, prop_id)
+        out[UNMORTGAGE + slot] = engine.can_unmortgage(player_id, prop_id)
+        street = STREET_SLOT.get(prop_id)
+        if street is not None:
+            out[BUILD + street] = engine.can_build_house(player_id, prop_id)
+            out[SELL + street] = engine.can_sell_house(player_id, prop_id)
+    return out
+
+
+class MonopolyEnv:
+    def __init__(
+        self,
+        num_players: int = 2,
+        seed: Optional[int] = None,
+        opponents: Optional[Sequence[Optional[Policy]]] = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        observation: Optional[np.ndarray] = None,
+        mask: Optional[np.ndarray] = None,
+    ) -> None:
+        if not (2 <= num_players <= MAX_PLAYERS):
+            raise GameRuleError("Game supports 2-4 players.")
+        seats = list(opponents) if opponents is not None else [None] * num_players
+        if len(seats) != num_players:
+            raise ValueError("Need exactly one opponent entry per seat.")
+        self.num_players = num_players
+        self.seats = seats
+        self.learners = [seat for seat, policy in enumerate(seats) if policy is None]
+        self.max_turns = max_turns
+        self.observation = np.zeros(OBSERVATION_SIZE, dtype=np.float32) if observation is None else observation
+        self.mask = np.zeros(NUM_ACTIONS, dtype=bool) if mask is None else mask
+        self._seeds = random.Random(seed)
+        self.engine: GameEngine
+        self.driver: GameDriver
+        self.player_id = 0
+        self._last_bidder: Optional[int] = None
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        if seed is not None:
+            self._seeds.seed(seed)
+        names = [f"P{seat + 1}" for seat in range(self.num_players)]
+        self.engine = GameEngine(names, seed=self._seeds.getrandbits(63), log_capacity=0)
+        self.engine.start_turn()
+        self.driver = GameDriver(self.engine, [policy or Policy() for policy in self.seats])
+        self._last_bidder = None
+        self._play_opponents()
+        return self._observe(), {"player": self.player_id}
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
+        if not self.mask[action]:
+            raise GameRuleError(f"Illegal action {action_name(action)}.")
+        actor = self.player_id
+        self._apply(actor, action)
+        self._play_opponents()
+        driver = self.driver
+        terminated = driver.finished() or self._learners_bankrupt()
+        truncated = not terminated and driver.turns >= self.max_turns
+        if self.engine.state.players[actor].bankrupt:
+            reward = -1.0
+        elif terminated:
+            reward = 1.0 if driver.winner() == actor else -1.0
+        else:
+            reward = 0.0
+        info = {"player": self.player_id, "actor": actor, "winner": driver.winner(), "turns": driver.turns}
+        return self._observe(), reward, terminated, truncated, info
+
+    def acting_player(self) -> int:
+        turn = self.engine.state.turn_state
+        auction = turn.pending_auction
+        if turn.phase is not TurnPhase.AWAIT_AUCTION or auction is None:
+            return self.engine.state.current_player_index
+        start = self.engine.state.current_player_index if self._last_bidder is None else self._last_bidder + 1
+        for offset in range(self.num_players):
+            bidder = (start + offset) % self.num_players
+            if bidder in auction.active_bidders and bidder != auction.highest_bidder:
+                return bidder
+        return next(iter(auction.active_bidders))
+
+    def _observe(self) -> np.ndarray:
+        player_id = self.player_id
+        encode_action_mask(self.engine, player_id, self.mask)
+        return encode_observation(self.engine, player_id, self.observation)
+
+    def _learners_bankrupt(self) -> bool:
+        players = self.engine.state.players
+        return bool(self.learners) and all(players[seat].bankrupt for seat in self.learners)
+
+    def _done(self) -> bool:
+        return self.driver.finished() or self.driver.turns >= self.max_turns or self._learners_bankrupt()
+
+    def _play_opponents(self) -> None:
+        while not self._done():
+            player_id = self.acting_player()
+            if self.engine.state.players[player_id].bankrupt:
+                self.driver.step()
+                continue
+            self.player_id = player_id
+            policy = self.seats[player_id]
+            if policy is None:
+                return
+            if self.engine.state.turn_state.phase is TurnPhase.AWAIT_AUCTION:
+                self._policy_bid(policy, player_id)
+            else:
+                self.driver.step()
+
+    def _policy_bid(self, policy: Policy, player_id: int) -> None:
+        engine = self.engine
+        auction = engine.state.turn_state.pending_auction
+        assert auction is not None
+        amount = policy.bid(engine, player_id, auction)
+        self._last_bidder = player_id
+        if amount is not None and auction.highest_bid < amount <= engine.state.players[player_id].cash:
+            engine.place_bid(player_id, amount)
+        else:
+            engine.pass_bid(player_id)
+        if engine.state.turn_state.phase is not TurnPhase.AWAIT_AUCTION:
+            self._last_bidder = None
+
+    def _apply(self, player_id: int, action: int) -> None:
+        engine = self.engine
+        try:
+            if action == ROLL:
+                engine.roll_dice()
+            elif action == BUY:
+                engine.buy_property()
+            elif action == DECLINE:
+                engine.decline_property()
+                self._last_bidder = None
+            elif action == JAIL_PAY:
+                engine.pay_jail_fine()
+            elif action == JAIL_CARD:
+                engine.use_get_out_of_jail_card(engine.state.players[player_id].get_out_of_jail_cards[0][0])
+            elif action == JAIL_ROLL:
+                engine.attempt_jail_roll()
+            elif action == END_TURN:
+                engine.end_turn()
+                self.driver.turns += 1
+            elif action == PASS_BID:
+                self._last_bidder = player_id
+                engine.pass_bid(player_id)
+            elif action < BUILD:
+                self._last_bidder = player_id
+                auction = engine.state.turn_state.pending_auction
+                assert auction is not None
+                engine.place_bid(player_id, auction.highest_bid + BID_INCREMENTS[action - BID])
+            elif action < SELL:
+                engine.build_house(player_id, STREET_IDS[action - BUILD])
+            elif action < MORTGAGE:
+                engine.sell_house(player_id, STREET_IDS[action - SELL])
+            elif action < UNMORTGAGE:
+                engine.mortgage_property(player_id, PROPERTY_IDS[action - MORTGAGE])
+            else:
+                engine.unmortgage_property(player_id, PROPERTY_IDS[action - UNMORTGAGE])
+        except PlayerBankrupt as exc:
+            for bust in exc.players():
+                self.driver.bankruptcies.append((bust.player_id, bust.cause))
+                self.driver.active -= 1
+        if engine.state.turn_state.phase is not TurnPhase.AWAIT_AUCTION:
+            self._last_bidder = None
+
+
+class VectorMonopolyEnv:
+    def __init__(
+        self,
+        num_envs: int,
+        num_players: int = 2,
+        seed: Optional[int] = None,
+        opponents: Optional[Sequence[Optional[Callable[[], Policy]]]] = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> None:
+        if num_envs < 1:
+            raise ValueError("Need at least one environment.")
+        seeds = random.Random(seed)
+        self.observations = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        self.masks = np.zeros((num_envs, NUM_ACTIONS), dtype=bool)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.players = np.zeros(num_envs, dtype=np.int8)
+        self.envs = [
+            MonopolyEnv(
+                num_players,
+                seeds.getrandbits(63),
+                None if opponents is None else [None if factory is None else factory() for factory in opponents],
+                max_turns,
+                self.observations[idx],
+                self.masks[idx],
+            )
+            for idx in range(num_envs)
+        ]
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.envs)
+
+    def reset(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        for idx, env in enumerate(self.envs):
+            env.reset()
+            self.players[idx] = env.player_id
+        return self.observations, {"player": self.players}
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        final_observation: List[Optional[np.ndarray]] = [None] * len(self.envs)
+        final_info: List[Optional[Dict[str, Any]]] = [None] * len(self.envs)
+        for idx, env in enumerate(self.envs):
+            observation, reward, terminated, truncated, info = env.step(int(actions[idx]))
+            self.rewards[idx] = reward
+            self.terminated[idx] = terminated
+            self.truncated[idx] = truncated
+            if terminated or truncated:
+                # reset() overwrites this row in place, so keep a copy of the terminal observation.
+                final_observation[idx] = observation.copy()
+                final_info[idx] = info
+                env.reset()
+            self.players[idx] = env.player_id
+        info = {"player": self.players, "final_observation": final_observation, "final_info": final_info}
+        return self.observations, self.rewards, self.terminated, self.truncated, info
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from collections import deque
+from enum import IntEnum
+from itertools import islice
+import struct
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import cards
+from .data import PROPERTY_DATA
+
+DEFAULT_CAPACITY = 1024
+NO_PLAYER = -1
+MAX_ARGS = 3
+SPILL_RECORD = struct.Struct("<BbB3i")
+
+Record = Tuple[int, int, Tuple[int, ...]]
+
+
+class EventType(IntEnum):
+    GAME_STARTED = 1
+    TURN_STARTED = 2
+    ROLLED = 3
+    JAIL_ROLLED = 4
+    JAIL_FINE_PAID = 5
+    JAIL_CARD_USED = 6
+    PROPERTY_BOUGHT = 7
+    AUCTION_STARTED = 8
+    BID_PLACED = 9
+    BID_PASSED = 10
+    AUCTION_WON = 11
+    AUCTION_UNSOLD = 12
+    TRADE_CREATED = 13
+    TRADE_CANCELLED = 14
+    TRADE_ACCEPTED = 15
+    MORTGAGED = 16
+    UNMORTGAGED = 17
+    HOUSE_BUILT = 18
+    HOUSE_SOLD = 19
+    BANKRUPT_TO_PLAYER = 20
+    BANKRUPT_TO_BANK = 21
+    ROLL_AGAIN = 22
+    SENT_TO_JAIL = 23
+    PASSED_GO = 24
+    CARD_DRAWN = 25
+    JAIL_CARD_KEPT = 26
+    LANDED = 27
+    RENT_PAID = 28
+
+
+TEMPLATES: Dict[int, str] = {
+    EventType.GAME_STARTED: "Game started.",
+    EventType.TURN_STARTED: "Turn started for {name}.",
+    EventType.ROLLED: "{name} rolled {0} and {1}.",
+    EventType.JAIL_ROLLED: "{name} rolled {0} and {1} in jail.",
+    EventType.JAIL_FINE_PAID: "{name} paid ${0} to leave jail.",
+    EventType.JAIL_CARD_USED: "{name} used a Get Out of Jail Free card.",
+    EventType.PROPERTY_BOUGHT: "{name} bought {prop} for ${1}.",
+    EventType.AUCTION_STARTED: "Auction started for {prop}.",
+    EventType.BID_PLACED: "{name} bid ${0}.",
+    EventType.BID_PASSED: "Player {id} passed in auction.",
+    EventType.AUCTION_WON: "{name} won auction for ${0}.",
+    EventType.AUCTION_UNSOLD: "Auction ended with no bids.",
+    EventType.TRADE_CREATED: "Trade offer {0} created by player {id}.",
+    EventType.TRADE_CANCELLED: "Trade offer {0} cancelled.",
+    EventType.TRADE_ACCEPTED: "Trade offer {0} accepted by player {id}.",
+    EventType.MORTGAGED: "Player {id} mortgaged {prop} for ${1}.",
+    EventType.UNMORTGAGED: "Player {id} unmortgaged {prop} for ${1}.",
+    EventType.HOUSE_BUILT: "Player {id} built on {prop}.",
+    EventType.HOUSE_SOLD: "Player {id} sold a house on {prop} for ${1}.",
+    EventType.BANKRUPT_TO_PLAYER: "Player {id} bankrupt to player {0}.",
+    EventType.BANKRUPT_TO_BANK: "Player {id} bankrupt to bank.",
+    EventType.ROLL_AGAIN: "{name} rolls again for doubles.",
+    EventType.SENT_TO_JAIL: "{name} sent to jail.",
+    EventType.PASSED_GO: "{name} collected ${0} for passing GO.",
+    EventType.CARD_DRAWN: "{name} drew card: {card}.",
+    EventType.JAIL_CARD_KEPT: "{name} kept a Get Out of Jail Free card.",
+    EventType.LANDED: "{name} landed on space {0}.",
+    EventType.RENT_PAID: "{name} paid ${1} rent for {prop}.",
+}
+PROPERTY_EVENTS = frozenset(
+    {
+        EventType.PROPERTY_BOUGHT,
+        EventType.AUCTION_STARTED,
+        EventType.MORTGAGED,
+        EventType.UNMORTGAGED,
+        EventType.HOUSE_BUILT,
+        EventType.HOUSE_SOLD,
+        EventType.RENT_PAID,
+    }
+)
+DECK_NAMES = ("chance", "community")
+DECKS = (cards.standard_chance_cards(), cards.standard_community_chest_cards())
+CARD_INDEX = tuple({card: idx for idx, card in reversed(list(enumerate(deck)))} for deck in DECKS)
+CARD_IDS = tuple({id(card): idx for idx, card in enumerate(deck)} for deck in DECKS)
+
+
+def card_code(deck_name: str, card: cards.Card) -> Tuple[int, int]:
+    deck = 0 if deck_name == DECK_NAMES[0] else 1
+    idx = CARD_IDS[deck].get(id(card))
+    return deck, CARD_INDEX[deck][card] if idx is None else idx
+
+
+def deck_codes(deck: int, deck_cards: Sequence[cards.Card]) -> bytes:
+    ids = CARD_IDS[deck]
+    try:
+        return bytes([ids[id(card)] for card in deck_cards])
+    except KeyError:
+        index = CARD_INDEX[deck]
+        return bytes([index[card] for card in deck_cards])
+
+
+def format_event(record: Record, player_names: Sequence[str]) -> str:
+    code, player_id, args = record
+    template = TEMPLATES[code]
+    name = player_names[player_id] if 0 <= player_id < len(player_names) else ""
+    prop = PROPERTY_DATA[args[0]].name if code in PROPERTY_EVENTS else ""
+    card = DECKS[args[0]][args[1]].description if code == EventType.CARD_DRAWN else ""
+    return template.format(*args, name=name, id=player_id, prop=prop, card=card)
+
+
+class EventSink:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: BinaryIO = open(path, "ab")
+
+    def write(self, record: Record) -> None:
+        code, player_id, args = record
+        padded = args + (0,) * (MAX_ARGS - len(args))
+        self._file.write(SPILL_RECORD.pack(code, player_id, len(args), *padded))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_spilled(path: str) -> Iterator[Record]:
+    with open(path, "rb") as handle:
+        data = handle.read()
+    for code, player_id, count, *args in SPILL_RECORD.iter_unpack(data):
+        yield code, player_id, tuple(args[:count])
+
+
+class EventLog:
+    def __init__(
+        self,
+        player_names: Sequence[str] = (),
+        capacity: int = DEFAULT_CAPACITY,
+        sink: Optional[EventSink] = None,
+    ) -> None:
+        self.player_names = list(player_names)
+        self.records: Deque[Record] = deque(maxlen=capacity)
+        self.sink = sink
+        self.enabled = capacity > 0 or sink is not None
+        self.total = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.records.maxlen or 0
+
+    def append(self, code: int, player_id: int, args: Tuple[int, ...]) -> None:
+        records = self.records
+        record = (code, player_id, args)
+        if self.sink is not None and len(records) == records.maxlen:
+            self.sink.write(records[0] if records else record)
+        records.append(record)
+        self.total += 1
+
+    def format(self, record: Record) -> str:
+        return format_event(record, self.player_names)
+
+    def recent(self, count: int) -> List[Record]:
+        if count <= 0:
+            return []
+        recent = list(islice(reversed(self.records), count))
+        recent.reverse()
+        return recent
+
+    def tail(self, count: int) -> List[str]:
+        return [format_event(record, self.player_names) for record in self.recent(count)]
+
+    def lines(self) -> List[str]:
+        return self.tail(len(self.records))
+
+    def copy(self) -> EventLog:
+        log = EventLog(self.player_names, self.capacity)
+        log.records.extend(self.records)
+        log.enabled = self.enabled
+        log.total = self.total
+        return log
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
@@ -0,0 +1,957 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+import random
+
+from . import cards
+from .data import (
+    GO_SALARY,
+    HOUSE_SELL_VALUE,
+    JAIL_FINE,
+    MAX_HOTELS,
+    MAX_HOUSES,
+    MORTGAGE_INTEREST_RATE,
+    RAILROADS,
+    START_CASH,
+    UTILITIES,
+)
+from .engine import GameRuleError, InsufficientFunds, PlayerBankrupt, TurnPhase
+from .liquidation import plan_liquidation
+from .tables import (
+    BOARD_SIZE,
+    GROUP_MEMBERS,
+    GROUP_NAMES,
+    GROUP_OF,
+    GROUP_SIZE,
+    HOUSE_COST,
+    KIND_CHANCE,
+    KIND_COMMUNITY,
+    KIND_GO_TO_JAIL,
+    KIND_OTHER,
+    KIND_RAILROAD,
+    KIND_STREET,
+    KIND_TAX,
+    KIND_UTILITY,
+    MORTGAGE,
+    PRICE,
+    PROPERTY_POSITIONS,
+    RENT_TABLE,
+    SPACE_KIND,
+    TAX,
+)
+
+NO_OWNER = -1
+JAIL_POSITION = 10
+
+CHANCE = 0
+COMMUNITY = 1
+DECK_NAMES = ("chance", "community")
+DECK_CARDS: Tuple[List[cards.Card], List[cards.Card]] = (
+    cards.standard_chance_cards(),
+    cards.standard_community_chest_cards(),
+)
+
+_PHASE_ROLL = TurnPhase.AWAIT_ROLL
+_PHASE_JAIL = TurnPhase.AWAIT_JAIL_ACTION
+_PHASE_BUY = TurnPhase.AWAIT_BUY_DECISION
+_PHASE_AUCTION = TurnPhase.AWAIT_AUCTION
+_PHASE_OVER = TurnPhase.TURN_OVER
+
+# Dice come from one randbytes() call per batch: bytes 252-255 are dropped so
+# the rest map uniformly onto 1-6 through bytes.translate.
+DICE_BATCH = 512
+_DIE_FACES = bytes(value % 6 + 1 for value in range(256))
+_DIE_REJECT = bytes(range(252, 256))
+
+
+class FastGameEngine:
+    # Slots keep attribute access in the turn loop off the instance dict.
+    __slots__ = (
+        "random",
+        "exact_dice",
+        "_rolls",
+        "_dice_at",
+        "names",
+        "num_players",
+        "cash",
+        "position",
+        "in_jail",
+        "jail_turns",
+        "bankrupt",
+        "jail_cards",
+        "owner",
+        "houses",
+        "mortgaged",
+        "street_rent",
+        "group_owned",
+        "monopolies",
+        "railroads_active",
+        "utilities_active",
+        "decks",
+        "current",
+        "turns_ended",
+        "phase",
+        "pending_property_id",
+        "last_roll",
+        "doubles_count",
+        "auction_property",
+        "auction_bid",
+        "auction_bidder",
+        "auction_bidders",
+        "houses_available",
+        "hotels_available",
+        "trade_offers",
+        "next_offer_id",
+    )
+
+    def __init__(self, player_names: List[str], seed: Optional[int] = None, exact_dice: bool = False) -> None:
+        if not (2 <= len(player_names) <= 4):
+            raise GameRuleError("Game supports 2-4 players.")
+        self.random = random.Random(seed)
+        # exact_dice draws each roll the way GameEngine does, so a seed plays
+        # out identically in both engines; otherwise rolls come from batches.
+        self.exact_dice = exact_dice
+        self._rolls: List[Tuple[int, int]] = []
+        self._dice_at = 0
+        count = len(player_names)
+        self.names = list(player_names)
+        self.num_players = count
+        self.cash = [START_CASH] * count
+        self.position = [0] * count
+        self.in_jail = [False] * count
+        self.jail_turns = [0] * count
+        self.bankrupt = [False] * count
+        self.jail_cards: List[List[Tuple[int, int]]] = [[] for _ in range(count)]
+        self.owner = [NO_OWNER] * BOARD_SIZE
+        self.houses = [0] * BOARD_SIZE
+        self.mortgaged = [False] * BOARD_SIZE
+        # Rent a street currently charges: 0 while unowned or mortgaged.
+        self.street_rent = [0] * BOARD_SIZE
+        self.group_owned = [[0] * len(GROUP_MEMBERS) for _ in range(count)]
+        self.monopolies: List[Set[int]] = [set() for _ in range(count)]
+        self.railroads_active = [0] * count
+        self.utilities_active = [0] * count
+        chance = list(range(len(DECK_CARDS[CHANCE])))
+        community = list(range(len(DECK_CARDS[COMMUNITY])))
+        self.random.shuffle(chance)
+        self.random.shuffle(community)
+        self.decks: Tuple[Deque[int], Deque[int]] = (deque(chance), deque(community))
+        self.current = 0
+        self.turns_ended = 0
+        self.phase = _PHASE_ROLL
+        self.pending_property_id: Optional[int] = None
+        self.last_roll: Optional[Tuple[int, int]] = None
+        self.doubles_count = 0
+        self.auction_property: Optional[int] = None
+        self.auction_bid = 0
+        self.auction_bidder: Optional[int] = None
+        self.auction_bidders: set = set()
+        self.houses_available = MAX_HOUSES
+        self.hotels_available = MAX_HOTELS
+        self.trade_offers: Dict[int, list] = {}
+        self.next_offer_id = 1
+
+    def current_player_id(self) -> int:
+        return self.current
+
+    def active_players(self) -> List[int]:
+        return [pid for pid in range(self.num_players) if not self.bankrupt[pid]]
+
+    def owns_group(self, player_id: int, color: Optional[str]) -> bool:
+        if color is None:
+            return False
+        return GROUP_NAMES.index(color) in self.monopolies[player_id]
+
+    def _new_turn_state(self, phase: TurnPhase) -> None:
+        self.phase = phase
+        self.pending_property_id = None
+        self.last_roll = None
+        self.doubles_count = 0
+        self.auction_property = None
+
+    def _advance_turn_index(self) -> None:
+        count = self.num_players
+        for _ in range(count):
+            self.current = (self.current + 1) % count
+            if not self.bankrupt[self.current]:
+                return
+        raise GameRuleError("No active players remain.")
+
+    def start_turn(self) -> None:
+        if self.bankrupt[self.current]:
+            self._advance_turn_index()
+        self._new_turn_state(_PHASE_JAIL if self.in_jail[self.current] else _PHASE_ROLL)
+
+    def roll_dice(self) -> Tuple[int, int]:
+        if self.phase is not _PHASE_ROLL:
+            raise GameRuleError("Not ready to roll dice.")
+        at = self._dice_at
+        try:
+            roll = self._rolls[at]
+        except IndexError:
+            roll = self._refill_dice()
+            at = 0
+        self._dice_at = at + 1
+        self.last_roll = roll
+        die1, die2 = roll
+        pid = self.current
+        if die1 == die2:
+            self.doubles_count += 1
+            if self.doubles_count == 3:
+                self.send_player_to_jail(pid)
+                self.phase = _PHASE_OVER
+                return die1, die2
+        target = self.position[pid] + die1 + die2
+        if target >= BOARD_SIZE:
+            self.cash[pid] += GO_SALARY
+            target -= BOARD_SIZE
+        self.position[pid] = target
+        self._resolve_landing()
+        return die1, die2
+
+    def _refill_dice(self) -> Tuple[int, int]:
+        if self.exact_dice:
+            # randint(1, 6) is 1 + _randbelow(6), which rejection-samples getrandbits(3).
+            getrandbits = self.random.getrandbits
+            faces = []
+            for _ in range(2):
+                value = getrandbits(3)
+                while value >= 6:
+                    value = getrandbits(3)
+                faces.append(value + 1)
+            self._rolls = [(faces[0], faces[1])]
+        else:
+            faces = iter(self.random.randbytes(DICE_BATCH).translate(_DIE_FACES, _DIE_REJECT))
+            self._rolls = list(zip(faces, faces))
+        return self._rolls[0]
+
+    def attempt_jail_roll(self) -> Tuple[int, int]:
+        if self.phase is not _PHASE_JAIL:
+            raise GameRuleError("Not awaiting jail action.")
+        pid = self.current
+        at = self._dice_at
+        try:
+            die1, die2 = self._rolls[at]
+        except IndexError:
+            die1, die2 = self._refill_dice()
+            at = 0
+        self._dice_at = at + 1
+        if die1 == die2:
+            self.in_jail[pid] = False
+            self.jail_turns[pid] = 0
+            self._new_turn_state(_PHASE_ROLL)
+            self._move(die1 + die2)
+            self._resolve_landing()
+            return die1, die2
+        self.jail_turns[pid] += 1
+        if self.jail_turns[pid] >= 3:
+            self._settle(pid, JAIL_FINE, None, "jail_fine")
+            self.in_jail[pid] = False
+            self.jail_turns[pid] = 0
+            self._new_turn_state(_PHASE_ROLL)
+            self._move(die1 + die2)
+            self._resolve_landing()
+        return die1, die2
+
+    def pay_jail_fine(self) -> None:
+        if self.phase is not _PHASE_JAIL:
+            raise GameRuleError("Not awaiting jail action.")
+        pid = self.current
+        self._pay_bank(pid, JAIL_FINE)
+        self.in_jail[pid] = False
+        self.jail_turns[pid] = 0
+        self.phase = _PHASE_ROLL
+
+    def use_get_out_of_jail_card(self, deck_name: str) -> None:
+        pid = self.current
+        deck = DECK_NAMES.index(deck_name) if deck_name in DECK_NAMES else COMMUNITY
+        held = self.jail_cards[pid]
+        for idx, (held_deck, card) in enumerate(held):
+            if DECK_NAMES[held_deck] == deck_name:
+                held.pop(idx)
+                self.decks[deck].append(card)
+                self.in_jail[pid] = False
+                self.jail_turns[pid] = 0
+                self.phase = _PHASE_ROLL
+                return
+        raise GameRuleError("No matching Get Out of Jail Free card.")
+
+    def buy_property(self) -> None:
+        if self.phase is not _PHASE_BUY:
+            raise GameRuleError("No property available to buy.")
+        prop_id = self.pending_property_id
+        if prop_id is None:
+            raise GameRuleError("No property pending.")
+        self._pay_bank(self.current, PRICE[prop_id])
+        self._set_owner(prop_id, self.current)
+        self.pending_property_id = None
+        self.phase = _PHASE_OVER
+
+    def decline_property(self) -> None:
+        if self.phase is not _PHASE_BUY:
+            raise GameRuleError("No property to decline.")
+        prop_id = self.pending_property_id
+        if prop_id is None:
+            raise GameRuleError("No property pending.")
+        self.auction_property = prop_id
+        self.auction_bid = 0
+        self.auction_bidder = None
+        self.auction_bidders = {pid for pid in range(self.num_players) if not self.bankrupt[pid]}
+        self.pending_property_id = None
+        self.phase = _PHASE_AUCTION
+
+    def place_bid(self, player_id: int, amount: int) -> None:
+        if self.phase is not _PHASE_AUCTION:
+            raise GameRuleError("No auction running.")
+        if self.auction_property is None:
+            raise GameRuleError("No auction state.")
+        if player_id not in self.auction_bidders:
+            raise GameRuleError("Player not in auction.")
+        if self.cash[player_id] < amount:
+            raise InsufficientFunds(player_id, amount)
+        if amount <= self.auction_bid:
+            raise GameRuleError("Bid must exceed highest bid.")
+        self.auction_bid = amount
+        self.auction_bidder = player_id
+
+    def pass_bid(self, player_id: int) -> None:
+        if self.phase is not _PHASE_AUCTION:
+            raise GameRuleError("No auction running.")
+        if self.auction_property is None:
+            raise GameRuleError("No auction state.")
+        self.auction_bidders.discard(player_id)
+        if len(self.auction_bidders) <= 1:
+            self._finalize_auction()
+
+    def _finalize_auction(self) -> None:
+        winner = self.auction_bidder
+        if winner is not None:
+            self._pay_bank(winner, self.auction_bid)
+            self._set_owner(self.auction_property, winner)
+        self.auction_property = None
+        self.phase = _PHASE_OVER
+
+    def create_trade_offer(
+        self,
+        from_player: int,
+        to_player: Optional[int],
+        give_cash: int,
+        give_properties: List[int],
+        receive_cash: int,
+        receive_properties: List[int],
+    ) -> int:
+        self._validate_trade_assets(from_player, give_cash, give_properties)
+        offer_id = self.next_offer_id
+        self.trade_offers[offer_id] = [
+            from_player,
+            to_player,
+            give_cash,
+            list(give_properties),
+            receive_cash,
+            list(receive_properties),
+            "open",
+        ]
+        self.next_offer_id += 1
+        return offer_id
+
+    def cancel_trade_offer(self, offer_id: int, player_id: int) -> None:
+        offer = self._get_offer(offer_id)
+        if offer[0] != player_id:
+            raise GameRuleError("Only offer creator can cancel.")
+        offer[6] = "cancelled"
+
+    def accept_trade_offer(self, offer_id: int, accepting_player: int) -> None:
+        offer = self._get_offer(offer_id)
+        from_player, to_player, give_cash, give_properties, receive_cash, receive_properties, status = offer
+        if status != "open":
+            raise GameRuleError("Offer is not open.")
+        if to_player is not None and to_player != accepting_player:
+            raise GameRuleError("Offer not addressed to this player.")
+        self._validate_trade_assets(from_player, give_cash, give_properties)
+        self._validate_trade_assets(accepting_player, receive_cash, receive_properties)
+        self._require_trade_interest(accepting_player, give_cash - receive_cash, give_properties)
+        self._require_trade_interest(from_player, receive_cash - give_cash, receive_properties)
+        self._transfer_cash(from_player, accepting_player, give_cash)
+        self._transfer_cash(accepting_player, from_player, receive_cash)
+        self._transfer_properties(from_player, accepting_player, give_properties)
+        self._transfer_properties(accepting_player, from_player, receive_properties)
+        offer[6] = "accepted"
+
+    def mortgage_property(self, player_id: int, property_id: int) -> None:
+        self._require_owner(player_id, property_id)
+        if self.mortgaged[property_id]:
+            raise GameRuleError("Property already mortgaged.")
+        if self._group_has_houses(property_id):
+            raise GameRuleError("Cannot mortgage while houses exist in group.")
+        self._set_mortgaged(property_id, True)
+        self.cash[player_id] += MORTGAGE[property_id]
+
+    def unmortgage_property(self, player_id: int, property_id: int) -> None:
+        self._require_owner(player_id, property_id)
+        if not self.mortgaged[property_id]:
+            raise GameRuleError("Property is not mortgaged.")
+        self._pay_bank(player_id, int(MORTGAGE[property_id] * (1 + MORTGAGE_INTEREST_RATE)))
+        self._set_mortgaged(property_id, False)
+
+    def build_house(self, player_id: int, property_id: int) -> None:
+        self._require_owner(player_id, property_id)
+        group = GROUP_OF[property_id]
+        if group < 0:
+            raise GameRuleError("Can only build on color properties.")
+        members = GROUP_MEMBERS[group]
+        if group not in self.monopolies[player_id]:
+            raise GameRuleError("Must own full color group to build.")
+        mortgaged = self.mortgaged
+        if any(mortgaged[prop] for prop in members):
+            raise GameRuleError("Cannot build with mortgaged property in group.")
+        houses = self.houses
+        current = houses[property_id]
+        if current >= 5:
+            raise GameRuleError("Property already has a hotel.")
+        if current > min(houses[prop] for prop in members):
+            raise GameRuleError("Must build evenly across the group.")
+        if current == 4:
+            if self.hotels_available < 1:
+                raise GameRuleError("No hotels available.")
+        elif self.houses_available < 1:
+            raise GameRuleError("No houses available.")
+        self._pay_bank(player_id, HOUSE_COST[property_id])
+        if current == 4:
+            self.hotels_available -= 1
+            self.houses_available = min(MAX_HOUSES, self.houses_available + 4)
+            houses[property_id] = 5
+        else:
+            self.houses_available -= 1
+            houses[property_id] = current + 1
+        self._refresh_street_rent(group)
+
+    def sell_house(self, player_id: int, property_id: int) -> None:
+        self._require_owner(player_id, property_id)
+        houses = self.houses
+        current = houses[property_id]
+        if current == 0:
+            raise GameRuleError("No houses to sell.")
+        group = GROUP_OF[property_id]
+        if group < 0 or current < max(houses[prop] for prop in GROUP_MEMBERS[group]):
+            raise GameRuleError("Must sell evenly across the group.")
+        if current == 5:
+            if self.houses_available < 4:
+                raise GameRuleError("Not enough houses available to sell a hotel.")
+            houses[property_id] = 4
+            self.hotels_available = min(MAX_HOTELS, self.hotels_available + 1)
+            self.houses_available -= 4
+            sale_value = int(HOUSE_COST[property_id] * 5 * HOUSE_SELL_VALUE)
+        else:
+            houses[property_id] = current - 1
+            self.houses_available = min(MAX_HOUSES, self.houses_available + 1)
+            sale_value = int(HOUSE_COST[property_id] * HOUSE_SELL_VALUE)
+        self._refresh_street_rent(group)
+        self.cash[player_id] += sale_value
+
+    def declare_bankruptcy(self, player_id: int, creditor_id: Optional[int] = None) -> None:
+        if self.bankrupt[player_id]:
+            raise GameRuleError("Player already bankrupt.")
+        if creditor_id == player_id:
+            raise GameRuleError("Player cannot be their own creditor.")
+        owner = self.owner
+        holdings = [prop_id for prop_id in PROPERTY_POSITIONS if owner[prop_id] == player_id]
+        if creditor_id is not None:
+            interest = self._transfer_interest(holdings)
+            proceeds = self.cash[player_id] + sum(self._house_sale_value(prop_id) for prop_id in holdings)
+            if self.cash[creditor_id] + proceeds < interest:
+                raise InsufficientFunds(creditor_id, interest)
+        self._liquidate_houses(player_id)
+        if creditor_id is not None:
+            self.cash[creditor_id] += self.cash[player_id] - interest
+            self.cash[player_id] = 0
+            for prop_id in holdings:
+                self._set_owner(prop_id, creditor_id)
+        else:
+            for prop_id in holdings:
+                self._set_mortgaged(prop_id, False)
+                self._set_owner(prop_id, NO_OWNER)
+                self.houses[prop_id] = 0
+        self.bankrupt[player_id] = True
+        self.in_jail[player_id] = False
+        if player_id == self.current:
+            self._new_turn_state(_PHASE_OVER)
+
+    def end_turn(self) -> None:
+        if self.phase is not _PHASE_OVER:
+            raise GameRuleError("Turn not complete.")
+        in_jail = self.in_jail
+        current = self.current
+        if not self.doubles_count or in_jail[current]:
+            bankrupt = self.bankrupt
+            count = self.num_players
+            for _ in range(count):
+                current = current + 1 if current + 1 < count else 0
+                if not bankrupt[current]:
+                    break
+            else:
+                raise GameRuleError("No active players remain.")
+            self.current = current
+        self.phase = _PHASE_JAIL if in_jail[current] else _PHASE_ROLL
+        self.pending_property_id = None
+        self.last_roll = None
+        self.doubles_count = 0
+        self.auction_property = None
+        self.turns_ended += 1
+
+    def play_quiet_turns(self, max_turns: int) -> int:
+        """Roll and end turns until one needs a decision; return how many ended.
+
+        Stops before a player in jail or able to build a house rolls, and after a
+        landing that leaves a purchase to decide. Each turn ends in the state
+        roll_dice() followed by end_turn() would leave; the common landings
+        are resolved inline because this loop is the simulator's hot path, and
+        last_roll is only set while something can read it.
+        """
+        if self.phase is not _PHASE_ROLL:
+            return 0
+        played = 0
+        monopolies = self.monopolies
+        in_jail = self.in_jail
+        bankrupt = self.bankrupt
+        position = self.position
+        cash = self.cash
+        owner = self.owner
+        mortgaged = self.mortgaged
+        street_rent = self.street_rent
+        decks = self.decks
+        next_seat = list(range(1, self.num_players)) + [0]
+        pid = self.current
+        rolls = self._rolls
+        at = self._dice_at
+        try:
+            while played < max_turns and not (monopolies[pid] and self._can_build_any(pid)):
+                try:
+                    roll = rolls[at]
+                except IndexError:
+                    roll = self._refill_dice()
+                    rolls = self._rolls
+                    at = 0
+                at += 1
+                die1, die2 = roll
+                doubles = die1 == die2
+                if doubles:
+                    self.doubles_count += 1
+                    if self.doubles_count == 3:
+                        self.last_roll = roll
+                        self.send_player_to_jail(pid)
+                        self.phase = _PHASE_OVER
+                        break
+                target = position[pid] + die1 + die2
+                if target >= BOARD_SIZE:
+                    cash[pid] += GO_SALARY
+                    target -= BOARD_SIZE
+                position[pid] = target
+                kind = SPACE_KIND[target]
+                if kind == KIND_OTHER:
+                    pass
+                elif kind <= KIND_UTILITY:
+                    holder = owner[target]
+                    if holder == pid:
+                        pass
+                    elif holder == NO_OWNER:
+                        self.last_roll = roll
+                        self.phase = _PHASE_BUY
+                        self.pending_property_id = target
+                        break
+                    else:
+                        if kind == KIND_STREET:
+                            rent = street_rent[target]
+                        elif mortgaged[target]:
+                            rent = 0
+                        else:
+                            self.last_roll = roll
+                            rent = self._rent(target, holder)
+                            self.last_roll = None
+                        if cash[pid] >= rent:
+                            cash[pid] -= rent
+                            cash[holder] += rent
+                        else:
+                            self._settle(pid, rent, holder, "rent")
+                elif kind == KIND_TAX:
+                    tax = TAX[target]
+                    if cash[pid] >= tax:
+                        cash[pid] -= tax
+                    else:
+                        self._settle(pid, tax, None, "tax")
+                elif kind == KIND_GO_TO_JAIL:
+                    self.send_player_to_jail(pid)
+                else:
+                    deck_id = CHANCE if kind == KIND_CHANCE else COMMUNITY
+                    deck = decks[deck_id]
+                    card = DECK_CARDS[deck_id][deck[0]]
+                    action = card.action
+                    if action == "collect":
+                        deck.rotate(-1)
+                        cash[pid] += card.amount or 0
+                    elif action == "pay":
+                        deck.rotate(-1)
+                        fee = card.amount or 0
+                        if cash[pid] >= fee:
+                            cash[pid] -= fee
+                        else:
+                            self._settle(pid, fee, None, "card")
+                    elif action == "move":
+                        deck.rotate(-1)
+                        destination = card.destination or 0
+                        if card.collect_go and destination < target:
+                            cash[pid] += GO_SALARY
+                        position[pid] = destination
+                        self.last_roll = roll
+                        self._resolve_landing()
+                        if self.phase is not _PHASE_OVER:
+                            break
+                        self.phase = _PHASE_ROLL
+                        self.last_roll = None
+                    else:
+                        self.last_roll = roll
+                        self._draw_card(deck_id)
+                        if self.phase is not _PHASE_OVER:
+                            break
+                        self.phase = _PHASE_ROLL
+                        self.last_roll = None
+                # end_turn(), with the phase already back at AWAIT_ROLL.
+                played += 1
+                if doubles:
+                    self.doubles_count = 0
+                    if not in_jail[pid]:
+                        continue
+                pid = next_seat[pid]
+                if bankrupt[pid]:
+                    self._advance_turn_index()
+                    pid = self.current
+                self.current = pid
+                if in_jail[pid]:
+                    self.phase = _PHASE_JAIL
+                    break
+        finally:
+            self._dice_at = at
+            self.turns_ended += played
+        return played
+
+    def _can_build_any(self, player_id: int) -> bool:
+        houses = self.houses
+        mortgaged = self.mortgaged
+        cash = self.cash[player_id]
+        for group in self.monopolies[player_id]:
+            members = GROUP_MEMBERS[group]
+            level = 5
+            for prop_id in members:
+                if mortgaged[prop_id]:
+                    break
+                if houses[prop_id] < level:
+                    level = houses[prop_id]
+            else:
+                if level < 5 and cash >= HOUSE_COST[members[0]]:
+                    if self.houses_available if level < 4 else self.hotels_available:
+                        return True
+        return False
+
+    def send_player_to_jail(self, player_id: int) -> None:
+        self.position[player_id] = JAIL_POSITION
+        self.in_jail[player_id] = True
+        self.jail_turns[player_id] = 0
+
+    def _move(self, steps: int) -> None:
+        pid = self.current
+        target = self.position[pid] + steps
+        if target >= BOARD_SIZE:
+            self.cash[pid] += GO_SALARY
+            target -= BOARD_SIZE
+        self.position[pid] = target
+
+    def _move_to(self, player_id: int, destination: int, collect_go: bool) -> None:
+        if collect_go and destination < self.position[player_id]:
+            self.cash[player_id] += GO_SALARY
+        self.position[player_id] = destination
+
+    def _resolve_landing(self) -> None:
+        pid = self.current
+        pos = self.position[pid]
+        kind = SPACE_KIND[pos]
+        if kind <= KIND_UTILITY and kind != KIND_OTHER:
+            owner = self.owner[pos]
+            if owner == NO_OWNER:
+                self.phase = _PHASE_BUY
+                self.pending_property_id = pos
+                return
+            if owner != pid and not self.mortgaged[pos]:
+                self._settle(pid, self._rent(pos, owner), owner, "rent")
+            self.phase = _PHASE_OVER
+        elif kind == KIND_CHANCE:
+            self._draw_card(CHANCE)
+        elif kind == KIND_COMMUNITY:
+            self._draw_card(COMMUNITY)
+        elif kind == KIND_TAX:
+            self._settle(pid, TAX[pos], None, "tax")
+            self.phase = _PHASE_OVER
+        elif kind == KIND_GO_TO_JAIL:
+            self.send_player_to_jail(pid)
+            self.phase = _PHASE_OVER
+        else:
+            self.phase = _PHASE_OVER
+
+    def _rent(self, pos: int, owner: int) -> int:
+        kind = SPACE_KIND[pos]
+        if kind == KIND_STREET:
+            return self.street_rent[pos]
+        if kind == KIND_RAILROAD:
+            return RENT_TABLE[pos][self.railroads_active[owner]]
+        return sum(self.last_roll or (0, 0)) * RENT_TABLE[pos][self.utilities_active[owner]]
+
+    def _draw_card(self, deck_id: int) -> None:
+        deck = self.decks[deck_id]
+        card_index = deck.popleft()
+        card = DECK_CARDS[deck_id][card_index]
+        pid = self.current
+        try:
+            if card.action == "get_out_of_jail":
+                self.jail_cards[pid].append((deck_id, card_index))
+            else:
+                deck.append(card_index)
+                self._apply_card(card, pid)
+        finally:
+            if self.phase is not _PHASE_BUY:
+                self.phase = _PHASE_OVER
+
+    def _apply_card(self, card: cards.Card, player_id: int) -> None:
+        action = card.action
+        if action == "collect":
+            self.cash[player_id] += card.amount or 0
+        elif action == "pay":
+            self._settle(player_id, card.amount or 0, None, "card")
+        elif action == "move":
+            self._move_to(player_id, card.destination or 0, card.collect_go)
+            self._resolve_landing()
+        elif action == "move_nearest_railroad":
+            self._move_to(player_id, self._find_nearest(player_id, RAILROADS), True)
+            self._resolve_card_landing(player_id, railroad_multiplier=2)
+        elif action == "move_nearest_utility":
+            self._move_to(player_id, self._find_nearest(player_id, UTILITIES), True)
+            self._resolve_card_landing(player_id, utility_multiplier=10)
+        elif action == "move_back":
+            self.position[player_id] = (self.position[player_id] - (card.amount or 0)) % BOARD_SIZE
+            self._resolve_landing()
+        elif action == "pay_each":
+            for other in range(self.num_players):
+                if other != player_id and not self.bankrupt[other]:
+                    self._settle(player_id, card.amount or 0, other, "card")
+        elif action == "collect_each":
+            bankrupt: Optional[PlayerBankrupt] = None
+            for other in range(self.num_players):
+                if other != player_id and not self.bankrupt[other]:
+                    try:
+                        self._settle(other, card.amount or 0, player_id, "card")
+                    except PlayerBankrupt as exc:
+                        if bankrupt is None:
+                            bankrupt = exc
+                        else:
+                            bankrupt.others.append(exc)
+            if bankrupt is not None:
+                raise bankrupt
+        elif action == "go_to_jail":
+            self.send_player_to_jail(player_id)
+        elif action == "repair":
+            house_count = 0
+            hotel_count = 0
+            owner = self.owner
+            for prop_id in PROPERTY_POSITIONS:
+                if owner[prop_id] == player_id:
+                    if self.houses[prop_id] == 5:
+                        hotel_count += 1
+                    else:
+                        house_count += self.houses[prop_id]
+            cost = (card.per_house or 0) * house_count + (card.per_hotel or 0) * hotel_count
+            self._settle(player_id, cost, None, "card")
+
+    def _resolve_card_landing(
+        self, player_id: int, railroad_multiplier: int = 0, utility_multiplier: int = 0
+    ) -> None:
+        pos = self.position[player_id]
+        owner = self.owner[pos]
+        if owner == NO_OWNER:
+            self.phase = _PHASE_BUY
+            self.pending_property_id = pos
+        elif owner != player_id:
+            if utility_multiplier:
+                rent = sum(self.last_roll or (0, 0)) * utility_multiplier
+            else:
+                rent = self._rent(pos, owner) * railroad_multiplier
+            self._settle(player_id, rent, owner, "rent")
+            self.phase = _PHASE_OVER
+
+    def _find_nearest(self, player_id: int, targets: List[int]) -> int:
+        position = self.position[player_id]
+        return min(((target - position) % BOARD_SIZE, target) for target in targets)[1]
+
+    def _pay_bank(self, player_id: int, amount: int) -> None:
+        if amount <= 0:
+            return
+        if self.cash[player_id] < amount:
+            raise InsufficientFunds(player_id, amount)
+        self.cash[player_id] -= amount
+
+    def _transfer_cash(self, from_player: int, to_player: int, amount: int) -> None:
+        if amount <= 0:
+            return
+        cash = self.cash
+        if cash[from_player] < amount:
+            raise InsufficientFunds(from_player, amount)
+        cash[from_player] -= amount
+        cash[to_player] += amount
+
+    def _settle(self, player_id: int, amount: int, creditor_id: Optional[int], cause: str) -> None:
+        if amount <= 0:
+            return
+        cash = self.cash
+        if cash[player_id] < amount:
+            self._raise_funds(player_id, amount - cash[player_id])
+            if cash[player_id] < amount:
+                self._go_bankrupt(player_id, amount, creditor_id, cause)
+        cash[player_id] -= amount
+        if creditor_id is not None:
+            cash[creditor_id] += amount
+
+    def _raise_funds(self, player_id: int, shortfall: int) -> None:
+        owner = self.owner
+        holdings = [
+            (prop_id, self.houses[prop_id], self.mortgaged[prop_id])
+            for prop_id in PROPERTY_POSITIONS
+            if owner[prop_id] == player_id
+        ]
+        plan = plan_liquidation(shortfall, holdings, self.houses_available)
+        for action, prop_id in plan or ():
+            try:
+                getattr(self, action)(player_id, prop_id)
+            except GameRuleError:
+                return
+
+    def _go_bankrupt(self, player_id: int, amount: int, creditor_id: Optional[int], cause: str) -> None:
+        try:
+            self.declare_bankruptcy(player_id, creditor_id)
+        except InsufficientFunds:
+            self.declare_bankruptcy(player_id)
+        raise PlayerBankrupt(player_id, amount, creditor_id, cause)
+
+    def _transfer_properties(self, from_player: int, to_player: int, property_ids: List[int]) -> None:
+        for prop_id in property_ids:
+            self._require_owner(from_player, prop_id)
+            self._set_owner(prop_id, to_player)
+            self._handle_mortgage_transfer(to_player, prop_id)
+
+    def _handle_mortgage_transfer(self, new_owner_id: int, property_id: int) -> None:
+        if self.mortgaged[property_id]:
+            self._pay_bank(new_owner_id, int(MORTGAGE[property_id] * MORTGAGE_INTEREST_RATE))
+
+    def _validate_trade_assets(self, player_id: int, cash: int, properties: List[int]) -> None:
+        if self.cash[player_id] < cash:
+            raise InsufficientFunds(player_id, cash)
+        if len(set(properties)) != len(properties):
+            raise GameRuleError("Property listed more than once.")
+        for prop_id in properties:
+            self._require_owner(player_id, prop_id)
+
+    def _require_trade_interest(self, player_id: int, cash_change: int, property_ids: List[int]) -> None:
+        interest = self._transfer_interest(property_ids)
+        if self.cash[player_id] + cash_change < interest:
+            raise InsufficientFunds(player_id, interest)
+
+    def _transfer_interest(self, property_ids: List[int]) -> int:
+        mortgaged = self.mortgaged
+        return sum(int(MORTGAGE[prop_id] * MORTGAGE_INTEREST_RATE) for prop_id in property_ids if mortgaged[prop_id])
+
+    def _require_owner(self, player_id: int, property_id: int) -> None:
+        if self.owner[property_id] != player_id:
+            raise GameRuleError("Player does not own the property.")
+
+    def _get_offer(self, offer_id: int) -> list:
+        if offer_id not in self.trade_offers:
+            raise GameRuleError("Offer not found.")
+        return self.trade_offers[offer_id]
+
+    def _group_has_houses(self, property_id: int) -> bool:
+        group = GROUP_OF[property_id]
+        if group < 0:
+            return False
+        return any(self.houses[prop] > 0 for prop in GROUP_MEMBERS[group])
+
+    def _set_owner(self, property_id: int, new_owner: int) -> None:
+        old_owner = self.owner[property_id]
+        if old_owner == new_owner:
+            return
+        group = GROUP_OF[property_id]
+        active = not self.mortgaged[property_id]
+        kind = SPACE_KIND[property_id]
+        if old_owner != NO_OWNER:
+            if group >= 0:
+                self.group_owned[old_owner][group] -= 1
+                self.monopolies[old_owner].discard(group)
+            elif active and kind == KIND_RAILROAD:
+                self.railroads_active[old_owner] -= 1
+            elif active and kind == KIND_UTILITY:
+                self.utilities_active[old_owner] -= 1
+        if new_owner != NO_OWNER:
+            if group >= 0:
+                self.group_owned[new_owner][group] += 1
+                if self.group_owned[new_owner][group] == GROUP_SIZE[group]:
+                    self.monopolies[new_owner].add(group)
+            elif active and kind == KIND_RAILROAD:
+                self.railroads_active[new_owner] += 1
+            elif active and kind == KIND_UTILITY:
+                self.utilities_active[new_owner] += 1
+        self.owner[property_id] = new_owner
+        if group >= 0:
+            self._refresh_street_rent(group)
+
+    def _set_mortgaged(self, property_id: int, mortgaged: bool) -> None:
+        if self.mortgaged[property_id] == mortgaged:
+            return
+        self.mortgaged[property_id] = mortgaged
+        owner = self.owner[property_id]
+        if owner == NO_OWNER:
+            return
+        if GROUP_OF[property_id] >= 0:
+            self._refresh_street_rent(GROUP_OF[property_id])
+        delta = -1 if mortgaged else 1
+        kind = SPACE_KIND[property_id]
+        if kind == KIND_RAILROAD:
+            self.railroads_active[owner] += delta
+        elif kind == KIND_UTILITY:
+            self.utilities_active[owner] += delta
+
+    def _refresh_street_rent(self, group: int) -> None:
+        owner = self.owner
+        for prop_id in GROUP_MEMBERS[group]:
+            holder = owner[prop_id]
+            if holder == NO_OWNER or self.mortgaged[prop_id]:
+                self.street_rent[prop_id] = 0
+            else:
+                built = self.houses[prop_id]
+                level = built + 1 if built else int(group in self.monopolies[holder])
+                self.street_rent[prop_id] = RENT_TABLE[prop_id][level]
+
+    def _house_sale_value(self, property_id: int) -> int:
+        count = self.houses[property_id]
+        if count == 5:
+            return int(HOUSE_COST[property_id] * 5 * HOUSE_SELL_VALUE)
+        return int(HOUSE_COST[property_id] * HOUSE_SELL_VALUE) * count
+
+    def _liquidate_houses(self, player_id: int) -> None:
+        owner = self.owner
+        houses = self.houses
+        for prop_id in PROPERTY_POSITIONS:
+            count = houses[prop_id]
+            if owner[prop_id] == player_id and count > 0:
+                if count == 5:
+                    self.hotels_available = min(MAX_HOTELS, self.hotels_available + 1)
+                    self.houses_available = min(MAX_HOUSES, self.houses_available + 4)
+                else:
+                    self.houses_available = min(MAX_HOUSES, self.houses_available + count)
+                self.cash[player_id] += self._house_sale_value(prop_id)
+                houses[prop_id] = 0
+                self._refresh_street_rent(GROUP_OF[prop_id])
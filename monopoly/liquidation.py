@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .data import HOUSE_SELL_VALUE, MAX_HOUSES, MORTGAGE_INTEREST_RATE
+from .tables import BOARD_SIZE, GROUP_MEMBERS, GROUP_OF, HOUSE_COST, MORTGAGE
+
+SELL_HOUSE = "sell_house"
+MORTGAGE_PROPERTY = "mortgage_property"
+HOTEL = 5
+HOTEL_BREAKDOWN = 4
+
+Holding = Tuple[int, int, bool]
+Step = Tuple[str, int]
+# Cash raised, value lost, the steps taken and the houses left in the bank afterwards.
+Option = Tuple[int, int, Tuple[Step, ...], int]
+Choice = Callable[[int], List[Option]]
+
+HOUSE_SALE: List[int] = [int(cost * HOUSE_SELL_VALUE) for cost in HOUSE_COST]
+HOTEL_SALE: List[int] = [int(cost * HOTEL * HOUSE_SELL_VALUE) for cost in HOUSE_COST]
+MORTGAGE_LOSS: List[int] = [int(value * (1 + MORTGAGE_INTEREST_RATE)) - value for value in MORTGAGE]
+HOUSE_LOSS: List[int] = [max(0, HOUSE_COST[pos] - HOUSE_SALE[pos]) for pos in range(BOARD_SIZE)]
+HOTEL_LOSS: List[int] = [max(0, HOUSE_COST[pos] - HOTEL_SALE[pos]) for pos in range(BOARD_SIZE)]
+
+
+def plan_liquidation(shortfall: int, holdings: Sequence[Holding], houses_available: int) -> Optional[List[Step]]:
+    if shortfall <= 0:
+        return []
+    houses: Dict[int, int] = {}
+    built = set()
+    free: List[int] = []
+    for prop_id, count, mortgaged in sorted(holdings):
+        houses[prop_id] = count
+        if count:
+            built.add(GROUP_OF[prop_id])
+        elif not mortgaged:
+            free.append(prop_id)
+    free = [prop_id for prop_id in free if GROUP_OF[prop_id] not in built]
+    raised = sum(MORTGAGE[prop_id] for prop_id in free)
+    if raised >= shortfall:
+        choices: List[Choice] = [partial(_mortgage_options, prop_id) for prop_id in free]
+        found = _cheapest(choices, shortfall, houses_available)
+        return None if found is None else list(found)
+    choices = [partial(_group_options, GROUP_MEMBERS[group], houses) for group in sorted(built)]
+    found = _cheapest(choices, shortfall - raised, houses_available)
+    if found is None:
+        return None
+    return [(MORTGAGE_PROPERTY, prop_id) for prop_id in free] + list(found)
+
+
+def _mortgage_options(prop_id: int, houses_available: int) -> List[Option]:
+    return [(MORTGAGE[prop_id], MORTGAGE_LOSS[prop_id], ((MORTGAGE_PROPERTY, prop_id),), houses_available)]
+
+
+def _group_options(members: Sequence[int], houses: Dict[int, int], houses_available: int) -> List[Option]:
+    levels = {prop_id: houses[prop_id] for prop_id in members}
+    options: List[Option] = []
+    steps: List[Step] = []
+    cash = 0
+    loss = 0
+    while True:
+        prop_id = max(members, key=levels.__getitem__)
+        count = levels[prop_id]
+        if count == 0:
+            break
+        if count == HOTEL:
+            if houses_available < HOTEL_BREAKDOWN:
+                return options
+            houses_available -= HOTEL_BREAKDOWN
+            cash += HOTEL_SALE[prop_id]
+            loss += HOTEL_LOSS[prop_id]
+        else:
+            houses_available = min(MAX_HOUSES, houses_available + 1)
+            cash += HOUSE_SALE[prop_id]
+            loss += HOUSE_LOSS[prop_id]
+        levels[prop_id] = count - 1
+        steps.append((SELL_HOUSE, prop_id))
+        options.append((cash, loss, tuple(steps), houses_available))
+    cleared = tuple(steps)
+    for mask in range(1, 1 << len(members)):
+        chosen = [prop_id for bit, prop_id in enumerate(members) if mask >> bit & 1]
+        options.append(
+            (
+                cash + sum(MORTGAGE[prop_id] for prop_id in chosen),
+                loss + sum(MORTGAGE_LOSS[prop_id] for prop_id in chosen),
+                cleared + tuple((MORTGAGE_PROPERTY, prop_id) for prop_id in chosen),
+                houses_available,
+            )
+        )
+    return options
+
+
+def _cheapest(choices: Sequence[Choice], target: int, houses_available: int) -> Optional[Tuple[Step, ...]]:
+    # States are keyed by cash raised and houses left in the bank, so a hotel broken down in one group
+    # only counts on the houses the earlier groups' steps left behind.
+    best: Dict[Tuple[int, int], Tuple[int, Tuple[Step, ...]]] = {(0, houses_available): (0, ())}
+    for choice in choices:
+        merged = dict(best)
+        options: Dict[int, List[Option]] = {}
+        for (cash, bank), (loss, steps) in best.items():
+            if cash >= target:
+                continue
+            if bank not in options:
+                options[bank] = choice(bank)
+            for gain, cost, more, left in options[bank]:
+                key = (min(target, cash + gain), left)
+                candidate = (loss + cost, steps + more)
+                current = merged.get(key)
+                if current is None or (candidate[0], len(candidate[1])) < (current[0], len(current[1])):
+                    merged[key] = candidate
+        best = merged
+    found: Optional[Tuple[int, Tuple[Step, ...]]] = None
+    for (cash, _), candidate in best.items():
+        if cash == target and (found is None or (candidate[0], len(candidate[1])) < (found[0], len(found[1]))):
+            found = candidate
+    return None if found is None else found[1]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .engine import GameEngine, GameRuleError
+
+CHECKPOINT_EVERY = 200
+FLUSH_INTERVAL = 0.05
+BATCH_SIZE = 512
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    players TEXT NOT NULL,
+    seed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS actions (
+    game_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL,
+    kwargs TEXT,
+    PRIMARY KEY (game_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkpoints (
+    game_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    snapshot BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quarantine (
+    game_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    error TEXT NOT NULL
+);
+"""
+
+_GAME = "game"
+_ACTION = "action"
+_CHECKPOINT = "checkpoint"
+_DELETE = "delete"
+_QUARANTINE = "quarantine"
+_FLUSH = "flush"
+
+
+@dataclass
+class RecoveredGame:
+    game_id: str
+    engine: GameEngine
+    seq: int
+
+
+def replay_action(engine: GameEngine, name: str, args: Sequence[Any], kwargs: Optional[Dict[str, Any]]) -> None:
+    try:
+        engine.apply_action(name, tuple(args), kwargs)
+    except GameRuleError:
+        pass
+
+
+class JournalRecorder:
+    def __init__(self, journal: GameJournal, game_id: str, engine: GameEngine, seq: int = 0) -> None:
+        self.journal = journal
+        self.game_id = game_id
+        self.engine = engine
+        self.seq = seq
+
+    def __call__(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self.extend([(name, args, kwargs)])
+
+    def extend(self, calls: Sequence[Tuple[str, Tuple[Any, ...], Dict[str, Any]]]) -> None:
+        # The engine already reflects every call, so a checkpoint can only be taken after the last one.
+        checkpoint = False
+        for name, args, kwargs in calls:
+            self.seq += 1
+            self.journal.append(self.game_id, self.seq, name, args, kwargs)
+            checkpoint = checkpoint or self.seq % self.journal.checkpoint_every == 0
+        if checkpoint:
+            self.journal.checkpoint(self.game_id, self.seq, self.engine)
+
+
+class GameJournal:
+    def __init__(
+        self,
+        path: str,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+        flush_interval: float = FLUSH_INTERVAL,
+        batch_size: int = BATCH_SIZE,
+        compact: bool = True,
+    ) -> None:
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1.")
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.compact = compact
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._queue: "queue.Queue[Optional[Tuple[Any, ...]]]" = queue.Queue()
+        self.last_error: Optional[Exception] = None
+        self.quarantined: Dict[str, str] = {}
+        self._writer = threading.Thread(target=self._run, name="game-journal", daemon=True)
+        self._writer.start()
+
+    def register(self, game_id: str, player_names: Sequence[str], seed: int) -> None:
+        self._queue.put((_GAME, game_id, json.dumps(list(player_names)), seed))
+
+    def append(self, game_id: str, seq: int, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self._queue.put((_ACTION, game_id, seq, name, args, kwargs))
+
+    def attach(self, game_id: str, engine: GameEngine, seq: int = 0) -> JournalRecorder:
+        recorder = JournalRecorder(self, game_id, engine, seq)
+        engine.action_listener = recorder
+        return recorder
+
+    def checkpoint(self, game_id: str, seq: int, engine: GameEngine) -> None:
+        self._queue.put((_CHECKPOINT, game_id, seq, engine.snapshot()))
+
+    def delete(self, game_id: str) -> None:
+        self._queue.put((_DELETE, game_id))
+
+    def quarantine(self, game_id: str, seq: int, error: str) -> None:
+        self.quarantined[game_id] = error
+        self._queue.put((_QUARANTINE, game_id, seq, error))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._conn.close()
+
+    def load(self) -> Iterator[RecoveredGame]:
+        conn = sqlite3.connect(self.path)
+        try:
+            games = conn.execute(
+                "SELECT game_id, players, seed FROM games"
+                " WHERE game_id NOT IN (SELECT game_id FROM quarantine) ORDER BY rowid"
+            ).fetchall()
+            for game_id, players, seed in games:
+                seq = 0
+                try:
+                    checkpoint = conn.execute(
+                        "SELECT seq, snapshot FROM checkpoints WHERE game_id = ?", (game_id,)
+                    ).fetchone()
+                    if checkpoint is None:
+                        engine = GameEngine(json.loads(players), seed=seed)
+                        engine.start_turn()
+                    else:
+                        seq, snapshot = checkpoint
+                        engine = GameEngine.restore(snapshot)
+                    rows = conn.execute(
+                        "SELECT seq, name, args, kwargs FROM actions WHERE game_id = ? AND seq > ? ORDER BY seq",
+                        (game_id, seq),
+                    ).fetchall()
+                    for seq, name, args, kwargs in rows:
+                        replay_action(engine, name, json.loads(args), json.loads(kwargs) if kwargs else None)
+                except Exception as exc:
+                    self.quarantine(game_id, seq, f"{type(exc).__name__}: {exc}")
+                    continue
+                yield RecoveredGame(game_id, engine, seq)
+        finally:
+            conn.close()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while item is not None and item[0] != _FLUSH and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+            try:
+                self._write(batch)
+            except Exception as exc:
+                self.last_error = exc
+                if len(batch) > 1:
+                    self._write_each(batch)
+            for entry in batch:
+                if entry is not None and entry[0] == _FLUSH:
+                    entry[1].set()
+            if batch[-1] is None:
+                return
+
+    def _write_each(self, batch: List[Optional[Tuple[Any, ...]]]) -> None:
+        for item in batch:
+            try:
+                self._write([item])
+            except Exception as exc:
+                self.last_error = exc
+
+    def _write(self, batch: List[Optional[Tuple[Any, ...]]]) -> None:
+        conn = self._conn
+        actions: List[Tuple[str, int, str, str, Optional[str]]] = []
+        with conn:
+            for item in batch:
+                if item is None:
+                    continue
+                kind = item[0]
+                if kind == _ACTION:
+                    _, game_id, seq, name, args, kwargs = item
+                    actions.append((game_id, seq, name, json.dumps(args), json.dumps(kwargs) if kwargs else None))
+                    continue
+                if actions:
+                    conn.executemany("INSERT OR REPLACE INTO actions VALUES (?, ?, ?, ?, ?)", actions)
+                    actions = []
+                if kind == _GAME:
+                    conn.execute("INSERT OR REPLACE INTO games VALUES (?, ?, ?)", item[1:])
+                elif kind == _CHECKPOINT:
+                    _, game_id, seq, snapshot = item
+                    conn.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", (game_id, seq, snapshot))
+                    if self.compact:
+                        conn.execute("DELETE FROM actions WHERE game_id = ? AND seq <= ?", (game_id, seq))
+                elif kind == _QUARANTINE:
+                    conn.execute("INSERT OR REPLACE INTO quarantine VALUES (?, ?, ?)", item[1:])
+                elif kind == _DELETE:
+                    for table in ("games", "actions", "checkpoints", "quarantine"):
+                        conn.execute(f"DELETE FROM {table} WHERE game_id = ?", (item[1],))
+            if actions:
+                conn.executemany("INSERT OR REPLACE INTO actions VALUES (?, ?, ?, ?, ?)", actions)
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+import sqlite3
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .agents import POLICIES, GameDriver, make_policy
+from .engine import PHASE_CODES, GameEngine, GameRuleError
+from .sim import DEFAULT_MAX_TURNS, game_seed
+
+Action = Tuple[str, List[Any], Optional[Dict[str, Any]]]
+
+
+def state_hash(engine: GameEngine) -> int:
+    return zlib.crc32(engine.snapshot(include_rng=False))
+
+
+def step_hash(engine: GameEngine) -> int:
+    state = engine.state
+    values = [state.version, state.current_player_index, PHASE_CODES[state.turn_state.phase]]
+    for player in state.players:
+        values += (player.cash, player.position, player.in_jail, player.bankrupt)
+    return zlib.crc32(array("q", values))
+
+
+def encode_action(action: Action) -> Any:
+    name, args, kwargs = action
+    if kwargs:
+        return [name, args, kwargs]
+    return [name, args] if args else name
+
+
+def decode_action(item: Any) -> Action:
+    if isinstance(item, str):
+        return item, [], None
+    return item[0], item[1], item[2] if len(item) > 2 else None
+
+
+def new_game(player_names: Sequence[str], seed: int) -> GameEngine:
+    engine = GameEngine(player_names, seed=seed, log_capacity=0)
+    engine.start_turn()
+    return engine
+
+
+@dataclass
+class GameRecord:
+    players: List[str]
+    seed: int
+    actions: List[Action] = field(default_factory=list)
+    hashes: List[int] = field(default_factory=list)
+    final_hash: Optional[int] = None
+
+    def to_json(self) -> str:
+        actions = [encode_action(action) for action in self.actions]
+        data: Dict[str, Any] = {"players": self.players, "seed": self.seed, "actions": actions}
+        if self.hashes:
+            data["hashes"] = self.hashes
+        if self.final_hash is not None:
+            data["final_hash"] = self.final_hash
+        return json.dumps(data, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> GameRecord:
+        data = json.loads(line)
+        actions = [decode_action(item) for item in data["actions"]]
+        return cls(data["players"], data["seed"], actions, data.get("hashes", []), data.get("final_hash"))
+
+
+class ActionRecorder:
+    def __init__(self, engine: GameEngine, seed: int, hashes: bool = False) -> None:
+        self.engine = engine
+        self.record = GameRecord([player.name for player in engine.state.players], seed)
+        self.hashes = hashes
+
+    def __call__(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self.record.actions.append((name, list(args), dict(kwargs) if kwargs else None))
+        if self.hashes:
+            self.record.hashes.append(step_hash(self.engine))
+
+    def finish(self) -> GameRecord:
+        self.record.final_hash = state_hash(self.engine)
+        return self.record
+
+
+@dataclass
+class Divergence:
+    step: int
+    action: Action
+    expected: int
+    actual: int
+
+
+@dataclass
+class ReplayResult:
+    steps: int
+    final_hash: int
+    divergence: Optional[Divergence] = None
+
+
+def replay(record: GameRecord, check_hashes: bool = True) -> ReplayResult:
+    engine = new_game(record.players, record.seed)
+    hashes = record.hashes if check_hashes else []
+    apply = engine.apply_action
+    for step, action in enumerate(record.actions):
+        name, args, kwargs = action
+        try:
+            apply(name, tuple(args), kwargs)
+        except GameRuleError:
+            pass
+        if step < len(hashes):
+            actual = step_hash(engine)
+            if actual != hashes[step]:
+                return ReplayResult(step + 1, actual, Divergence(step, action, hashes[step], actual))
+    final = state_hash(engine)
+    if check_hashes and record.final_hash is not None and final != record.final_hash:
+        step = len(record.actions)
+        return ReplayResult(step, final, Divergence(step, ("final", [], None), record.final_hash, final))
+    return ReplayResult(len(record.actions), final)
+
+
+def record_game(
+    player_names: Sequence[str],
+    seed: int,
+    policies: Optional[Sequence[str]] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    hashes: bool = False,
+) -> GameRecord:
+    engine = new_game(player_names, seed)
+    recorder = ActionRecorder(engine, seed, hashes)
+    engine.action_listener = recorder
+    names = policies or ["greedy"] * len(player_names)
+    GameDriver(engine, [make_policy(name, seed + seat) for seat, name in enumerate(names)]).play_game(max_turns)
+    engine.action_listener = None
+    return recorder.finish()
+
+
+def records_from_journal(path: str) -> Iterator[GameRecord]:
+    conn = sqlite3.connect(path)
+    try:
+        games = conn.execute("SELECT game_id, players, seed FROM games ORDER BY rowid").fetchall()
+        for game_id, players, seed in games:
+            rows = conn.execute(
+                "SELECT seq, name, args, kwargs FROM actions WHERE game_id = ? ORDER BY seq", (game_id,)
+            ).fetchall()
+            if rows and rows[0][0] != 1:
+                continue
+            actions = [(name, json.loads(args), json.loads(kwargs) if kwargs else None) for _, name, args, kwargs in rows]
+            yield GameRecord(json.loads(players), seed, actions)
+    finally:
+        conn.close()
+
+
+@dataclass
+class VerifySummary:
+    games: int = 0
+    steps: int = 0
+    divergences: List[Tuple[int, Divergence]] = field(default_factory=list)
+
+    def merge(self, other: VerifySummary) -> None:
+        self.games += other.games
+        self.steps += other.steps
+        self.divergences.extend(other.divergences)
+
+
+def verify_lines(start: int, lines: Sequence[str], check_hashes: bool = True) -> VerifySummary:
+    summary = VerifySummary()
+    for offset, line in enumerate(lines):
+        result = replay(GameRecord.from_json(line), check_hashes)
+        summary.games += 1
+        summary.steps += result.steps
+        if result.divergence is not None:
+            summary.divergences.append((start + offset, result.divergence))
+    return summary
+
+
+def _chunks(lines: Sequence[str], chunk_size: int) -> Iterator[Tuple[int, Sequence[str]]]:
+    for start in range(0, len(lines), chunk_size):
+        yield start, lines[start : start + chunk_size]
+
+
+def verify_corpus(
+    lines: Sequence[str],
+    workers: Optional[int] = None,
+    check_hashes: bool = True,
+    chunk_size: Optional[int] = None,
+) -> VerifySummary:
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, min(500, len(lines) // (workers * 4) or 1))
+    summary = VerifySummary()
+    if workers == 1:
+        for start, chunk in _chunks(lines, chunk_size):
+            summary.merge(verify_lines(start, chunk, check_hashes))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(verify_lines, start, chunk, check_hashes) for start, chunk in _chunks(lines, chunk_size)]
+            for future in futures:
+                summary.merge(future.result())
+    summary.divergences.sort(key=lambda item: item[0])
+    return summary
+
+
+def write_records(path: str, records: Iterable[GameRecord]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(record.to_json())
+            handle.write("\n")
+            count += 1
+    return count
+
+
+def read_lines(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [line for line in handle if line.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Record and deterministically replay Monopoly games.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="Play seeded games and write a replay corpus.")
+    record.add_argument("--games", type=int, default=100)
+    record.add_argument("--players", type=int, default=4, choices=[2, 3, 4])
+    record.add_argument("--seed", type=int, default=1)
+    record.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    record.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=None)
+    record.add_argument("--hashes", action="store_true", help="Store a state hash after every action.")
+    record.add_argument("--out", required=True)
+    export = commands.add_parser("export", help="Convert an uncompacted game journal into a replay corpus.")
+    export.add_argument("journal")
+    export.add_argument("--out", required=True)
+    verify = commands.add_parser("verify", help="Replay a corpus and report the first divergence per game.")
+    verify.add_argument("corpus")
+    verify.add_argument("--workers", type=int, default=None)
+    verify.add_argument("--no-hashes", action="store_true", help="Replay without checking state hashes.")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.command == "record":
+        players = [f"P{seat + 1}" for seat in range(args.players)]
+        records = (
+            record_game(players, game_seed(args.seed, index), args.policies, args.max_turns, args.hashes)
+            for index in range(args.games)
+        )
+        count = write_records(args.out, records)
+        print(f"Recorded {count} games to {args.out} in {time.perf_counter() - started:.2f}s")
+        return 0
+    if args.command == "export":
+        count = write_records(args.out, records_from_journal(args.journal))
+        print(f"Exported {count} games to {args.out}")
+        return 0
+
+    summary = verify_corpus(read_lines(args.corpus), args.workers, not args.no_hashes)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Replayed {summary.games} games ({summary.steps} actions) in {elapsed:.2f}s "
+        f"({summary.games / elapsed:.0f} games/s)"
+    )
+    for index, divergence in summary.divergences:
+        print(
+            f"Game {index}: diverged at step {divergence.step} ({divergence.action[0]}): "
+            f"expected {divergence.expected:08x}, got {divergence.actual:08x}"
+        )
+    return 1 if summary.divergences else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
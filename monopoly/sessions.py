@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import asdict
+import hashlib
+import json
+import secrets
+import threading
+import time
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from . import codec
+from .data import BOARD, PROPERTY_DATA
+from .engine import GameEngine, Player, PropertyState
+from .persistence import GameJournal
+
+EVENT_LOG_TAIL = 10
+CHANGE_HISTORY = 256
+
+
+def _build_board_json() -> bytes:
+    payload = {
+        "spaces": [asdict(space) for space in BOARD],
+        "properties": {str(prop_id): asdict(prop_data) for prop_id, prop_data in PROPERTY_DATA.items()},
+    }
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+
+
+BOARD_JSON = _build_board_json()
+BOARD_ETAG = f'"{hashlib.sha256(BOARD_JSON).hexdigest()[:32]}"'
+
+
+class GameNotFound(KeyError):
+    pass
+
+
+def serialize_player(player: Player) -> dict:
+    return {
+        "id": player.player_id,
+        "name": player.name,
+        "cash": player.cash,
+        "position": player.position,
+        "in_jail": player.in_jail,
+        "bankrupt": player.bankrupt,
+    }
+
+
+def serialize_property(prop_state: PropertyState) -> dict:
+    return {
+        "owner_id": prop_state.owner_id,
+        "houses": prop_state.houses,
+        "mortgaged": prop_state.mortgaged,
+    }
+
+
+def _serialize_turn(engine: GameEngine) -> dict:
+    state = engine.state
+    return {
+        "version": state.version,
+        "current_player": state.current_player_index,
+        "turn_phase": state.turn_state.phase,
+        "pending_property_id": state.turn_state.pending_property_id,
+        "last_roll": state.turn_state.last_roll,
+        "houses_available": state.houses_available,
+        "hotels_available": state.hotels_available,
+    }
+
+
+def serialize_state(engine: GameEngine) -> dict:
+    state = engine.state
+    payload = _serialize_turn(engine)
+    payload.update(
+        {
+            "started": True,
+            "players": [serialize_player(player) for player in state.players],
+            "event_log": state.event_log.tail(EVENT_LOG_TAIL),
+            "properties": {
+                str(prop_id): serialize_property(prop_state)
+                for prop_id, prop_state in state.properties.items()
+            },
+        }
+    )
+    return payload
+
+
+def format_sse(version: int, payload: dict) -> str:
+    return f"id: {version}\nevent: state\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+def encode_json(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class Spectator:
+    def __init__(self, loop: asyncio.AbstractEventLoop, binary: bool) -> None:
+        self.loop = loop
+        self.binary = binary
+        self.version = -1
+        self.skipped = 0
+        self.latest: Optional[bytes] = None
+        self.ready = asyncio.Event()
+
+    def offer(self, version: int, message: bytes) -> None:
+        if version <= self.version:
+            return
+        if self.latest is not None:
+            self.skipped += 1
+        self.version = version
+        self.latest = message
+        self.ready.set()
+
+    async def next(self) -> bytes:
+        await self.ready.wait()
+        self.ready.clear()
+        message, self.latest = self.latest, None
+        assert message is not None
+        return message
+
+
+def _deliver(spectators: List[Spectator], version: int, messages: Dict[bool, bytes]) -> None:
+    for spectator in spectators:
+        spectator.offer(version, messages[spectator.binary])
+
+
+class SpectatorFeed:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spectators: Set[Spectator] = set()
+
+    def __len__(self) -> int:
+        return len(self._spectators)
+
+    def wants(self, binary: bool) -> bool:
+        with self._lock:
+            return any(spectator.binary == binary for spectator in self._spectators)
+
+    def join(self, loop: asyncio.AbstractEventLoop, binary: bool = False) -> Spectator:
+        spectator = Spectator(loop, binary)
+        with self._lock:
+            self._spectators.add(spectator)
+        return spectator
+
+    def leave(self, spectator: Spectator) -> None:
+        with self._lock:
+            self._spectators.discard(spectator)
+
+    def publish(self, version: int, messages: Dict[bool, bytes]) -> None:
+        by_loop: Dict[asyncio.AbstractEventLoop, List[Spectator]] = {}
+        with self._lock:
+            for spectator in self._spectators:
+                by_loop.setdefault(spectator.loop, []).append(spectator)
+        for loop, spectators in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, spectators, version, messages)
+            except RuntimeError:
+                for spectator in spectators:
+                    self.leave(spectator)
+
+
+class EventBus:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[asyncio.Queue, Tuple[asyncio.AbstractEventLoop, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def wants(self, binary: bool) -> bool:
+        with self._lock:
+            return any(wanted == binary for _, wanted in self._subscribers.values())
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop, binary: bool = False) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._subscribers[queue] = (loop, binary)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def publish(self, message: Union[str, bytes], binary: bool = False) -> None:
+        with self._lock:
+            targets = [(queue, loop) for queue, (loop, wanted) in self._subscribers.items() if wanted == binary]
+        for queue, loop in targets:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+            except RuntimeError:
+                self.unsubscribe(queue)
+
+
+class GameSession:
+    def __init__(self, game_id: str, engine: GameEngine, now: float) -> None:
+        self.game_id = game_id
+        self.engine = engine
+        self.lock = threading.Lock()
+        # Guards only the waiter set, so long-polls can register on the event loop without taking self.lock.
+        self._waiters_lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self.last_access = now
+        self.bus = EventBus()
+        self.spectators = SpectatorFeed()
+        self.version = engine.state.version
+        self._payloads: Dict[bool, Tuple[int, bytes]] = {}
+        self._player_views = self._player_snapshot()
+        self._property_views = self._property_snapshot()
+        self._event_total = engine.state.event_log.total
+        self._changes: Deque[Tuple[int, int, FrozenSet[int], FrozenSet[int], int]] = deque(maxlen=CHANGE_HISTORY)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.game_id}-{self.version}"'
+
+    def commit(self) -> None:
+        version = self.engine.state.version
+        if version == self.version:
+            return
+        player_views = self._player_snapshot()
+        property_views = self._property_snapshot()
+        changed_players = frozenset(
+            idx for idx, view in enumerate(player_views) if view != self._player_views[idx]
+        )
+        changed_properties = frozenset(
+            prop_id for prop_id, view in property_views.items() if view != self._property_views[prop_id]
+        )
+        self._player_views = player_views
+        self._property_views = property_views
+        self._changes.append((self.version, version, changed_players, changed_properties, self._event_total))
+        self._event_total = self.engine.state.event_log.total
+        previous = self.version
+        self.version = version
+        self._wake_waiters()
+        if self.bus:
+            if self.bus.wants(False):
+                self.bus.publish(format_sse(version, self.delta(previous)))
+            if self.bus.wants(True):
+                self.bus.publish(codec.frame(self.encode(previous)), binary=True)
+        if self.spectators:
+            messages = {
+                binary: self.spectator_message(binary) for binary in (False, True) if self.spectators.wants(binary)
+            }
+            self.spectators.publish(version, messages)
+
+    def state_payload(self, binary: bool = False) -> bytes:
+        version = self.engine.state.version
+        cached = self._payloads.get(binary)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if binary:
+            data = codec.encode_state(self.engine, EVENT_LOG_TAIL)
+        else:
+            data = encode_json(serialize_state(self.engine))
+        self._payloads[binary] = (version, data)
+        return data
+
+    def spectator_message(self, binary: bool) -> bytes:
+        data = self.state_payload(binary)
+        if binary:
+            return codec.frame(data)
+        return b"".join((f"id: {self.version}\nevent: state\ndata: ".encode(), data, b"\n\n"))
+
+    def spectate(self, loop: asyncio.AbstractEventLoop, binary: bool = False) -> Spectator:
+        spectator = self.spectators.join(loop, binary)
+        spectator.offer(self.version, self.spectator_message(binary))
+        return spectator
+
+    def subscribe(
+        self, loop: asyncio.AbstractEventLoop, since: Optional[int] = None, binary: bool = False
+    ) -> asyncio.Queue:
+        queue = self.bus.subscribe(loop, binary)
+        if binary:
+            queue.put_nowait(codec.frame(self.encode(since)))
+            return queue
+        if since is None:
+            payload = serialize_state(self.engine)
+            payload["full"] = True
+        else:
+            payload = self.delta(since)
+        queue.put_nowait(format_sse(self.version, payload))
+        return queue
+
+    async def wait_for_change(self, since: int, timeout: float) -> bool:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._waiters_lock:
+            if self.version > since:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+
+    def _wake_waiters(self) -> None:
+        with self._waiters_lock:
+            waiters = list(self._waiters)
+            self._waiters.clear()
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass
+
+    def delta(self, since: int) -> dict:
+        changed = self._changed_since(since)
+        if changed is None:
+            payload = serialize_state(self.engine)
+            payload["full"] = True
+            return payload
+        players, properties = changed
+        state = self.engine.state
+        payload = _serialize_turn(self.engine)
+        payload.update(
+            {
+                "full": False,
+                "since": since,
+                "players": [serialize_player(state.players[idx]) for idx in sorted(players)],
+                "properties": {
+                    str(prop_id): serialize_property(state.properties[prop_id])
+                    for prop_id in sorted(properties)
+                },
+                "events": self._events_since(since),
+            }
+        )
+        return payload
+
+    def encode(self, since: Optional[int] = None) -> bytes:
+        changed = None if since is None else self._changed_since(since)
+        if changed is None:
+            return codec.encode_state(self.engine, EVENT_LOG_TAIL)
+        return codec.encode_delta(self.engine, since, changed[0], changed[1], self._event_count_since(since))
+
+    def _changed_since(self, since: int) -> Optional[Tuple[set, set]]:
+        oldest = self._changes[0][0] if self._changes else self.version
+        if not oldest <= since <= self.version:
+            return None
+        players: set = set()
+        properties: set = set()
+        for _, version, changed_players, changed_properties, _ in reversed(self._changes):
+            if version <= since:
+                break
+            players |= changed_players
+            properties |= changed_properties
+        return players, properties
+
+    def _events_since(self, since: int) -> List[str]:
+        return self.engine.state.event_log.tail(self._event_count_since(since))
+
+    def _event_count_since(self, since: int) -> int:
+        total = self._event_total
+        for _, version, _, _, events_before in reversed(self._changes):
+            if version <= since:
+                break
+            total = events_before
+        return self.engine.state.event_log.total - total
+
+    def _player_snapshot(self) -> List[Tuple[int, int, bool, bool]]:
+        return [
+            (player.cash, player.position, player.in_jail, player.bankrupt)
+            for player in self.engine.state.players
+        ]
+
+    def _property_snapshot(self) -> Dict[int, Tuple[Optional[int], int, bool]]:
+        return {
+            prop_id: (prop_state.owner_id, prop_state.houses, prop_state.mortgaged)
+            for prop_id, prop_state in self.engine.state.properties.items()
+        }
+
+
+class GameRegistry:
+    def __init__(
+        self,
+        max_games: int = 1000,
+        idle_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+        journal: Optional[GameJournal] = None,
+    ) -> None:
+        if max_games < 1:
+            raise ValueError("max_games must be at least 1.")
+        self.max_games = max_games
+        self.idle_ttl = idle_ttl
+        self.journal = journal
+        self._clock = clock
+        self._games: "OrderedDict[str, GameSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._games
+
+    def sessions(self) -> List[GameSession]:
+        with self._lock:
+            return list(self._games.values())
+
+    def create(self, player_names: List[str], seed: Optional[int] = None) -> GameSession:
+        if seed is None:
+            seed = secrets.randbits(63)
+        engine = GameEngine(player_names, seed=seed)
+        engine.start_turn()
+        with self._lock:
+            game_id = secrets.token_urlsafe(8)
+            while game_id in self._games:
+                game_id = secrets.token_urlsafe(8)
+            if self.journal is not None:
+                self.journal.register(game_id, player_names, seed)
+                self.journal.attach(game_id, engine)
+            return self._insert(game_id, engine)
+
+    def recover(self) -> int:
+        if self.journal is None:
+            return 0
+        recovered = 0
+        for game in self.journal.load():
+            with self._lock:
+                self.journal.attach(game.game_id, game.engine, game.seq)
+                self._insert(game.game_id, game.engine)
+            recovered += 1
+        return recovered
+
+    def _insert(self, game_id: str, engine: GameEngine) -> GameSession:
+        now = self._clock()
+        self._evict_expired(now)
+        while len(self._games) >= self.max_games:
+            self._drop(self._games.popitem(last=False)[0])
+        session = GameSession(game_id, engine, now)
+        self._games[game_id] = session
+        return session
+
+    def _drop(self, game_id: str) -> None:
+        if self.journal is not None:
+            self.journal.delete(game_id)
+
+    def get(self, game_id: str) -> GameSession:
+        with self._lock:
+            session = self._games.get(game_id)
+            if session is None:
+                raise GameNotFound(game_id)
+            now = self._clock()
+            if now - session.last_access > self.idle_ttl:
+                del self._games[game_id]
+                self._drop(game_id)
+                raise GameNotFound(game_id)
+            session.last_access = now
+            self._games.move_to_end(game_id)
+        return session
+
+    def peek(self, game_id: str) -> Optional[GameSession]:
+        with self._lock:
+            return self._games.get(game_id)
+
+    def remove(self, game_id: str) -> None:
+        with self._lock:
+            if self._games.pop(game_id, None) is None:
+                raise GameNotFound(game_id)
+            self._drop(game_id)
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            return self._evict_expired(self._clock())
+
+    def _evict_expired(self, now: float) -> int:
+        evicted = 0
+        while self._games:
+            game_id, session = next(iter(self._games.items()))
+            if now - session.last_access <= self.idle_ttl:
+                break
+            del self._games[game_id]
+            self._drop(game_id)
+            evicted += 1
+        return evicted
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+import hashlib
+import math
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .agents import POLICIES, GameDriver, GameResult, GreedyPolicy, make_policy
+from .data import JAIL_FINE
+from .engine import GameEngine, PlayerBankrupt, TurnPhase
+from .stats import StatsCollector
+from . import fast, tables
+
+DEFAULT_MAX_TURNS = 1000
+BUILD_RESERVE = 200
+
+
+def game_seed(master_seed: int, game_index: int) -> int:
+    digest = hashlib.blake2b(f"{master_seed}:{game_index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+@dataclass
+class SimulationSummary:
+    players: int
+    games: int = 0
+    draws: int = 0
+    wins: List[int] = field(default_factory=list)
+    turns_total: int = 0
+    turns_squared: int = 0
+    turns_min: Optional[int] = None
+    turns_max: Optional[int] = None
+    bankruptcy_causes: Dict[str, int] = field(default_factory=dict)
+    stats: Optional[StatsCollector] = None
+
+    def __post_init__(self) -> None:
+        if not self.wins:
+            self.wins = [0] * self.players
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        if result.winner is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner] += 1
+        self.turns_total += result.turns
+        self.turns_squared += result.turns * result.turns
+        self.turns_min = result.turns if self.turns_min is None else min(self.turns_min, result.turns)
+        self.turns_max = result.turns if self.turns_max is None else max(self.turns_max, result.turns)
+        for _, cause in result.bankruptcies:
+            self.bankruptcy_causes[cause] = self.bankruptcy_causes.get(cause, 0) + 1
+
+    def merge(self, other: SimulationSummary) -> None:
+        self.games += other.games
+        self.draws += other.draws
+        self.wins = [mine + theirs for mine, theirs in zip(self.wins, other.wins)]
+        self.turns_total += other.turns_total
+        self.turns_squared += other.turns_squared
+        for bound, pick in (("turns_min", min), ("turns_max", max)):
+            mine, theirs = getattr(self, bound), getattr(other, bound)
+            if theirs is not None:
+                setattr(self, bound, theirs if mine is None else pick(mine, theirs))
+        for cause, count in other.bankruptcy_causes.items():
+            self.bankruptcy_causes[cause] = self.bankruptcy_causes.get(cause, 0) + count
+        if other.stats is not None:
+            if self.stats is None:
+                self.stats = StatsCollector(other.stats.cash_stride, other.stats.cash_buckets)
+            self.stats.merge(other.stats)
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns_total / self.games if self.games else 0.0
+
+    @property
+    def stdev_turns(self) -> float:
+        if self.games < 2:
+            return 0.0
+        variance = (self.turns_squared - self.turns_total * self.turns_total / self.games) / (self.games - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+ENGINES = ("standard", "fast")
+
+_ROLL = TurnPhase.AWAIT_ROLL
+_BUY = TurnPhase.AWAIT_BUY_DECISION
+_JAIL = TurnPhase.AWAIT_JAIL_ACTION
+_AUCTION = TurnPhase.AWAIT_AUCTION
+_OVER = TurnPhase.TURN_OVER
+
+
+def play_game(
+    num_players: int,
+    seed: int,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    engine_kind: str = "standard",
+    policies: Optional[Sequence[str]] = None,
+    stats: Optional[StatsCollector] = None,
+) -> GameResult:
+    if engine_kind == "fast":
+        if policies and any(name != GreedyPolicy.name for name in policies):
+            raise ValueError("The fast engine only plays the greedy policy.")
+        if stats is not None:
+            raise ValueError("Statistics need the standard engine.")
+        return play_fast_game(num_players, seed, max_turns)
+    names = list(policies or [GreedyPolicy.name] * num_players)
+    if len(names) != num_players:
+        raise ValueError("Need exactly one policy per player.")
+    engine = GameEngine([f"P{i + 1}" for i in range(num_players)], seed=seed, log_capacity=0)
+    engine.start_turn()
+    seats = [make_policy(name, seed + seat) for seat, name in enumerate(names)]
+    tracker = stats.track(engine) if stats is not None else None
+    result = GameDriver(engine, seats).play_game(max_turns)
+    if tracker is not None:
+        tracker.finish()
+    return result
+
+
+def play_fast_game(
+    num_players: int, seed: int, max_turns: int = DEFAULT_MAX_TURNS, exact_dice: bool = False
+) -> GameResult:
+    engine = fast.FastGameEngine([f"P{i + 1}" for i in range(num_players)], seed=seed, exact_dice=exact_dice)
+    engine.start_turn()
+    bankruptcies: List[Tuple[int, str]] = []
+    active = num_players
+    cash = engine.cash
+    play_quiet_turns = engine.play_quiet_turns
+    # Each pass handles one decision and falls through to the next phase, so
+    # a jail fine or purchase does not cost an extra trip around the loop.
+    while engine.turns_ended < max_turns:
+        if active <= 1:
+            winners = engine.active_players()
+            return GameResult(winners[0] if winners else None, engine.turns_ended, bankruptcies)
+        pid = engine.current
+        try:
+            if engine.phase is _JAIL:
+                if cash[pid] >= JAIL_FINE * 4:
+                    engine.pay_jail_fine()
+                else:
+                    engine.attempt_jail_roll()
+            if engine.phase is _ROLL:
+                play_quiet_turns(max_turns - engine.turns_ended)
+                pid = engine.current
+                if engine.phase is _ROLL and engine.turns_ended < max_turns:
+                    _fast_build(engine, pid)
+                    engine.roll_dice()
+            if engine.phase is _BUY:
+                if cash[pid] >= tables.PRICE[engine.pending_property_id]:
+                    engine.buy_property()
+                else:
+                    engine.decline_property()
+            if engine.phase is _AUCTION:
+                for bidder in sorted(engine.auction_bidders):
+                    if engine.auction_property is None:
+                        break
+                    engine.pass_bid(bidder)
+        except PlayerBankrupt as exc:
+            for bust in exc.players():
+                bankruptcies.append((bust.player_id, bust.cause))
+                active -= 1
+        if engine.phase is _OVER and active > 1:
+            engine.end_turn()
+    return GameResult(None, engine.turns_ended, bankruptcies)
+
+
+def _fast_build(engine: fast.FastGameEngine, pid: int) -> None:
+    houses = engine.houses
+    for group in sorted(engine.monopolies[pid]):
+        members = tables.GROUP_MEMBERS[group]
+        if any(engine.mortgaged[prop_id] for prop_id in members):
+            continue
+        house_cost = tables.HOUSE_COST[members[0]]
+        while engine.cash[pid] - house_cost >= BUILD_RESERVE:
+            target = min(members, key=houses.__getitem__)
+            if houses[target] >= 5:
+                break
+            if houses[target] == 4 and engine.hotels_available < 1:
+                break
+            if houses[target] < 4 and engine.houses_available < 1:
+                break
+            engine.build_house(pid, target)
+
+
+def run_chunk(
+    start: int,
+    count: int,
+    master_seed: int,
+    num_players: int,
+    max_turns: int,
+    engine_kind: str = "standard",
+    policies: Optional[Sequence[str]] = None,
+    collect_stats: bool = False,
+) -> SimulationSummary:
+    summary = SimulationSummary(players=num_players, stats=StatsCollector() if collect_stats else None)
+    for game_index in range(start, start + count):
+        seed = game_seed(master_seed, game_index)
+        summary.add(play_game(num_players, seed, max_turns, engine_kind, policies, summary.stats))
+    return summary
+
+
+def _chunks(games: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, games, chunk_size):
+        yield start, min(chunk_size, games - start)
+
+
+def run_batch(
+    games: int,
+    num_players: int = 4,
+    master_seed: int = 1,
+    workers: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    chunk_size: Optional[int] = None,
+    engine_kind: str = "standard",
+    policies: Optional[Sequence[str]] = None,
+    collect_stats: bool = False,
+) -> SimulationSummary:
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, min(1000, games // (workers * 8) or 1))
+    summary = SimulationSummary(players=num_players)
+    if workers == 1:
+        for start, count in _chunks(games, chunk_size):
+            summary.merge(
+                run_chunk(start, count, master_seed, num_players, max_turns, engine_kind, policies, collect_stats)
+            )
+        return summary
+    chunks = _chunks(games, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for start, count in chunks:
+            pending.add(
+                pool.submit(
+                    run_chunk, start, count, master_seed, num_players, max_turns, engine_kind, policies, collect_stats
+                )
+            )
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary.merge(future.result())
+        for future in pending:
+            summary.merge(future.result())
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run many headless Monopoly games to completion.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=4, choices=[2, 3, 4])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--engine", choices=ENGINES, default="standard")
+    parser.add_argument("--policies", nargs="+", choices=sorted(POLICIES), default=None)
+    parser.add_argument("--stats", default=None, help="Write streaming game statistics to this .npz file.")
+    args = parser.parse_args()
+    if args.games < 1:
+        parser.error("--games must be at least 1.")
+    started = time.perf_counter()
+    summary = run_batch(
+        args.games,
+        args.players,
+        args.seed,
+        args.workers,
+        args.max_turns,
+        engine_kind=args.engine,
+        policies=args.policies,
+        collect_stats=args.stats is not None,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"Games: {summary.games} in {elapsed:.2f}s ({summary.games / elapsed:.0f} games/s)")
+    for seat, wins in enumerate(summary.wins):
+        print(f"P{seat + 1} win rate: {wins / summary.games:.3f}")
+    print(f"Draws (hit {args.max_turns} turns): {summary.draws / summary.games:.3f}")
+    print(
+        f"Game length: mean {summary.mean_turns:.1f}, stdev {summary.stdev_turns:.1f}, "
+        f"min {summary.turns_min}, max {summary.turns_max}"
+    )
+    print("Bankruptcy causes:")
+    for cause, count in sorted(summary.bankruptcy_causes.items(), key=lambda item: -item[1]):
+        print(f"  {cause}: {count}")
+    if summary.stats is not None:
+        summary.stats.save_npz(args.stats)
+        print(f"Statistics written to {args.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import GameEngine
+from .events import EventType
+from .tables import BOARD_SIZE
+
+QUANTILES = (0.5, 0.9, 0.99)
+DEFAULT_ACCURACY = 0.01
+DEFAULT_CASH_STRIDE = 10
+DEFAULT_CASH_BUCKETS = 100
+LANDED = int(EventType.LANDED)
+RENT_PAID = int(EventType.RENT_PAID)
+TURN_STARTED = int(EventType.TURN_STARTED)
+BANKRUPTCY_EVENTS = frozenset({int(EventType.BANKRUPT_TO_PLAYER), int(EventType.BANKRUPT_TO_BANK)})
+MONOPOLY_EVENTS = frozenset(
+    int(code)
+    for code in (EventType.PROPERTY_BOUGHT, EventType.AUCTION_WON, EventType.TRADE_ACCEPTED, EventType.BANKRUPT_TO_PLAYER)
+)
+
+
+@dataclass
+class RunningStats:
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: RunningStats) -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+@dataclass
+class QuantileSketch:
+    relative_accuracy: float = DEFAULT_ACCURACY
+    count: int = 0
+    zeros: int = 0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not (0.0 < self.relative_accuracy < 1.0):
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self._gamma = (1.0 + self.relative_accuracy) / (1.0 - self.relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("QuantileSketch only tracks non-negative values.")
+        self.count += 1
+        if value == 0:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy.")
+        self.count += other.count
+        self.zeros += other.zeros
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+
+    def quantile(self, q: float) -> float:
+        if not (0.0 <= q <= 1.0):
+            raise ValueError("Quantile must be between 0 and 1.")
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2.0 * self._gamma**key / (self._gamma + 1.0)
+        return 2.0 * self._gamma ** max(self.buckets) / (self._gamma + 1.0)
+
+
+@dataclass
+class Distribution:
+    stats: RunningStats = field(default_factory=RunningStats)
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, value: float) -> None:
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: Distribution) -> None:
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def columns(self, prefix: str) -> Dict[str, np.ndarray]:
+        stats = self.stats
+        empty = stats.count == 0
+        return {
+            f"{prefix}_count": np.array(stats.count),
+            f"{prefix}_mean": np.array(math.nan if empty else stats.mean),
+            f"{prefix}_std": np.array(math.nan if empty else stats.stdev),
+            f"{prefix}_min": np.array(math.nan if empty else stats.minimum),
+            f"{prefix}_max": np.array(math.nan if empty else stats.maximum),
+            f"{prefix}_quantiles": np.array([self.sketch.quantile(q) for q in QUANTILES]),
+        }
+
+
+@dataclass
+class StatsCollector:
+    cash_stride: int = DEFAULT_CASH_STRIDE
+    cash_buckets: int = DEFAULT_CASH_BUCKETS
+    games: int = 0
+    landings: List[int] = field(default_factory=lambda: [0] * BOARD_SIZE)
+    rent: List[RunningStats] = field(default_factory=lambda: [RunningStats() for _ in range(BOARD_SIZE)])
+    rent_paid: Distribution = field(default_factory=Distribution)
+    game_turns: Distribution = field(default_factory=Distribution)
+    first_monopoly_turn: Distribution = field(default_factory=Distribution)
+    bankruptcy_turn: Distribution = field(default_factory=Distribution)
+    cash: List[RunningStats] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.cash:
+            self.cash = [RunningStats() for _ in range(self.cash_buckets)]
+
+    def track(self, engine: GameEngine) -> GameTracker:
+        return GameTracker(self, engine)
+
+    def merge(self, other: StatsCollector) -> None:
+        if (other.cash_stride, other.cash_buckets) != (self.cash_stride, self.cash_buckets):
+            raise ValueError("Cannot merge collectors with different cash sampling.")
+        self.games += other.games
+        self.landings = [mine + theirs for mine, theirs in zip(self.landings, other.landings)]
+        for mine, theirs in zip(self.rent, other.rent):
+            mine.merge(theirs)
+        for name in ("rent_paid", "game_turns", "first_monopoly_turn", "bankruptcy_turn"):
+            getattr(self, name).merge(getattr(other, name))
+        for mine, theirs in zip(self.cash, other.cash):
+            mine.merge(theirs)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        columns: Dict[str, np.ndarray] = {
+            "games": np.array(self.games),
+            "quantiles": np.array(QUANTILES),
+            "landings": np.array(self.landings, dtype=np.int64),
+            "rent_count": np.array([stats.count for stats in self.rent], dtype=np.int64),
+            "rent_total": np.array([stats.total for stats in self.rent]),
+            "rent_mean": np.array([stats.mean for stats in self.rent]),
+            "rent_std": np.array([stats.stdev for stats in self.rent]),
+            "cash_turn": np.arange(self.cash_buckets, dtype=np.int64) * self.cash_stride,
+            "cash_count": np.array([stats.count for stats in self.cash], dtype=np.int64),
+            "cash_mean": np.array([stats.mean if stats.count else math.nan for stats in self.cash]),
+            "cash_std": np.array([stats.stdev if stats.count else math.nan for stats in self.cash]),
+        }
+        for name in ("rent_paid", "game_turns", "first_monopoly_turn", "bankruptcy_turn"):
+            columns.update(getattr(self, name).columns(name))
+        return columns
+
+    def save_npz(self, path: str) -> None:
+        np.savez_compressed(path, **self.to_arrays())
+
+
+class GameTracker:
+    def __init__(self, collector: StatsCollector, engine: GameEngine) -> None:
+        self.collector = collector
+        self.engine = engine
+        self.turns = 0
+        self.first_monopoly: Optional[int] = None
+        engine.event_listener = self
+
+    def __call__(self, code: int, player_id: int, args: Tuple[int, ...]) -> None:
+        collector = self.collector
+        if code == LANDED:
+            collector.landings[args[0]] += 1
+        elif code == RENT_PAID:
+            collector.rent[args[0]].add(args[1])
+            collector.rent_paid.add(args[1])
+        elif code == TURN_STARTED:
+            self._sample_cash()
+            self.turns += 1
+        elif code in BANKRUPTCY_EVENTS:
+            collector.bankruptcy_turn.add(self.turns)
+        if self.first_monopoly is None and code in MONOPOLY_EVENTS and self.engine._ownership_counts()[0]:
+            self.first_monopoly = self.turns
+            collector.first_monopoly_turn.add(self.turns)
+
+    def _sample_cash(self) -> None:
+        collector = self.collector
+        bucket, offset = divmod(self.turns, collector.cash_stride)
+        if offset or bucket >= collector.cash_buckets:
+            return
+        stats = collector.cash[bucket]
+        for player in self.engine.state.players:
+            if not player.bankrupt:
+                stats.add(player.cash)
+
+    def finish(self) -> None:
+        self.collector.games += 1
+        self.collector.game_turns.add(self.turns)
+        if self.engine.event_listener is self:
+            self.engine.event_listener = None
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from .data import BOARD, PROPERTY_DATA, PROPERTY_GROUPS, SpaceType
+
+BOARD_SIZE = len(BOARD)
+
+KIND_OTHER = 0
+KIND_STREET = 1
+KIND_RAILROAD = 2
+KIND_UTILITY = 3
+KIND_CHANCE = 4
+KIND_COMMUNITY = 5
+KIND_TAX = 6
+KIND_GO_TO_JAIL = 7
+
+_KIND_BY_TYPE = {
+    SpaceType.PROPERTY: KIND_STREET,
+    SpaceType.RAILROAD: KIND_RAILROAD,
+    SpaceType.UTILITY: KIND_UTILITY,
+    SpaceType.CHANCE: KIND_CHANCE,
+    SpaceType.COMMUNITY_CHEST: KIND_COMMUNITY,
+    SpaceType.TAX: KIND_TAX,
+    SpaceType.GO_TO_JAIL: KIND_GO_TO_JAIL,
+}
+
+GROUP_NAMES: List[str] = list(PROPERTY_GROUPS)
+GROUP_MEMBERS: List[List[int]] = [PROPERTY_GROUPS[color] for color in GROUP_NAMES]
+GROUP_SIZE: List[int] = [len(members) for members in GROUP_MEMBERS]
+SPACE_KIND: List[int] = [_KIND_BY_TYPE.get(space.type, KIND_OTHER) for space in BOARD]
+TAX: List[int] = [space.tax_amount or 0 for space in BOARD]
+PRICE: List[int] = [0] * BOARD_SIZE
+MORTGAGE: List[int] = [0] * BOARD_SIZE
+HOUSE_COST: List[int] = [0] * BOARD_SIZE
+GROUP_OF: List[int] = [-1] * BOARD_SIZE
+PROPERTY_POSITIONS: List[int] = sorted(PROPERTY_DATA)
+
+
+def _rent_row(prop_id: int) -> Tuple[int, ...]:
+    prop = PROPERTY_DATA[prop_id]
+    if prop.type == SpaceType.RAILROAD:
+        return tuple(prop.rents[count - 1] for count in range(len(prop.rents) + 1))
+    if prop.type == SpaceType.UTILITY:
+        return (4, 4, 10)
+    return (prop.rents[0], prop.rents[0] * 2) + tuple(prop.rents[1:])
+
+
+RENT_TABLE: List[Tuple[int, ...]] = [()] * BOARD_SIZE
+
+for _prop_id, _prop in PROPERTY_DATA.items():
+    PRICE[_prop_id] = _prop.price
+    MORTGAGE[_prop_id] = _prop.mortgage
+    HOUSE_COST[_prop_id] = _prop.house_cost or 0
+    RENT_TABLE[_prop_id] = _rent_row(_prop_id)
+for _group, _members in enumerate(GROUP_MEMBERS):
+    for _prop_id in _members:
+        GROUP_OF[_prop_id] = _group
+
+
+def street_rent_level(houses: int, monopoly: bool) -> int:
+    return houses + 1 if houses else int(monopoly)
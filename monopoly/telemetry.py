@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .sessions import GameRegistry
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.total
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+class HistogramFamily:
+    def __init__(self, name: str, help_text: str, label: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = tuple(buckets)
+        self.children: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, value: str) -> Histogram:
+        histogram = self.children.get(value)
+        if histogram is None:
+            with self._lock:
+                histogram = self.children.setdefault(value, Histogram(self.buckets))
+        return histogram
+
+    def observe(self, value: str, seconds: float) -> None:
+        self.labels(value).observe(seconds)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for value, histogram in sorted(self.children.items()):
+            counts, total = histogram.snapshot()
+            labels = f'{self.label}="{_escape(value)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels},le="{bound:g}"}} {cumulative}'
+            cumulative += counts[-1]
+            yield f'{self.name}_bucket{{{labels},le="+Inf"}} {cumulative}'
+            yield f"{self.name}_sum{{{labels}}} {total!r}"
+            yield f"{self.name}_count{{{labels}}} {cumulative}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.values: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value: str) -> None:
+        with self._lock:
+            self.values[value] = self.values.get(value, 0) + 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = sorted(self.values.items())
+        for value, count in values:
+            yield f'{self.name}{{{self.label}="{_escape(value)}"}} {count}'
+
+
+class Telemetry:
+    def __init__(self) -> None:
+        self.actions = HistogramFamily(
+            "monopoly_action_duration_seconds", "Time spent applying a game action under the session lock.", "action"
+        )
+        self.action_errors = Counter("monopoly_action_errors_total", "Game actions rejected by the rules.", "action")
+        self.timeouts = Counter(
+            "monopoly_action_timeouts_total", "Default actions applied after a turn or bid deadline expired.", "action"
+        )
+        self.serialization = HistogramFamily(
+            "monopoly_state_serialize_duration_seconds", "Time spent building game state payloads.", "mode"
+        )
+
+    def render(self, registry: Optional[GameRegistry] = None) -> str:
+        lines: List[str] = []
+        lines.extend(self.actions.render())
+        lines.extend(self.action_errors.render())
+        lines.extend(self.timeouts.render())
+        lines.extend(self.serialization.render())
+        if registry is not None:
+            lines.extend(_registry_lines(registry))
+        lines.extend(_process_lines())
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _metric(name: str, help_text: str, value: float, kind: str = "gauge") -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+
+
+def _registry_lines(registry: GameRegistry) -> List[str]:
+    sessions = registry.sessions()
+    buffered = 0
+    recorded = 0
+    subscribers = 0
+    spectators = 0
+    for session in sessions:
+        event_log = session.engine.state.event_log
+        buffered += len(event_log)
+        recorded += event_log.total
+        subscribers += len(session.bus)
+        spectators += len(session.spectators)
+    lines = _metric("monopoly_active_games", "Games currently held in memory.", len(sessions))
+    lines += _metric("monopoly_event_log_records", "Event records buffered across all game logs.", buffered)
+    lines += _metric("monopoly_event_log_total", "Events recorded by all live games since creation.", recorded)
+    lines += _metric("monopoly_event_subscribers", "Open server-sent event streams.", subscribers)
+    lines += _metric("monopoly_spectators", "Open read-only spectator streams.", spectators)
+    return lines
+
+
+def _process_lines() -> List[str]:
+    lines: List[str] = []
+    rss = _resident_bytes()
+    if rss is not None:
+        lines += _metric("process_resident_memory_bytes", "Resident memory size in bytes.", rss)
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        lines += _metric("process_max_resident_memory_bytes", "Peak resident memory size in bytes.", usage.ru_maxrss * 1024)
+        cpu = usage.ru_utime + usage.ru_stime
+        lines += _metric("process_cpu_seconds_total", "User and system CPU time spent.", cpu, "counter")
+    return lines
+
+
+def _resident_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            return int(handle.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
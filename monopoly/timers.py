@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .engine import GameEngine, GameRuleError, TurnPhase
+from .sessions import GameRegistry, GameSession
+
+DEFAULT_TURN_TIMEOUT = 60.0
+DEFAULT_BID_TIMEOUT = 15.0
+LOCK_RETRY = 0.05
+MAX_SLEEP = 1.0
+
+DEFAULT_ACTIONS: Dict[TurnPhase, str] = {
+    TurnPhase.AWAIT_ROLL: "roll_dice",
+    TurnPhase.AWAIT_JAIL_ACTION: "attempt_jail_roll",
+    TurnPhase.AWAIT_BUY_DECISION: "decline_property",
+    TurnPhase.TURN_OVER: "end_turn",
+}
+
+TimeoutListener = Callable[[str, str], None]
+
+
+def default_action(engine: GameEngine) -> Optional[str]:
+    state = engine.state
+    if sum(not player.bankrupt for player in state.players) <= 1:
+        return None
+    phase = state.turn_state.phase
+    if phase == TurnPhase.AWAIT_AUCTION:
+        return "pass_bid" if state.turn_state.pending_auction is not None else None
+    return DEFAULT_ACTIONS.get(phase)
+
+
+def apply_default(engine: GameEngine, action: str) -> None:
+    if action != "pass_bid":
+        engine.apply_action(action)
+        return
+    turn_state = engine.state.turn_state
+    auction = turn_state.pending_auction
+    if auction is None:
+        return
+    for bidder in sorted(auction.active_bidders):
+        if turn_state.pending_auction is None:
+            return
+        if bidder != auction.highest_bidder:
+            engine.pass_bid(bidder)
+
+
+class TurnTimers:
+    def __init__(
+        self,
+        registry: GameRegistry,
+        turn_timeout: float = DEFAULT_TURN_TIMEOUT,
+        bid_timeout: float = DEFAULT_BID_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+        on_timeout: Optional[TimeoutListener] = None,
+    ) -> None:
+        if turn_timeout <= 0 or bid_timeout <= 0:
+            raise ValueError("Timeouts must be positive.")
+        self.registry = registry
+        self.turn_timeout = turn_timeout
+        self.bid_timeout = bid_timeout
+        self.on_timeout = on_timeout
+        self._clock = clock
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._deadlines: Dict[str, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def deadline(self, game_id: str) -> Optional[float]:
+        entry = self._deadlines.get(game_id)
+        return None if entry is None else entry[0]
+
+    def touch(self, session: GameSession) -> None:
+        state = session.engine.state
+        if sum(not player.bankrupt for player in state.players) <= 1:
+            self.cancel(session.game_id)
+            return
+        auction = state.turn_state.phase == TurnPhase.AWAIT_AUCTION
+        self._schedule(session.game_id, session.version, self.bid_timeout if auction else self.turn_timeout)
+
+    def cancel(self, game_id: str) -> None:
+        with self._lock:
+            self._deadlines.pop(game_id, None)
+
+    def _schedule(self, game_id: str, version: int, delay: float) -> None:
+        due = self._clock() + delay
+        with self._lock:
+            self._deadlines[game_id] = (due, version)
+            earliest = self._heap[0][0] if self._heap else None
+            heapq.heappush(self._heap, (due, next(self._counter), game_id, version))
+            if len(self._heap) > 2 * len(self._deadlines) + 64:
+                self._compact()
+        if (earliest is None or due < earliest) and self._loop is not None and self._wake is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass
+
+    def _compact(self) -> None:
+        live = self._deadlines
+        self._heap = [entry for entry in self._heap if live.get(entry[2]) == (entry[0], entry[3])]
+        heapq.heapify(self._heap)
+
+    def _pop_due(self, now: float) -> List[Tuple[str, int]]:
+        due: List[Tuple[str, int]] = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                when, _, game_id, version = heapq.heappop(heap)
+                if self._deadlines.get(game_id) == (when, version):
+                    del self._deadlines[game_id]
+                    due.append((game_id, version))
+        return due
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            heap = self._heap
+            while heap and self._deadlines.get(heap[0][2]) != (heap[0][0], heap[0][3]):
+                heapq.heappop(heap)
+            return heap[0][0] if heap else None
+
+    def fire_due(self, now: Optional[float] = None) -> int:
+        fired = 0
+        for game_id, version in self._pop_due(self._clock() if now is None else now):
+            session = self.registry.peek(game_id)
+            if session is None:
+                continue
+            if not session.lock.acquire(blocking=False):
+                self._schedule(game_id, version, LOCK_RETRY)
+                continue
+            try:
+                if session.version != version:
+                    self.touch(session)
+                    continue
+                action = self._expire(session)
+            finally:
+                session.lock.release()
+            if action is not None:
+                fired += 1
+                if self.on_timeout is not None:
+                    self.on_timeout(game_id, action)
+        return fired
+
+    def _expire(self, session: GameSession) -> Optional[str]:
+        action = default_action(session.engine)
+        try:
+            if action is not None:
+                apply_default(session.engine, action)
+        except GameRuleError:
+            pass
+        finally:
+            session.commit()
+            self.touch(session)
+        return action
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        try:
+            while True:
+                self._wake.clear()
+                self.fire_due()
+                due = self.next_due()
+                delay = MAX_SLEEP if due is None else min(MAX_SLEEP, max(0.0, due - self._clock()))
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._loop = None
+            self._wake = None
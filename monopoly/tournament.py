@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from itertools import combinations, islice
+import json
+import os
+import struct
+import time
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .agents import POLICIES, GameResult
+from .sim import DEFAULT_MAX_TURNS, game_seed, play_game
+
+FORMATS = ("round_robin", "swiss")
+RESULTS_MAGIC = b"MNT1"
+RESULTS_HEADER = struct.Struct("<4sI")
+RESULT_RECORD = struct.Struct("<IH4b")
+NO_SEAT = -1
+MAX_RECORDED_TURNS = 0xFFFF
+
+Outcome = Tuple[int, int, Tuple[int, ...]]
+
+
+@dataclass
+class TournamentConfig:
+    entrants: List[str]
+    seats: int = 4
+    format: str = "round_robin"
+    rounds: int = 1
+    games_per_match: int = 4
+    seed: int = 1
+    max_turns: int = DEFAULT_MAX_TURNS
+    k_factor: float = 24.0
+    initial_rating: float = 1500.0
+
+    def __post_init__(self) -> None:
+        if not (2 <= self.seats <= 4):
+            raise ValueError("Tournaments support 2-4 seats.")
+        if len(set(self.entrants)) != len(self.entrants) or len(self.entrants) < self.seats:
+            raise ValueError("Need at least one distinct entrant per seat.")
+        unknown = [name for name in self.entrants if name not in POLICIES]
+        if unknown:
+            raise ValueError(f"Unknown policy {unknown[0]!r}.")
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown tournament format {self.format!r}.")
+        if self.rounds < 1 or self.games_per_match < 1:
+            raise ValueError("Rounds and games per match must be positive.")
+        if not (0 < self.max_turns <= MAX_RECORDED_TURNS):
+            raise ValueError(f"max_turns must be between 1 and {MAX_RECORDED_TURNS}.")
+
+    def to_json(self) -> bytes:
+        return json.dumps(asdict(self), sort_keys=True, separators=(",", ":")).encode()
+
+
+@dataclass
+class Match:
+    index: int
+    entrants: Tuple[str, ...]
+
+
+def placements(result: GameResult, num_players: int) -> Tuple[int, ...]:
+    ranks = [0] * num_players
+    busted = len(result.bankruptcies)
+    for order, (player_id, _) in enumerate(result.bankruptcies):
+        ranks[player_id] = busted - order
+    return tuple(ranks)
+
+
+@dataclass
+class Standings:
+    entrants: List[str]
+    k_factor: float = 24.0
+    initial_rating: float = 1500.0
+    ratings: Dict[str, float] = field(default_factory=dict)
+    games: Dict[str, int] = field(default_factory=dict)
+    wins: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for name in self.entrants:
+            self.ratings.setdefault(name, self.initial_rating)
+            self.games.setdefault(name, 0)
+            self.wins.setdefault(name, 0)
+
+    def record(self, seats: Sequence[str], ranks: Sequence[int]) -> None:
+        ratings = self.ratings
+        k_pair = self.k_factor / (len(seats) - 1)
+        deltas = [0.0] * len(seats)
+        for i, j in combinations(range(len(seats)), 2):
+            expected = 1.0 / (1.0 + 10.0 ** ((ratings[seats[j]] - ratings[seats[i]]) / 400.0))
+            score = 1.0 if ranks[i] < ranks[j] else 0.5 if ranks[i] == ranks[j] else 0.0
+            deltas[i] += k_pair * (score - expected)
+            deltas[j] -= k_pair * (score - expected)
+        for seat, name in enumerate(seats):
+            ratings[name] += deltas[seat]
+            self.games[name] += 1
+        if ranks.count(0) == 1:
+            self.wins[seats[ranks.index(0)]] += 1
+
+    def leaderboard(self) -> List[Tuple[str, float, int, int]]:
+        rows = [(name, self.ratings[name], self.games[name], self.wins[name]) for name in self.entrants]
+        return sorted(rows, key=lambda row: (-row[1], self.entrants.index(row[0])))
+
+
+def round_robin_tables(entrants: Sequence[str], seats: int) -> List[Tuple[str, ...]]:
+    return list(combinations(entrants, seats))
+
+
+def swiss_tables(standings: Standings, seats: int, byes: Dict[str, int]) -> List[Tuple[str, ...]]:
+    entrants = standings.entrants
+    order = sorted(entrants, key=lambda name: (-standings.ratings[name], entrants.index(name)))
+    extra = len(order) % seats
+    resting: Set[str] = set()
+    if extra:
+        resting = set(sorted(order, key=lambda name: (byes.get(name, 0), -order.index(name)))[:extra])
+        for name in resting:
+            byes[name] = byes.get(name, 0) + 1
+    playing = [name for name in order if name not in resting]
+    return [tuple(playing[start : start + seats]) for start in range(0, len(playing), seats)]
+
+
+def expand_tables(tables: Sequence[Tuple[str, ...]], games_per_match: int, start: int) -> Iterator[Match]:
+    index = start
+    for table in tables:
+        for game in range(games_per_match):
+            shift = game % len(table)
+            yield Match(index, table[shift:] + table[:shift])
+            index += 1
+
+
+def schedule(config: TournamentConfig, standings: Standings) -> Iterator[Iterator[Match]]:
+    if config.format == "round_robin":
+        tables = round_robin_tables(config.entrants, config.seats)
+        per_round = len(tables) * config.games_per_match
+        yield (
+            match
+            for round_index in range(config.rounds)
+            for match in expand_tables(tables, config.games_per_match, round_index * per_round)
+        )
+        return
+    byes: Dict[str, int] = {}
+    start = 0
+    for _ in range(config.rounds):
+        tables = swiss_tables(standings, config.seats, byes)
+        yield expand_tables(tables, config.games_per_match, start)
+        start += len(tables) * config.games_per_match
+
+
+def play_matches(matches: Sequence[Match], master_seed: int, max_turns: int) -> List[Outcome]:
+    outcomes: List[Outcome] = []
+    for match in matches:
+        seats = len(match.entrants)
+        result = play_game(seats, game_seed(master_seed, match.index), max_turns, policies=match.entrants)
+        outcomes.append((match.index, min(result.turns, MAX_RECORDED_TURNS), placements(result, seats)))
+    return outcomes
+
+
+def encode_outcome(outcome: Outcome) -> bytes:
+    index, turns, ranks = outcome
+    padded = tuple(ranks) + (NO_SEAT,) * (4 - len(ranks))
+    return RESULT_RECORD.pack(index, turns, *padded)
+
+
+def decode_outcomes(data: bytes) -> Iterator[Outcome]:
+    usable = len(data) - len(data) % RESULT_RECORD.size
+    for index, turns, *ranks in RESULT_RECORD.iter_unpack(data[:usable]):
+        yield index, turns, tuple(rank for rank in ranks if rank != NO_SEAT)
+
+
+class ResultsFile:
+    def __init__(self, path: str, config: TournamentConfig) -> None:
+        self.path = path
+        self.completed: Dict[int, Outcome] = {}
+        header = config.to_json()
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as handle:
+                data = handle.read()
+            magic, length = RESULTS_HEADER.unpack_from(data)
+            if magic != RESULTS_MAGIC:
+                raise ValueError("Not a tournament results file.")
+            body = RESULTS_HEADER.size + length
+            if data[RESULTS_HEADER.size : body] != header:
+                raise ValueError("Results file was written for a different tournament.")
+            records = data[body:]
+            for outcome in decode_outcomes(records):
+                self.completed[outcome[0]] = outcome
+            self.handle: BinaryIO = open(path, "r+b")
+            self.handle.truncate(body + len(records) - len(records) % RESULT_RECORD.size)
+            self.handle.seek(0, os.SEEK_END)
+        else:
+            self.handle = open(path, "wb")
+            self.handle.write(RESULTS_HEADER.pack(RESULTS_MAGIC, len(header)))
+            self.handle.write(header)
+            self.handle.flush()
+
+    def append(self, outcomes: Iterable[Outcome]) -> None:
+        self.handle.write(b"".join(encode_outcome(outcome) for outcome in outcomes))
+        self.handle.flush()
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class _Ledger:
+    def __init__(self, standings: Standings, completed: Dict[int, Outcome]) -> None:
+        self.standings = standings
+        self.completed = completed
+        self.entrants: Dict[int, Tuple[str, ...]] = {}
+        self.ready: Dict[int, Outcome] = {}
+        self.order: List[int] = []
+        self.applied = 0
+        self.played = 0
+
+    def expect(self, match: Match) -> bool:
+        self.entrants[match.index] = match.entrants
+        self.order.append(match.index)
+        outcome = self.completed.pop(match.index, None)
+        if outcome is None:
+            return True
+        self.ready[match.index] = outcome
+        return False
+
+    def settle(self, outcomes: Iterable[Outcome]) -> None:
+        for outcome in outcomes:
+            self.ready[outcome[0]] = outcome
+            self.played += 1
+        order = self.order
+        while self.applied < len(order) and order[self.applied] in self.ready:
+            index = order[self.applied]
+            _, _, ranks = self.ready.pop(index)
+            self.standings.record(self.entrants.pop(index), ranks)
+            self.applied += 1
+
+
+def _batches(matches: Iterator[Match], size: int) -> Iterator[List[Match]]:
+    while True:
+        batch = list(islice(matches, size))
+        if not batch:
+            return
+        yield batch
+
+
+def run_tournament(
+    config: TournamentConfig,
+    path: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 50,
+) -> Standings:
+    workers = workers or os.cpu_count() or 1
+    standings = Standings(list(config.entrants), config.k_factor, config.initial_rating)
+    results = ResultsFile(path, config) if path else None
+    ledger = _Ledger(standings, results.completed if results else {})
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def finish(outcomes: List[Outcome]) -> None:
+        if results is not None:
+            results.append(outcomes)
+        ledger.settle(outcomes)
+
+    try:
+        for matches in schedule(config, standings):
+            pending: Set[Future[List[Outcome]]] = set()
+            for batch in _batches(matches, chunk_size):
+                todo = [match for match in batch if ledger.expect(match)]
+                if not todo:
+                    ledger.settle(())
+                elif pool is None:
+                    finish(play_matches(todo, config.seed, config.max_turns))
+                else:
+                    pending.add(pool.submit(play_matches, todo, config.seed, config.max_turns))
+                    if len(pending) >= workers * 4:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            finish(future.result())
+            for future in pending:
+                finish(future.result())
+            ledger.settle(())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if results is not None:
+            results.close()
+    return standings
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank Monopoly policies in a rated tournament.")
+    parser.add_argument("--entrants", nargs="+", choices=sorted(POLICIES), required=True)
+    parser.add_argument("--seats", type=int, default=4, choices=[2, 3, 4])
+    parser.add_argument("--format", choices=FORMATS, default="round_robin")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--games-per-match", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--k-factor", type=float, default=24.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default=None, help="Results file; an existing file is resumed.")
+    args = parser.parse_args(argv)
+    config = TournamentConfig(
+        args.entrants,
+        args.seats,
+        args.format,
+        args.rounds,
+        args.games_per_match,
+        args.seed,
+        args.max_turns,
+        args.k_factor,
+    )
+    started = time.perf_counter()
+    standings = run_tournament(config, args.out, args.workers)
+    elapsed = time.perf_counter() - started
+    games = sum(standings.games.values()) // config.seats
+    print(f"Rated {games} games in {elapsed:.2f}s")
+    for rank, (name, rating, played, wins) in enumerate(standings.leaderboard(), start=1):
+        print(f"{rank:>2}. {name:<10} {rating:7.1f}  games {played:>7}  wins {wins:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
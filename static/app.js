@@ -16,8 +16,10 @@ const buyBtn = document.getElementById("buy-btn");
 const declineBtn = document.getElementById("decline-btn");
 const endTurnBtn = document.getElementById("end-turn-btn");
 
+let board = null;
 let lastState = null;
-let polling = null;
+let eventSource = null;
+let gameId = null;
 
 startForm.addEventListener("submit", async (event) => {
   event.preventDefault();
@@ -28,47 +30,78 @@ startForm.addEventListener("submit", async (event) => {
     setStatus("Enter 2-4 player names.");
     return;
   }
-  await apiPost("/api/start", { players: names });
+  const created = await apiPost("/api/games", { players: names });
+  if (!created || created.error) {
+    setStatus((created && created.error) || "Could not start game.");
+    return;
+  }
+  gameId = created.game_id;
+  if (!board) {
+    board = await (await fetch("/api/board")).json();
+  }
   startScreen.classList.add("hidden");
   gameScreen.classList.remove("hidden");
-  await refreshState();
-  if (!polling) {
-    polling = setInterval(refreshState, 700);
-  }
+  subscribe();
 });
 
-rollBtn.addEventListener("click", () => action("/api/roll"));
-jailRollBtn.addEventListener("click", () => action("/api/jail/roll"));
-jailPayBtn.addEventListener("click", () => action("/api/jail/pay"));
-buyBtn.addEventListener("click", () => action("/api/buy"));
-declineBtn.addEventListener("click", () => action("/api/decline"));
-endTurnBtn.addEventListener("click", () => action("/api/end_turn"));
+rollBtn.addEventListener("click", () => action("roll"));
+jailRollBtn.addEventListener("click", () => action("jail/roll"));
+jailPayBtn.addEventListener("click", () => action("jail/pay"));
+buyBtn.addEventListener("click", () => action("buy"));
+declineBtn.addEventListener("click", () => action("decline"));
+endTurnBtn.addEventListener("click", () => action("end_turn"));
 
-async function action(url) {
-  const result = await apiPost(url, {});
+function gameUrl(path) {
+  return `/api/games/${encodeURIComponent(gameId)}/${path}`;
+}
+
+async function action(path) {
+  const result = await apiPost(gameUrl(path), {});
   if (result && result.error) {
     setStatus(result.error);
   }
-  await refreshState();
 }
 
-async function refreshState() {
-  const response = await fetch("/api/state");
-  const data = await response.json();
-  if (!data.started) {
-    return;
+function subscribe() {
+  if (eventSource) {
+    eventSource.close();
+  }
+  eventSource = new EventSource(gameUrl("events"));
+  eventSource.addEventListener("state", (event) => {
+    applyUpdate(JSON.parse(event.data));
+  });
+}
+
+function applyUpdate(update) {
+  if (update.full || !lastState) {
+    lastState = update;
+  } else {
+    update.players.forEach((player) => {
+      lastState.players[player.id] = player;
+    });
+    Object.assign(lastState.properties, update.properties);
+    lastState.event_log = lastState.event_log.concat(update.events).slice(-10);
+    [
+      "version",
+      "current_player",
+      "turn_phase",
+      "pending_property_id",
+      "last_roll",
+      "houses_available",
+      "hotels_available",
+    ].forEach((key) => {
+      lastState[key] = update[key];
+    });
   }
-  lastState = data;
-  renderBoard(data);
-  renderPlayers(data);
-  renderEvents(data);
-  renderControls(data);
+  renderBoard(lastState);
+  renderPlayers(lastState);
+  renderEvents(lastState);
+  renderControls(lastState);
 }
 
 function renderBoard(state) {
   boardEl.innerHTML = "";
-  const spaces = state.board;
-  spaces.forEach((space, index) => {
+  board.spaces.forEach((space, index) => {
     const cell = document.createElement("div");
     cell.className = "space";
     const { row, col } = mapIndexToGrid(index);
@@ -142,8 +175,8 @@ function renderControls(state) {
   endTurnBtn.disabled = phase !== "turn_over";
 
   if (phase === "await_buy_decision" && state.pending_property_id !== null) {
-    const prop = state.properties[String(state.pending_property_id)];
-    setStatus(`Buy ${prop.name}?`);
+    const prop = board.properties[String(state.pending_property_id)];
+    setStatus(`Buy ${prop.name} for $${prop.price}?`);
   } else if (phase === "await_roll") {
     setStatus("Roll the dice.");
   } else if (phase === "turn_over") {
@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+import random
+import time
+
+import pytest
+
+from monopoly.agents import (
+    GameDriver,
+    GreedyPolicy,
+    InvestorPolicy,
+    MCTSPolicy,
+    Policy,
+    RandomPolicy,
+    TradeProposal,
+    make_policy,
+    plan_builds,
+)
+from monopoly.agents.mcts import _Node, rollout
+from monopoly.engine import GameEngine, TurnPhase
+
+
+def _engine(seed=1):
+    engine = GameEngine(["A", "B"], seed=seed)
+    engine.start_turn()
+    return engine
+
+
+def test_driver_requires_one_policy_per_seat():
+    with pytest.raises(ValueError):
+        GameDriver(_engine(), [Policy()])
+
+
+def test_driver_buys_when_policy_says_so():
+    engine = _engine()
+    engine.current_player().position = 1
+    engine.state.turn_state.phase = TurnPhase.AWAIT_ROLL
+    engine._resolve_landing()
+    driver = GameDriver(engine, [GreedyPolicy(), Policy()])
+    driver.step()
+    assert engine.state.properties[1].owner_id == 0
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+
+
+def test_driver_runs_auction_to_highest_bidder():
+    engine = _engine()
+    engine.current_player().position = 1
+    engine._resolve_landing()
+    driver = GameDriver(engine, [Policy(), InvestorPolicy()])
+    driver.step()
+    assert engine.state.turn_state.phase == TurnPhase.AWAIT_AUCTION
+    driver.step()
+    assert engine.state.properties[1].owner_id == 1
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+
+
+def test_plan_builds_spreads_houses_evenly():
+    engine = _engine()
+    for prop_id in (1, 3):
+        engine._set_owner(prop_id, 0)
+    plan = plan_builds(engine, 0, reserve=engine.current_player().cash - 150)
+    assert plan == [1, 3, 1]
+    for prop_id in plan:
+        engine.build_house(0, prop_id)
+
+
+def test_driver_executes_accepted_trades():
+    class Buyer(Policy):
+        def propose_trade(self, engine, player_id):
+            return TradeProposal(to_player=1, give_cash=100, receive_properties=[5])
+
+    class Seller(Policy):
+        def accept_trade(self, engine, player_id, offer):
+            return True
+
+    engine = _engine()
+    engine._set_owner(5, 1)
+    engine.state.turn_state.phase = TurnPhase.TURN_OVER
+    GameDriver(engine, [Buyer(), Seller()]).step()
+    assert engine.state.properties[5].owner_id == 0
+    assert engine.state.trade_offers == {}
+
+
+@pytest.mark.parametrize("names", [["greedy", "investor"], ["random", "passive", "investor"]])
+def test_driver_plays_mixed_policies_to_completion(names):
+    engine = GameEngine([name.title() for name in names], seed=5)
+    engine.start_turn()
+    driver = GameDriver(engine, [make_policy(name, seed=seat) for seat, name in enumerate(names)])
+    result = driver.play_game(max_turns=500)
+    assert result.turns <= 500
+    assert len(result.bankruptcies) == sum(player.bankrupt for player in engine.state.players)
+    if result.winner is not None:
+        assert not engine.state.players[result.winner].bankrupt
+
+
+def test_random_policy_is_reproducible():
+    results = []
+    for _ in range(2):
+        engine = _engine(seed=9)
+        driver = GameDriver(engine, [RandomPolicy(1), RandomPolicy(2)])
+        results.append(driver.play_game(max_turns=200))
+    assert results[0] == results[1]
+
+
+def test_mcts_is_reproducible_under_a_rollout_cap():
+    def decide():
+        engine = _engine(seed=3)
+        engine.current_player().position = 1
+        engine._resolve_landing()
+        policy = MCTSPolicy(time_budget=5.0, max_rollouts=12, seed=7)
+        return policy.choose(engine, 0, "should_buy", [True, False])
+
+    assert decide() == decide()
+
+
+def test_mcts_answers_within_time_budget():
+    engine = _engine()
+    policy = MCTSPolicy(time_budget=0.05, seed=1)
+    started = time.perf_counter()
+    policy.choose(engine, 0, "jail_action", ["roll", "pay"])
+    assert time.perf_counter() - started < 0.05 + 0.05
+
+
+def test_mcts_merges_rollouts_from_worker_pool():
+    engine = _engine()
+    engine._set_owner(5, 1)
+    offer = engine.create_trade_offer(1, 0, 0, [5], 1000, [])
+    with MCTSPolicy(time_budget=5.0, max_rollouts=8, workers=2, executor_factory=ThreadPoolExecutor) as policy:
+        assert policy.accept_trade(engine, 0, offer) is False
+    assert engine.state.properties[5].owner_id == 1
+
+
+def test_mcts_rollouts_grow_a_tree_over_later_decisions():
+    engine = _engine(seed=3)
+    engine.current_player().position = 1
+    engine._resolve_landing()
+    root = _Node()
+    rng = random.Random(1)
+    for _ in range(30):
+        rollout(engine, 0, "should_buy", True, rng, 40, node=root, max_depth=3)
+
+    def depth(node):
+        return 1 + max((depth(child) for child in node.children.values()), default=0)
+
+    assert root.visits == 30
+    assert depth(root) == 4
+    assert sum(child.visits for child in root.children.values()) == root.visits
+
+
+def test_mcts_starts_its_worker_pool_up_front():
+    started = []
+
+    def factory(workers):
+        executor = ThreadPoolExecutor(workers)
+        started.append(workers)
+        return executor
+
+    with MCTSPolicy(workers=2, executor_factory=factory) as policy:
+        assert started == [2]
+        policy.choose(_engine(), 0, "jail_action", ["roll", "pay"])
+        assert started == [2]
@@ -0,0 +1,27 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from monopoly import analytics
+
+
+def test_transition_rows_are_stochastic():
+    transitions, _ = analytics.transition_matrices()
+    assert np.allclose(transitions.sum(axis=1), 1.0)
+
+
+def test_stationary_distribution_favours_orange_and_red_over_brown():
+    landed = analytics.landing_probabilities()
+    assert landed.sum() + analytics.jail_probability() == pytest.approx(1.0)
+    assert landed[30] == 0.0
+    assert landed[24] > landed[1]
+    assert landed[19] > landed[3]
+
+
+def test_property_values_scale_with_house_level():
+    values = {value.property_id: value for value in analytics.property_values()}
+    boardwalk = values[39]
+    assert [level.level for level in boardwalk.levels][-1] == "hotel"
+    assert boardwalk.levels[-1].investment == 400 + 5 * 200
+    rents = [level.expected_rent_per_roll for level in boardwalk.levels]
+    assert rents == sorted(rents)
@@ -0,0 +1,158 @@
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+os.environ.setdefault("MONOPOLY_JOURNAL", "")
+
+from fastapi.testclient import TestClient
+
+import app
+from monopoly.engine import TurnPhase, TurnState
+from monopoly.persistence import GameJournal
+from monopoly.sessions import GameRegistry
+
+OFFER = {"action": "create_trade_offer", "args": [0, None, 10, [], 0, []]}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = GameRegistry()
+    monkeypatch.setattr(app, "_REGISTRY", registry)
+    return registry
+
+
+@pytest.fixture
+def client():
+    return TestClient(app.app)
+
+
+def post_actions(client, game_id, actions):
+    return client.post(f"/api/games/{game_id}/actions", json={"actions": actions})
+
+
+def test_batch_applies_actions_and_advances_version(registry, client):
+    session = registry.create(["A", "B"], seed=1)
+    before = client.get(f"/api/games/{session.game_id}/state")
+    response = post_actions(client, session.game_id, [{"action": "roll_dice"}, OFFER])
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ok"] is True
+    assert body["applied"] == 2
+    assert body["results"][1] == {"offer_id": 1}
+    assert body["state"]["since"] == int(before.json()["version"])
+    assert body["state"]["version"] == session.version > before.json()["version"]
+    after = client.get(f"/api/games/{session.game_id}/state", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["etag"] == session.etag != before.headers["etag"]
+
+
+def test_batch_rolls_back_when_an_item_is_rejected(registry, client):
+    session = registry.create(["A", "B"], seed=1)
+    before = session.engine.snapshot()
+    version = session.version
+    actions = [
+        {"action": "roll_dice"},
+        OFFER,
+        {"action": "accept_trade_offer", "args": [99, 1]},
+        {"action": "cancel_trade_offer", "args": [1, 0]},
+    ]
+    body = post_actions(client, session.game_id, actions).json()
+    assert body["ok"] is False
+    assert body["applied"] == 0 and body["results"] == []
+    assert body["failed"] == {"index": 2, "action": "accept_trade_offer", "detail": "Offer not found."}
+    assert session.engine.snapshot() == before
+    assert session.version == version
+    assert session.engine.state.trade_offers == {}
+
+
+@pytest.mark.parametrize(
+    "actions",
+    [
+        [],
+        [{"action": "end_turn"}] * (app.MAX_BATCH_ACTIONS + 1),
+        [{"action": "roll_dice"}, {"action": "start_turn"}],
+        [{"action": "roll_dice", "args": [1]}],
+        [{"action": "place_bid", "args": [0, 10.5]}],
+        [{"action": "declare_bankruptcy", "args": [0], "kwargs": {"creditor": 1}}],
+        [{"action": "declare_bankruptcy", "args": [0, 0]}],
+    ],
+)
+def test_batch_rejects_malformed_requests_before_applying(registry, client, actions):
+    session = registry.create(["A", "B"], seed=1)
+    version = session.version
+    response = post_actions(client, session.game_id, actions)
+    assert response.status_code == 400
+    assert session.engine.state.version == version
+
+
+def test_batch_accepts_max_batch_actions(registry, client):
+    session = registry.create(["A", "B"], seed=1)
+    body = post_actions(client, session.game_id, [OFFER] * app.MAX_BATCH_ACTIONS).json()
+    assert body["applied"] == app.MAX_BATCH_ACTIONS
+
+
+def test_batch_reports_bankruptcy(registry, client):
+    session = registry.create(["A", "B"], seed=1)
+    engine = session.engine
+    player = engine.current_player()
+    player.in_jail = True
+    player.jail_turns = 2
+    player.cash = 0
+    engine.state.turn_state = TurnState(phase=TurnPhase.AWAIT_JAIL_ACTION)
+    body = post_actions(client, session.game_id, [{"action": "attempt_jail_roll"}, {"action": "end_turn"}]).json()
+    assert body["ok"] is True
+    assert body["bankrupt"] == [player.player_id]
+    assert body["results"][0] is None
+    assert engine.state.current_player_index != player.player_id
+
+
+def test_rejected_batch_items_replay_after_restart(tmp_path, monkeypatch, client):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path)
+    registry = GameRegistry(journal=journal)
+    monkeypatch.setattr(app, "_REGISTRY", registry)
+    session = registry.create(["A", "B"], seed=1)
+    post_actions(client, session.game_id, [OFFER, {"action": "cancel_trade_offer", "args": [1, 1]}])
+    assert post_actions(client, session.game_id, [{"action": "roll_dice", "args": [1]}]).status_code == 400
+    post_actions(client, session.game_id, [{"action": "roll_dice"}])
+    expected = session.engine.snapshot()
+    journal.close()
+
+    journal = GameJournal(path)
+    restored = GameRegistry(journal=journal)
+    assert restored.recover() == 1
+    assert restored.get(session.game_id).engine.snapshot() == expected
+    assert journal.quarantined == {}
+    journal.close()
+
+
+def test_rolled_back_batch_is_not_journaled(tmp_path, monkeypatch, client):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path, checkpoint_every=2)
+    registry = GameRegistry(journal=journal)
+    monkeypatch.setattr(app, "_REGISTRY", registry)
+    session = registry.create(["A", "B"], seed=1)
+    rejected = [{"action": "roll_dice"}, OFFER, {"action": "cancel_trade_offer", "args": [1, 1]}]
+    assert post_actions(client, session.game_id, rejected).json()["ok"] is False
+    post_actions(client, session.game_id, [OFFER, OFFER, OFFER])
+    expected = session.engine.snapshot()
+    journal.close()
+
+    journal = GameJournal(path)
+    restored = GameRegistry(journal=journal)
+    assert restored.recover() == 1
+    assert restored.get(session.game_id).engine.snapshot() == expected
+    journal.close()
+
+
+def test_long_poll_returns_delta_after_timeout_or_change(registry, client):
+    session = registry.create(["A", "B"], seed=1)
+    since = session.version
+    idle = client.get(f"/api/games/{session.game_id}/state", params={"since": since, "timeout": 0.05}).json()
+    assert idle["full"] is False and idle["events"] == []
+    post_actions(client, session.game_id, [OFFER])
+    changed = client.get(f"/api/games/{session.game_id}/state", params={"since": since}).json()
+    assert changed["version"] == session.version
+    assert changed["events"] == session.engine.state.event_log.tail(1)
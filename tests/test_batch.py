@@ -0,0 +1,101 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from monopoly.batch import CHANCE, COMMUNITY, DECK_CARDS, NO_OWNER, BatchGameEngine
+from monopoly.engine import GameRuleError
+
+
+class FixedDice(BatchGameEngine):
+    def __init__(self, num_games, num_players, dice):
+        super().__init__(num_games, num_players, seed=0)
+        self.dice = np.array(dice)
+
+    def _roll(self, count):
+        return self.dice[:count]
+
+
+def test_same_seed_steps_identically():
+    first = BatchGameEngine(64, 3, seed=5)
+    second = BatchGameEngine(64, 3, seed=5)
+    for _ in range(60):
+        first.step()
+        second.step()
+    for name in ("cash", "position", "owner", "in_jail", "bankrupt", "deck_head", "current", "turns"):
+        assert np.array_equal(getattr(first, name), getattr(second, name))
+    assert first.turns.min() > 0
+
+
+def test_vectorized_go_rent_and_tax():
+    engine = FixedDice(4, 2, [(2, 3), (2, 3), (1, 3), (1, 1)])
+    engine.position[0, 0] = 35
+    engine.owner[1, [5, 15]] = 1
+    engine.owner[3, [37, 39]] = 1
+    engine.position[3, 0] = 37
+    engine.step()
+    assert engine.position[:, 0].tolist() == [0, 5, 4, 39]
+    assert engine.cash[0].tolist() == [1700, 1500]
+    assert engine.cash[1].tolist() == [1450, 1550]
+    assert engine.cash[2].tolist() == [1300, 1500]
+    assert engine.cash[3].tolist() == [1400, 1600]
+    assert engine.current.tolist() == [1, 1, 1, 0]
+    assert engine.turns.tolist() == [1, 1, 1, 1]
+
+
+def test_declined_purchase_falls_back_to_auction():
+    engine = FixedDice(2, 2, [(2, 4), (2, 4)])
+    engine.cash[1, 1] = 40
+    engine.step()
+    assert engine.pending_property.tolist() == [6, 6]
+    engine.step(buy=np.array([True, False]))
+    assert engine.owner[0, 6] == 0
+    assert engine.cash[0].tolist() == [1406, 1494]
+    assert engine.owner[1, 6] == 0
+    assert engine.cash[1].tolist() == [1465, 34]
+
+
+def test_card_sends_player_to_jail_and_fine_frees_them():
+    engine = FixedDice(1, 2, [(3, 4)])
+    chance = [card.description for card in DECK_CARDS[CHANCE]]
+    community = [card.description for card in DECK_CARDS[COMMUNITY]]
+    engine.deck_order[0, CHANCE, :2] = [
+        chance.index("Go to Jail. Go directly to Jail"),
+        chance.index("Bank pays you dividend of $50"),
+    ]
+    engine.deck_order[0, COMMUNITY, 0] = community.index("Income tax refund. Collect $20")
+    engine.step()
+    assert engine.in_jail[0, 0] and engine.position[0, 0] == 10
+    engine.step()
+    assert engine.cash[0, 1] == 1550
+    engine.step(pay_jail=np.array([True]))
+    assert not engine.in_jail[0, 0]
+    assert engine.position[0, 0] == 17
+    assert engine.cash[0, 0] == 1500 - 50 + 20
+
+
+def test_unpaid_rent_bankrupts_to_owner_and_ends_game():
+    engine = FixedDice(1, 2, [(1, 2)])
+    engine.owner[0, [1, 3]] = 1
+    engine.houses[0, [1, 3]] = 5
+    engine.owner[0, 5] = 0
+    engine.mortgaged[0, 5] = True
+    engine.cash[0, 0] = 100
+    engine.step()
+    assert engine.bankrupt[0].tolist() == [True, False]
+    assert engine.owner[0, 5] == 1
+    assert engine.cash[0].tolist() == [0, 1590]
+    assert engine.done[0]
+    assert engine.winners().tolist() == [1]
+    engine.reset(engine.done)
+    assert not engine.done[0] and engine.owner[0].tolist() == [NO_OWNER] * 40
+
+
+def test_build_house_enforces_group_rules():
+    engine = BatchGameEngine(1, 2, seed=1)
+    engine.owner[0, [1, 3]] = 0
+    engine.build_house(0, 0, 1)
+    with pytest.raises(GameRuleError):
+        engine.build_house(0, 0, 1)
+    engine.build_house(0, 0, 3)
+    assert engine.houses[0, [1, 3]].tolist() == [1, 1]
+    assert engine.cash[0, 0] == 1400
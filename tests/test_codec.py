@@ -0,0 +1,67 @@
+import asyncio
+
+from monopoly import codec
+from monopoly.events import EventType
+from monopoly.sessions import GameRegistry, serialize_state
+
+
+def test_full_state_round_trips_against_json_view():
+    registry = GameRegistry()
+    session = registry.create(["A", "B", "C"], seed=1)
+    engine = session.engine
+    with session.lock:
+        engine.roll_dice()
+        session.commit()
+    decoded = codec.decode(session.encode())
+    expected = serialize_state(engine)
+    assert decoded["full"] is True
+    for key in ("version", "current_player", "turn_phase", "pending_property_id", "houses_available"):
+        assert decoded[key] == expected[key]
+    assert decoded["last_roll"] == expected["last_roll"]
+    assert decoded["players"] == [
+        {key: player[key] for key in ("id", "cash", "position", "in_jail", "bankrupt")} for player in expected["players"]
+    ]
+    assert {str(prop_id): view for prop_id, view in decoded["properties"].items()} == expected["properties"]
+    assert [engine.state.event_log.format(record) for record in decoded["events"]] == expected["event_log"]
+
+
+def test_delta_carries_only_changed_entries():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+    engine = session.engine
+    base = session.version
+    engine.current_player().position = 1
+    with session.lock:
+        engine._resolve_landing()
+        engine.buy_property()
+        session.commit()
+    data = session.encode(base)
+    decoded = codec.decode(data)
+    assert decoded["full"] is False and decoded["since"] == base
+    assert [player["id"] for player in decoded["players"]] == [0]
+    assert decoded["properties"] == {1: {"owner_id": 0, "houses": 0, "mortgaged": False}}
+    assert [code for code, _, _ in decoded["events"]] == [EventType.PROPERTY_BOUGHT]
+    assert len(data) < len(codec.encode_state(engine, 10))
+
+
+def test_binary_subscribers_get_framed_updates():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=2)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        binary = session.subscribe(loop, binary=True)
+        text = session.subscribe(loop)
+        first = binary.get_nowait()
+        text.get_nowait()
+        with session.lock:
+            session.engine.roll_dice()
+            session.commit()
+        await asyncio.sleep(0)
+        return first, binary.get_nowait(), text.get_nowait()
+
+    first, update, text = asyncio.run(main())
+    length = codec.FRAME_LENGTH.unpack_from(first)[0]
+    assert codec.decode(first[codec.FRAME_LENGTH.size :])["full"] and length == len(first) - codec.FRAME_LENGTH.size
+    assert codec.decode(update[codec.FRAME_LENGTH.size :])["version"] == session.version
+    assert text.startswith(f"id: {session.version}\n")
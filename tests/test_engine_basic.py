@@ -1,34 +1,205 @@
-from monopoly.engine import GameEngine, TurnPhase
+import pytest
 
+from monopoly.engine import GameEngine, GameRuleError, TurnPhase
+from monopoly.fast import NO_OWNER, FastGameEngine
 
-def test_buy_property_flow():
-    engine = GameEngine(["A", "B"], seed=1)
+ENGINES = [GameEngine, FastGameEngine]
+
+
+def _current(engine):
+    return engine.current if isinstance(engine, FastGameEngine) else engine.state.current_player_index
+
+
+def _player(engine, field):
+    if isinstance(engine, FastGameEngine):
+        return getattr(engine, field)[engine.current]
+    return getattr(engine.current_player(), field)
+
+
+def _place(engine, position):
+    if isinstance(engine, FastGameEngine):
+        engine.position[engine.current] = position
+    else:
+        engine.current_player().position = position
+
+
+def _phase(engine):
+    return engine.phase if isinstance(engine, FastGameEngine) else engine.state.turn_state.phase
+
+
+def _owner(engine, prop_id):
+    if isinstance(engine, FastGameEngine):
+        return None if engine.owner[prop_id] == NO_OWNER else engine.owner[prop_id]
+    return engine.state.properties[prop_id].owner_id
+
+
+@pytest.mark.parametrize("engine_cls", ENGINES)
+def test_buy_property_flow(engine_cls):
+    engine = engine_cls(["A", "B"], seed=1)
     engine.start_turn()
-    player = engine.current_player()
-    player.position = 1
+    _place(engine, 1)
     engine._resolve_landing()
-    assert engine.state.turn_state.phase == TurnPhase.AWAIT_BUY_DECISION
+    assert _phase(engine) == TurnPhase.AWAIT_BUY_DECISION
     engine.buy_property()
-    assert engine.state.properties[1].owner_id == player.player_id
-    assert player.cash == 1500 - 60
-    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+    assert _owner(engine, 1) == _current(engine)
+    assert _player(engine, "cash") == 1500 - 60
+    assert _phase(engine) == TurnPhase.TURN_OVER
+
+
+@pytest.mark.parametrize("engine_cls", ENGINES)
+def test_pass_go_collects_salary(engine_cls):
+    engine = engine_cls(["A", "B"], seed=1)
+    engine.start_turn()
+    _place(engine, 39)
+    if isinstance(engine, FastGameEngine):
+        engine._move(2)
+    else:
+        engine._move_current_player(2, collect_go=True)
+    assert _player(engine, "position") == 1
+    assert _player(engine, "cash") == 1500 + 200
+
+
+@pytest.mark.parametrize("engine_cls", ENGINES)
+def test_go_to_jail_space(engine_cls):
+    engine = engine_cls(["A", "B"], seed=2)
+    engine.start_turn()
+    _place(engine, 30)
+    engine._resolve_landing()
+    assert _player(engine, "in_jail") is True
+    assert _player(engine, "position") == 10
+
+
+def test_rent_lookup_tracks_ownership_and_mortgages():
+    engine = GameEngine(["A", "B"], seed=1)
+    engine.start_turn()
+    engine._set_owner(1, 1)
+    assert engine._calculate_rent(1, 0) == 2
+    engine._set_owner(3, 1)
+    assert engine._calculate_rent(1, 0) == 4
+    for prop_id in (5, 15):
+        engine._set_owner(prop_id, 1)
+    assert engine._calculate_rent(5, 0) == 50
+    engine.mortgage_property(1, 15)
+    assert engine._calculate_rent(5, 0) == 25
+
+
+def test_clone_is_independent_and_replays_identically():
+    engine = GameEngine(["A", "B"], seed=4)
+    engine.start_turn()
+    engine._set_owner(1, 0)
+    copy = engine.clone()
+    assert len(copy.state.event_log) == 0
+    assert engine.roll_dice() == copy.roll_dice()
+    copy.state.players[0].cash = 1
+    copy._set_owner(3, 1)
+    assert engine.state.players[0].cash != 1
+    assert engine.state.properties[3].owner_id is None
+    assert engine.clone(keep_log=True).state.event_log.lines() == engine.state.event_log.lines()
 
 
-def test_pass_go_collects_salary():
+def test_snapshot_restores_state_and_rng():
+    engine = GameEngine(["A", "Bé"], seed=8)
+    engine.start_turn()
+    engine._set_owner(3, 1)
+    engine.state.players[1].get_out_of_jail_cards.append(("chance", engine.state.chance_deck.pop()))
+    engine.create_trade_offer(1, 0, 10, [3], 0, [])
+    engine.current_player().position = 1
+    engine._resolve_landing()
+    engine.decline_property()
+    engine.place_bid(1, 40)
+    restored = GameEngine.restore(engine.snapshot())
+    assert restored.state.players == engine.state.players
+    assert restored.state.properties == engine.state.properties
+    assert restored.state.chance_deck == engine.state.chance_deck
+    assert restored.state.turn_state == engine.state.turn_state
+    assert restored.state.trade_offers == engine.state.trade_offers
+    assert restored.state.version == engine.state.version
+    for game in (engine, restored):
+        game.pass_bid(0)
+        game.end_turn()
+        if game.state.turn_state.phase == TurnPhase.AWAIT_ROLL:
+            game.roll_dice()
+    assert restored.state.players == engine.state.players
+    assert restored.state.event_log.tail(3) == engine.state.event_log.tail(3)
+
+
+def test_snapshot_without_rng_is_compact():
+    engine = GameEngine(["A", "B", "C", "D"], seed=1)
+    engine.start_turn()
+    data = engine.snapshot(include_rng=False)
+    assert len(data) < 1024
+    restored = GameEngine.restore(data, seed=5)
+    assert restored.state.properties == engine.state.properties
+    with pytest.raises(ValueError):
+        GameEngine.restore(b"nope" + data[4:])
+
+
+def test_legality_helpers_match_action_errors():
+    engine = GameEngine(["A", "B"], seed=1)
+    engine.start_turn()
+    engine._set_owner(1, 0)
+    assert not engine.can_build_house(0, 1)
+    with pytest.raises(GameRuleError, match="full color group"):
+        engine.build_house(0, 1)
+    engine._set_owner(3, 0)
+    assert engine.can_build_house(0, 1) and engine.can_build_house(0, 3)
+    engine.build_house(0, 1)
+    assert not engine.can_build_house(0, 1)
+    assert not engine.can_mortgage(0, 3)
+    assert engine.can_sell_house(0, 1) and not engine.can_sell_house(0, 3)
+    engine.sell_house(0, 1)
+    engine.mortgage_property(0, 3)
+    assert engine.can_unmortgage(0, 3) and not engine.can_unmortgage(1, 3)
+    engine.state.players[0].cash = 10
+    assert not engine.can_unmortgage(0, 3)
+
+
+def test_group_cache_tracks_houses_and_mortgages():
     engine = GameEngine(["A", "B"], seed=1)
     engine.start_turn()
-    player = engine.current_player()
-    player.position = 39
-    engine._move_current_player(2, collect_go=True)
-    assert player.position == 1
-    assert player.cash == 1500 + 200
+    for prop_id in (1, 3, 6, 8, 9):
+        engine._set_owner(prop_id, 0)
+    engine.build_house(0, 1)
+    engine.build_house(0, 3)
+    engine.build_house(0, 1)
+    copy = engine.clone()
+    copy.sell_house(0, 1)
+    engine.mortgage_property(0, 6)
+    assert engine._group_levels()["brown"] == (1, 2, 0)
+    assert engine._group_levels()["light_blue"] == (0, 0, 1)
+    assert copy._group_levels()["brown"] == (1, 1, 0)
+    engine.declare_bankruptcy(0)
+    assert engine._group_levels() == {color: engine._measure_group(color) for color in engine._group_levels()}
+    assert not engine._group_has_houses(1) and not engine._group_has_mortgage("light_blue")
+
 
+@pytest.mark.parametrize("engine_cls", ENGINES)
+def test_player_cannot_be_their_own_creditor(engine_cls):
+    engine = engine_cls(["A", "B"], seed=1)
+    engine.start_turn()
+    with pytest.raises(GameRuleError):
+        engine.declare_bankruptcy(0, 0)
+    assert not _player(engine, "bankrupt")
 
-def test_go_to_jail_space():
-    engine = GameEngine(["A", "B"], seed=2)
+
+def test_legal_actions_are_all_accepted():
+    engine = GameEngine(["A", "B"], seed=1)
     engine.start_turn()
-    player = engine.current_player()
-    player.position = 30
+    assert engine.legal_actions(0) == [("roll_dice", ())]
+    assert engine.legal_actions(1) == []
+    engine._set_owner(1, 0)
+    engine._set_owner(3, 0)
+    engine._set_owner(5, 1)
+    engine.mortgage_property(1, 5)
+    offer = engine.create_trade_offer(1, 0, 0, [5], 0, [])
+    actions = engine.legal_actions(0)
+    assert ("build_house", (0, 1)) in actions and ("mortgage_property", (0, 3)) in actions
+    assert ("accept_trade_offer", (offer.offer_id, 0)) in actions
+    assert engine.legal_actions(1) == [("cancel_trade_offer", (offer.offer_id, 1)), ("unmortgage_property", (1, 5))]
+    for name, args in actions:
+        engine.clone().apply_action(name, args)
+    engine.state.players[0].position = 6
     engine._resolve_landing()
-    assert player.in_jail is True
-    assert player.position == 10
+    engine.decline_property()
+    assert ("place_bid", (1, 1)) in engine.legal_actions(1)
+    assert ("pass_bid", (0,)) in engine.legal_actions(0)
@@ -0,0 +1,119 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from monopoly.agents import GreedyPolicy
+from monopoly.engine import GameRuleError
+from monopoly.env import (
+    BUILD,
+    END_TURN,
+    NUM_ACTIONS,
+    OBSERVATION_SIZE,
+    ROLL,
+    STREET_IDS,
+    MonopolyEnv,
+    VectorMonopolyEnv,
+    encode_action_mask,
+)
+
+
+def _play(env, rng, episodes):
+    rewards = []
+    obs, _ = env.reset()
+    while len(rewards) < episodes:
+        action = rng.choice(np.flatnonzero(env.mask))
+        next_obs, reward, terminated, truncated, _ = env.step(action)
+        assert next_obs is obs
+        if terminated or truncated:
+            rewards.append(reward)
+            env.reset()
+    return rewards
+
+
+def test_reset_encodes_fixed_size_observation_and_mask():
+    env = MonopolyEnv(3, seed=1)
+    obs, info = env.reset()
+    assert obs.shape == (OBSERVATION_SIZE,) and obs.dtype == np.float32
+    assert env.mask.shape == (NUM_ACTIONS,)
+    assert np.flatnonzero(env.mask).tolist() == [ROLL]
+    assert info["player"] == 0
+    with pytest.raises(GameRuleError):
+        env.step(END_TURN)
+
+
+def test_random_self_play_reaches_the_end():
+    env = MonopolyEnv(2, seed=3, max_turns=200)
+    rewards = _play(env, np.random.default_rng(0), 3)
+    assert all(reward in (-1.0, 0.0, 1.0) for reward in rewards)
+
+
+def test_opponent_seats_are_played_automatically():
+    env = MonopolyEnv(2, seed=4, opponents=[None, GreedyPolicy()], max_turns=100)
+    env.reset()
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        _, _, terminated, truncated, info = env.step(rng.choice(np.flatnonzero(env.mask)))
+        if terminated or truncated:
+            break
+        assert info["player"] == 0
+
+
+@pytest.mark.parametrize("num_players", [3, 4])
+@pytest.mark.parametrize("greedy_opponents", [True, False])
+def test_multiplayer_episodes_finish_within_step_budget(num_players, greedy_opponents):
+    seats = [None] + [GreedyPolicy() if greedy_opponents else None] * (num_players - 1)
+    rng = np.random.default_rng(num_players)
+    for seed in range(6):
+        env = MonopolyEnv(num_players, seed=seed, opponents=seats, max_turns=200)
+        env.reset()
+        for _ in range(20000):
+            assert env.mask.any()
+            _, reward, terminated, truncated, info = env.step(rng.choice(np.flatnonzero(env.mask)))
+            if terminated or truncated:
+                break
+        else:
+            pytest.fail(f"episode {seed} did not finish")
+        if greedy_opponents and env.engine.state.players[0].bankrupt:
+            assert terminated and reward == -1.0
+
+
+def test_mask_follows_engine_build_rules():
+    env = MonopolyEnv(2, seed=1)
+    env.reset()
+    engine = env.engine
+    engine._set_owner(1, 0)
+    engine._set_owner(3, 0)
+    brown = [BUILD + STREET_IDS.index(prop_id) for prop_id in (1, 3)]
+    assert encode_action_mask(engine, 0, env.mask)[brown].tolist() == [True, True]
+    engine.build_house(0, 1)
+    assert encode_action_mask(engine, 0, env.mask)[brown].tolist() == [False, True]
+    assert not encode_action_mask(engine, 1, env.mask)[brown].any()
+
+
+def test_vector_env_writes_rows_in_place_and_auto_resets():
+    envs = VectorMonopolyEnv(4, num_players=2, seed=2, max_turns=20)
+    obs, info = envs.reset()
+    assert obs.shape == (4, OBSERVATION_SIZE)
+    rng = np.random.default_rng(2)
+    finished = 0
+    for _ in range(400):
+        actions = [rng.choice(np.flatnonzero(mask)) for mask in envs.masks]
+        next_obs, rewards, terminated, truncated, info = envs.step(actions)
+        assert next_obs is obs and rewards.shape == (4,)
+        done = terminated | truncated
+        finished += int(done.sum())
+        assert all(envs.masks.any(axis=1))
+        for idx in range(4):
+            final = info["final_observation"][idx]
+            assert (final is not None) == done[idx] == (info["final_info"][idx] is not None)
+            if done[idx]:
+                assert final.shape == (OBSERVATION_SIZE,) and final is not obs[idx]
+                assert info["final_info"][idx]["turns"] >= 1
+    assert finished > 0
+
+
+def test_vector_env_gives_each_game_its_own_opponents():
+    envs = VectorMonopolyEnv(3, num_players=3, seed=5, opponents=[None, GreedyPolicy, GreedyPolicy])
+    seats = [env.seats for env in envs.envs]
+    assert all(seat[0] is None and isinstance(seat[1], GreedyPolicy) for seat in seats)
+    assert len({id(policy) for seat in seats for policy in seat[1:]}) == 6
@@ -0,0 +1,53 @@
+from monopoly.engine import GameEngine
+from monopoly.events import EventLog, EventSink, EventType, read_spilled
+
+
+def test_events_format_lazily_to_legacy_text():
+    engine = GameEngine(["A", "B"], seed=1)
+    engine.start_turn()
+    player = engine.current_player()
+    player.position = 1
+    engine._resolve_landing()
+    engine.buy_property()
+    engine.mortgage_property(player.player_id, 1)
+    assert engine.state.event_log.tail(4) == [
+        "Game started.",
+        "Turn started for A.",
+        "A bought Mediterranean Avenue for $60.",
+        "Player 0 mortgaged Mediterranean Avenue for $30.",
+    ]
+    code, player_id, args = list(engine.state.event_log)[-1]
+    assert (code, player_id, args) == (EventType.MORTGAGED, 0, (1, 30))
+
+
+def test_ring_buffer_keeps_only_recent_records():
+    engine = GameEngine(["A", "B"], seed=1, log_capacity=3)
+    engine.start_turn()
+    for _ in range(5):
+        engine._log(EventType.BID_PASSED, 1)
+    assert len(engine.state.event_log) == 3
+    assert engine.state.event_log.total == 7
+    assert engine.state.event_log.tail(10) == ["Player 1 passed in auction."] * 3
+
+
+def test_disabled_log_still_advances_version():
+    engine = GameEngine(["A", "B"], seed=1, log_capacity=0)
+    engine.start_turn()
+    engine.roll_dice()
+    assert len(engine.state.event_log) == 0
+    assert engine.state.version >= 3
+
+
+def test_evicted_records_spill_to_disk(tmp_path):
+    path = str(tmp_path / "events.bin")
+    sink = EventSink(path)
+    log = EventLog(["A", "B"], capacity=2, sink=sink)
+    log.append(EventType.GAME_STARTED, -1, ())
+    log.append(EventType.ROLLED, 0, (3, 4))
+    log.append(EventType.BANKRUPT_TO_PLAYER, 1, (0,))
+    log.append(EventType.CARD_DRAWN, 0, (0, 7))
+    sink.close()
+    spilled = list(read_spilled(path))
+    assert spilled == [(EventType.GAME_STARTED, -1, ()), (EventType.ROLLED, 0, (3, 4))]
+    assert [log.format(record) for record in spilled] == ["Game started.", "A rolled 3 and 4."]
+    assert log.tail(2) == ["Player 1 bankrupt to player 0.", "A drew card: Get Out of Jail Free."]
@@ -0,0 +1,159 @@
+import pytest
+
+from monopoly.data import PROPERTY_DATA, PROPERTY_GROUPS
+from monopoly.engine import GameEngine, GameRuleError, InsufficientFunds, PlayerBankrupt, TurnPhase
+from monopoly.fast import COMMUNITY, DECK_CARDS, NO_OWNER, FastGameEngine
+from monopoly.sim import game_seed, play_fast_game, play_game, run_batch
+
+
+def test_trade_offer_acceptance_updates_group_counts():
+    engine = FastGameEngine(["A", "B"], seed=1)
+    engine.start_turn()
+    engine._set_owner(1, 0)
+    engine._set_owner(3, 1)
+    offer_id = engine.create_trade_offer(0, 1, 0, [1], 100, [])
+    engine.accept_trade_offer(offer_id, 1)
+    assert engine.owner[1] == 1
+    assert engine.cash == [1600, 1400]
+    assert engine.owns_group(1, "brown")
+    with pytest.raises(GameRuleError):
+        engine.build_house(0, 1)
+
+
+def _phase(engine):
+    return engine.phase if isinstance(engine, FastGameEngine) else engine.state.turn_state.phase
+
+
+def _view(engine):
+    if isinstance(engine, FastGameEngine):
+        owners = [None if owner == NO_OWNER else owner for owner in engine.owner]
+        return (
+            list(engine.cash),
+            list(engine.position),
+            list(engine.in_jail),
+            list(engine.bankrupt),
+            [(owners[prop_id], engine.houses[prop_id], engine.mortgaged[prop_id]) for prop_id in PROPERTY_DATA],
+            engine.current,
+            engine.phase,
+        )
+    state = engine.state
+    return (
+        [player.cash for player in state.players],
+        [player.position for player in state.players],
+        [player.in_jail for player in state.players],
+        [player.bankrupt for player in state.players],
+        [(prop.owner_id, prop.houses, prop.mortgaged) for prop in state.properties.values()],
+        state.current_player_index,
+        state.turn_state.phase,
+    )
+
+
+def _bidders(engine):
+    if isinstance(engine, FastGameEngine):
+        return sorted(engine.auction_bidders)
+    return sorted(engine.state.turn_state.pending_auction.active_bidders)
+
+
+def _exact(engine_cls, names, seed):
+    if engine_cls is FastGameEngine:
+        return FastGameEngine(names, seed=seed, exact_dice=True)
+    return engine_cls(names, seed=seed)
+
+
+def _scripted_game(engine_cls, seed, steps=300):
+    engine = _exact(engine_cls, ["A", "B", "C"], seed)
+    engine.start_turn()
+    views = []
+    for step in range(steps):
+        phase = _phase(engine)
+        player_id = _view(engine)[5]
+        try:
+            if phase == TurnPhase.AWAIT_JAIL_ACTION:
+                engine.attempt_jail_roll()
+            elif phase == TurnPhase.AWAIT_ROLL:
+                for prop_ids in PROPERTY_GROUPS.values():
+                    for prop_id in prop_ids:
+                        try:
+                            engine.build_house(player_id, prop_id)
+                        except GameRuleError:
+                            pass
+                engine.roll_dice()
+            elif phase == TurnPhase.AWAIT_BUY_DECISION:
+                if step % 3:
+                    engine.buy_property()
+                else:
+                    engine.decline_property()
+            elif phase == TurnPhase.AWAIT_AUCTION:
+                bidders = _bidders(engine)
+                engine.place_bid(bidders[0], 10 + step % 50)
+                for bidder in bidders[1:]:
+                    if _phase(engine) != TurnPhase.AWAIT_AUCTION:
+                        break
+                    engine.pass_bid(bidder)
+            else:
+                engine.end_turn()
+        except InsufficientFunds:
+            views.append(_view(engine))
+            break
+        views.append(_view(engine))
+    return views
+
+
+def _collect_each_with_bankrupt_payer(engine_cls):
+    engine = engine_cls(["A", "B", "C", "D"], seed=1)
+    engine.start_turn()
+    if isinstance(engine, FastGameEngine):
+        deck = engine.decks[COMMUNITY]
+        while DECK_CARDS[COMMUNITY][deck[0]].action != "collect_each":
+            deck.rotate(-1)
+        engine.cash[2] = 20
+        draw = lambda: engine._draw_card(COMMUNITY)
+    else:
+        deck = engine.state.community_deck
+        while deck[0].action != "collect_each":
+            deck.append(deck.pop(0))
+        engine.state.players[2].cash = 20
+        draw = lambda: engine._draw_card("community")
+    with pytest.raises(PlayerBankrupt):
+        draw()
+    view = _view(engine)
+    engine.end_turn()
+    return view, _view(engine)
+
+
+def test_fast_engine_finishes_collect_each_turn_after_bankruptcy():
+    fast_view = _collect_each_with_bankrupt_payer(FastGameEngine)
+    assert fast_view == _collect_each_with_bankrupt_payer(GameEngine)
+    assert fast_view[0][0] == [1620, 1450, 0, 1450]
+    assert fast_view[0][6] == TurnPhase.TURN_OVER
+    assert fast_view[1][5] == 1
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fast_engine_matches_game_engine(seed):
+    assert _scripted_game(FastGameEngine, seed) == _scripted_game(GameEngine, seed)
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 4])
+def test_exact_dice_fast_games_match_standard_games(num_players):
+    for game_index in range(4):
+        seed = game_seed(9, game_index)
+        assert play_fast_game(num_players, seed, 400, exact_dice=True) == play_game(num_players, seed, 400)
+
+
+def test_batched_dice_are_seeded_and_uniform():
+    engine = FastGameEngine(["A", "B"], seed=3)
+    other = FastGameEngine(["A", "B"], seed=3)
+    for _ in range(20):
+        engine._refill_dice()
+        other._refill_dice()
+        assert engine._rolls == other._rolls
+    faces = [face for roll in engine._rolls for face in roll]
+    assert set(faces) == {1, 2, 3, 4, 5, 6}
+    assert all(abs(faces.count(face) / len(faces) - 1 / 6) < 0.05 for face in range(1, 7))
+
+
+def test_fast_simulation_plays_full_batches():
+    fast = run_batch(20, num_players=3, master_seed=9, workers=1, max_turns=400, engine_kind="fast")
+    assert fast.games == 20 and sum(fast.wins) + fast.draws == 20
+    assert fast == run_batch(20, num_players=3, master_seed=9, workers=1, max_turns=400, engine_kind="fast")
@@ -0,0 +1,124 @@
+import pytest
+
+from monopoly.engine import GameEngine, PlayerBankrupt, TurnPhase
+from monopoly.liquidation import MORTGAGE_PROPERTY, SELL_HOUSE, plan_liquidation
+
+HOLDINGS = [(1, 2, False), (3, 2, False), (5, 0, False), (12, 0, False), (15, 0, False)]
+
+
+def test_plan_mortgages_cheapest_free_properties_first():
+    assert plan_liquidation(0, HOLDINGS, 32) == []
+    assert plan_liquidation(70, HOLDINGS, 32) == [(MORTGAGE_PROPERTY, 12)]
+    assert plan_liquidation(160, HOLDINGS, 32) == [(MORTGAGE_PROPERTY, 5), (MORTGAGE_PROPERTY, 12)]
+
+
+def test_plan_sells_houses_evenly_once_mortgages_run_out():
+    free = [(MORTGAGE_PROPERTY, 5), (MORTGAGE_PROPERTY, 12), (MORTGAGE_PROPERTY, 15)]
+    assert plan_liquidation(300, HOLDINGS, 32) == free + [(SELL_HOUSE, 1)]
+    assert plan_liquidation(350, HOLDINGS, 32) == free + [(SELL_HOUSE, 1), (SELL_HOUSE, 3), (SELL_HOUSE, 1)]
+    assert plan_liquidation(10_000, HOLDINGS, 32) is None
+
+
+def test_plan_shares_the_house_bank_between_groups():
+    hotels = [(prop_id, 5, False) for prop_id in (16, 18, 19, 21, 23, 24)]
+    assert plan_liquidation(300, hotels, 4) == [(SELL_HOUSE, 21)]
+    assert plan_liquidation(500, hotels, 4) is None
+    assert plan_liquidation(500, hotels, 7) is None
+    engine = GameEngine(["A", "B"], seed=1)
+    for prop_id, count, _ in hotels:
+        engine._set_owner(prop_id, 0)
+        engine._set_houses(prop_id, count)
+    engine.state.houses_available = 8
+    for action, prop_id in plan_liquidation(600, hotels, 8):
+        getattr(engine, action)(0, prop_id)
+    assert engine.state.players[0].cash >= 1500 + 600
+    assert engine.state.houses_available == 0
+
+
+def test_rent_is_covered_by_mortgaging():
+    engine = GameEngine(["A", "B"], seed=1)
+    engine.start_turn()
+    player = engine.current_player()
+    player.cash = 10
+    for prop_id in (5, 15):
+        engine._set_owner(prop_id, player.player_id)
+    engine._set_owner(39, 1)
+    player.position = 39
+    engine._resolve_landing()
+    assert engine.state.properties[5].mortgaged and not engine.state.properties[15].mortgaged
+    assert player.cash == 10 + 100 - 50
+    assert engine.state.players[1].cash == 1500 + 50
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+
+
+def test_unpayable_rent_bankrupts_to_owner():
+    engine = GameEngine(["A", "B", "C"], seed=1)
+    engine.start_turn()
+    player = engine.current_player()
+    player.cash = 100
+    engine._set_owner(5, player.player_id)
+    for prop_id in (37, 39):
+        engine._set_owner(prop_id, 1)
+        engine._set_houses(prop_id, 5)
+    player.position = 39
+    with pytest.raises(PlayerBankrupt) as excinfo:
+        engine._resolve_landing()
+    assert (excinfo.value.player_id, excinfo.value.creditor_id, excinfo.value.cause) == (0, 1, "rent")
+    assert player.bankrupt
+    assert engine.state.properties[5].owner_id == 1
+    assert engine.state.players[1].cash == 1500 + 100
+
+
+def _stack_collect_each(engine):
+    deck = engine.state.community_deck
+    deck.insert(0, deck.pop(next(idx for idx, card in enumerate(deck) if card.action == "collect_each")))
+
+
+def test_collect_each_card_finishes_the_turn_when_a_payer_goes_bankrupt():
+    engine = GameEngine(["A", "B", "C", "D"], seed=1)
+    engine.start_turn()
+    _stack_collect_each(engine)
+    players = engine.state.players
+    players[2].cash = 20
+    with pytest.raises(PlayerBankrupt) as excinfo:
+        engine._draw_card("community")
+    assert excinfo.value.player_id == 2 and excinfo.value.others == []
+    assert [player.cash for player in players] == [1500 + 50 + 20 + 50, 1450, 0, 1450]
+    assert players[2].bankrupt
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+    engine.end_turn()
+    assert engine.state.current_player_index == 1
+
+
+def test_collect_each_reports_every_bankrupt_payer():
+    engine = GameEngine(["A", "B", "C", "D"], seed=1)
+    engine.start_turn()
+    _stack_collect_each(engine)
+    players = engine.state.players
+    players[1].cash = 0
+    players[3].cash = 0
+    with pytest.raises(PlayerBankrupt) as excinfo:
+        engine._draw_card("community")
+    assert [bust.player_id for bust in excinfo.value.players()] == [1, 3]
+    assert players[2].cash == 1450
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+
+
+def test_bankruptcy_falls_back_to_bank_when_creditor_cannot_cover_interest():
+    engine = GameEngine(["A", "B", "C"], seed=1)
+    engine.start_turn()
+    player = engine.current_player()
+    player.cash = 5
+    for prop_id in (37, 39):
+        engine._set_owner(prop_id, player.player_id)
+        engine._set_mortgaged(prop_id, True)
+    engine._set_owner(5, 1)
+    engine.state.players[1].cash = 0
+    player.position = 5
+    with pytest.raises(PlayerBankrupt):
+        engine._resolve_landing()
+    assert player.bankrupt
+    assert engine.state.players[1].cash == 0
+    for prop_id in (37, 39):
+        prop_state = engine.state.properties[prop_id]
+        assert (prop_state.owner_id, prop_state.mortgaged) == (None, False)
@@ -0,0 +1,108 @@
+import sqlite3
+
+import pytest
+
+from monopoly.agents import GameDriver, GreedyPolicy
+from monopoly.engine import GameEngine, GameRuleError
+from monopoly.persistence import GameJournal
+from monopoly.sessions import GameRegistry
+
+
+@pytest.mark.parametrize("checkpoint_every", [1000, 7])
+def test_registry_recovers_games_from_journal(tmp_path, checkpoint_every):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path, checkpoint_every=checkpoint_every)
+    registry = GameRegistry(journal=journal)
+    session = registry.create(["A", "B"], seed=11)
+    GameDriver(session.engine, [GreedyPolicy(), GreedyPolicy()]).play_game(max_turns=15)
+    with pytest.raises(GameRuleError):
+        session.engine.pass_bid(0)
+    expected = session.engine.snapshot()
+    journal.close()
+
+    journal = GameJournal(path, checkpoint_every=checkpoint_every)
+    restored = GameRegistry(journal=journal)
+    assert restored.recover() == 1
+    engine = restored.get(session.game_id).engine
+    assert engine.snapshot() == expected
+    assert engine.action_listener.seq == session.engine.action_listener.seq
+    journal.close()
+
+
+def test_checkpoints_compact_the_action_journal(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path, checkpoint_every=5)
+    engine = GameEngine(["A", "B"], seed=3)
+    engine.start_turn()
+    journal.register("g", ["A", "B"], 3)
+    journal.attach("g", engine)
+    for _ in range(12):
+        with pytest.raises(GameRuleError):
+            engine.pass_bid(0)
+    journal.flush()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT seq FROM checkpoints").fetchall() == [(10,)]
+        assert conn.execute("SELECT seq FROM actions ORDER BY seq").fetchall() == [(11,), (12,)]
+    journal.close()
+
+
+def test_removed_games_are_dropped_from_journal(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path)
+    registry = GameRegistry(journal=journal)
+    session = registry.create(["A", "B"])
+    session.engine.roll_dice()
+    registry.remove(session.game_id)
+    journal.flush()
+    assert list(journal.load()) == []
+    journal.close()
+
+
+def test_malformed_actions_are_not_journaled_and_survive_restart(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path)
+    registry = GameRegistry(journal=journal)
+    session = registry.create(["A", "B"], seed=5)
+    engine = session.engine
+    with pytest.raises(GameRuleError):
+        engine.apply_action("roll_dice", (1,))
+    with pytest.raises(GameRuleError):
+        engine.apply_action("place_bid", (0, 10.5))
+    engine.apply_action("roll_dice")
+    expected = engine.snapshot()
+    assert engine.action_listener.seq == 1
+    journal.close()
+
+    journal = GameJournal(path)
+    restored = GameRegistry(journal=journal)
+    assert restored.recover() == 1
+    assert restored.get(session.game_id).engine.snapshot() == expected
+    journal.close()
+
+
+def test_poisoned_journal_quarantines_only_that_game(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path)
+    registry = GameRegistry(journal=journal)
+    healthy = registry.create(["A", "B"], seed=1)
+    poisoned = registry.create(["C", "D"], seed=2)
+    healthy.engine.roll_dice()
+    journal.append(healthy.game_id, 2, "roll_dice", (1,), {})
+    journal.append(poisoned.game_id, 1, "end_turn", (object(),), {})
+    journal.flush()
+    assert isinstance(journal.last_error, TypeError)
+    journal.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO actions VALUES (?, 1, 'roll_dice', 'null', NULL)", (poisoned.game_id,))
+
+    journal = GameJournal(path)
+    restored = GameRegistry(journal=journal)
+    assert restored.recover() == 1
+    assert healthy.game_id in restored
+    assert poisoned.game_id not in restored
+    assert journal.quarantined[poisoned.game_id].startswith("TypeError")
+    journal.flush()
+    assert GameRegistry(journal=journal).recover() == 1
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT game_id, seq FROM quarantine").fetchall() == [(poisoned.game_id, 1)]
+    journal.close()
@@ -0,0 +1,44 @@
+from monopoly.agents import GameDriver, GreedyPolicy
+from monopoly.persistence import GameJournal
+from monopoly.replay import GameRecord, records_from_journal, record_game, replay, state_hash, verify_corpus
+from monopoly.sessions import GameRegistry
+
+
+def test_recorded_games_replay_to_identical_state():
+    record = record_game(["A", "B", "C"], seed=5, policies=["greedy", "investor", "random"], max_turns=80, hashes=True)
+    assert len(record.hashes) == len(record.actions)
+    restored = GameRecord.from_json(record.to_json())
+    assert restored == record
+    result = replay(restored)
+    assert result.divergence is None
+    assert result.final_hash == record.final_hash
+
+
+def test_replay_reports_first_divergence():
+    record = record_game(["A", "B"], seed=9, max_turns=40, hashes=True)
+    record.hashes[6] ^= 1
+    record.hashes[10] ^= 1
+    divergence = replay(record).divergence
+    assert divergence is not None
+    assert divergence.step == 6
+    assert divergence.action == record.actions[6]
+    assert replay(record, check_hashes=False).divergence is None
+
+
+def test_verify_corpus_flags_only_tampered_games():
+    records = [record_game(["A", "B"], seed=seed, max_turns=30) for seed in range(4)]
+    records[2].seed += 1
+    summary = verify_corpus([record.to_json() for record in records], workers=1, chunk_size=3)
+    assert summary.games == 4
+    assert [index for index, _ in summary.divergences] == [2]
+
+
+def test_journal_games_export_to_replayable_records(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    journal = GameJournal(path)
+    session = GameRegistry(journal=journal).create(["A", "B"], seed=4)
+    GameDriver(session.engine, [GreedyPolicy(), GreedyPolicy()]).play_game(max_turns=10)
+    journal.close()
+    (record,) = records_from_journal(path)
+    assert len(record.actions) == session.engine.action_listener.seq
+    assert replay(record).final_hash == state_hash(session.engine)
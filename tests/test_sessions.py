@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from monopoly import codec
+from monopoly.engine import TurnPhase
+from monopoly.sessions import BOARD_JSON, GameNotFound, GameRegistry, serialize_state
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_registry_keeps_games_independent():
+    registry = GameRegistry()
+    first = registry.create(["A", "B"], seed=1)
+    second = registry.create(["C", "D"], seed=2)
+    assert first.game_id != second.game_id
+    first.engine.roll_dice()
+    assert registry.get(second.game_id).engine.state.turn_state.phase == TurnPhase.AWAIT_ROLL
+    assert len(registry) == 2
+
+
+def test_registry_evicts_idle_games():
+    clock = FakeClock()
+    registry = GameRegistry(idle_ttl=10, clock=clock)
+    session = registry.create(["A", "B"])
+    clock.now = 11
+    with pytest.raises(GameNotFound):
+        registry.get(session.game_id)
+    assert len(registry) == 0
+
+
+def test_registry_lru_cap_drops_least_recently_used():
+    clock = FakeClock()
+    registry = GameRegistry(max_games=2, clock=clock)
+    first = registry.create(["A", "B"])
+    second = registry.create(["A", "B"])
+    registry.get(first.game_id)
+    third = registry.create(["A", "B"])
+    assert first.game_id in registry
+    assert second.game_id not in registry
+    assert third.game_id in registry
+
+
+def test_session_delta_reports_only_changes():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+    base = session.version
+    player = session.engine.current_player()
+    player.position = 1
+    with session.lock:
+        session.engine._resolve_landing()
+        session.engine.buy_property()
+        session.commit()
+        delta = session.delta(base)
+    assert delta["full"] is False
+    assert [view["id"] for view in delta["players"]] == [player.player_id]
+    assert list(delta["properties"]) == ["1"]
+    assert delta["events"] == session.engine.state.event_log.tail(1)
+    assert session.delta(session.version)["players"] == []
+
+
+def test_session_delta_events_skip_versions_without_events():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+    engine = session.engine
+    base = session.version
+    with session.lock:
+        offer = engine.create_trade_offer(0, 1, 10, [], 0, [])
+        engine.cancel_trade_offer(offer.offer_id, 0)
+        engine.discard_trade_offer(offer.offer_id)
+        session.commit()
+        middle = session.version
+        engine.create_trade_offer(1, 0, 20, [], 0, [])
+        session.commit()
+    log = engine.state.event_log
+    assert session.version - base == 4
+    assert session.delta(base)["events"] == log.tail(3)
+    assert session.delta(middle)["events"] == log.tail(1)
+    assert len(codec.decode(session.encode(base))["events"]) == 3
+
+
+def test_long_poll_waits_without_holding_threads():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+    since = session.version
+
+    def act():
+        with session.lock:
+            session.engine.roll_dice()
+            session.commit()
+
+    async def main():
+        assert await session.wait_for_change(since, 0.01) is False
+        waiters = [asyncio.ensure_future(session.wait_for_change(since, 5)) for _ in range(100)]
+        await asyncio.sleep(0)
+        thread = threading.Thread(target=act)
+        thread.start()
+        results = await asyncio.gather(*waiters)
+        thread.join()
+        return results
+
+    assert asyncio.run(main()) == [True] * 100
+    assert session._waiters == set()
+
+
+def test_wait_for_change_does_not_take_the_session_lock():
+    session = GameRegistry().create(["A", "B"], seed=1)
+    with session.lock:
+        assert asyncio.run(session.wait_for_change(session.version, 0.01)) is False
+        assert asyncio.run(session.wait_for_change(session.version - 1, 0.01)) is True
+
+
+def test_session_delta_falls_back_to_full_state():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+    assert session.delta(session.version + 5)["full"] is True
+
+
+def test_session_publishes_deltas_to_subscribers():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+
+    async def scenario():
+        with session.lock:
+            queue = session.subscribe(asyncio.get_running_loop())
+            session.engine.roll_dice()
+            session.commit()
+        initial = await asyncio.wait_for(queue.get(), timeout=1)
+        update = await asyncio.wait_for(queue.get(), timeout=1)
+        session.bus.unsubscribe(queue)
+        return initial, update
+
+    initial, update = asyncio.run(scenario())
+    assert '"full":true' in initial
+    assert update.startswith(f"id: {session.version}\n")
+    assert '"full":false' in update
+    assert len(session.bus) == 0
+
+
+def test_board_metadata_is_served_separately_from_state():
+    board = json.loads(BOARD_JSON)
+    assert len(board["spaces"]) == 40
+    assert board["properties"]["39"]["name"] == "Boardwalk"
+    state = serialize_state(GameRegistry().create(["A", "B"], seed=1).engine)
+    assert "board" not in state
+    assert "name" not in state["properties"]["39"]
+
+
+def test_spectators_share_one_payload_and_coalesce_to_latest():
+    registry = GameRegistry()
+    session = registry.create(["A", "B"], seed=1)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        spectators = [session.spectate(loop) for _ in range(50)]
+        reader = spectators[0]
+        await reader.next()
+        for _ in range(3):
+            with session.lock:
+                session.engine.state.version += 1
+                session.commit()
+        await asyncio.sleep(0)
+        return spectators, await reader.next()
+
+    spectators, latest = asyncio.run(main())
+    assert latest.startswith(f"id: {session.version}\n".encode())
+    assert json.loads(latest.split(b"data: ", 1)[1]) == json.loads(session.state_payload())
+    assert spectators[0].skipped == 2
+    assert spectators[1].skipped == 3
+    assert all(spectator.latest is spectators[1].latest for spectator in spectators[1:])
+    assert session.state_payload() is session.state_payload()
+    assert len(session.spectators) == 50
@@ -0,0 +1,37 @@
+import sys
+
+import pytest
+
+from monopoly.sim import SimulationSummary, game_seed, main, play_game, run_batch
+
+
+def test_game_seeds_are_deterministic_and_distinct():
+    assert game_seed(7, 3) == game_seed(7, 3)
+    assert len({game_seed(7, index) for index in range(100)}) == 100
+
+
+def test_play_game_runs_to_termination():
+    result = play_game(2, seed=game_seed(1, 0), max_turns=2000)
+    assert result.turns <= 2000
+    if result.winner is not None:
+        assert len(result.bankruptcies) == 1
+
+
+def test_batch_summary_is_reproducible_and_mergeable():
+    first = run_batch(6, num_players=2, master_seed=3, workers=1, max_turns=300, chunk_size=2)
+    second = run_batch(6, num_players=2, master_seed=3, workers=1, max_turns=300, chunk_size=6)
+    assert first == second
+    assert first.games == 6
+    assert sum(first.wins) + first.draws == 6
+    merged = SimulationSummary(players=2)
+    merged.merge(first)
+    assert merged == first
+
+
+@pytest.mark.parametrize("games", ["0", "-3"])
+def test_cli_rejects_empty_batches(monkeypatch, capsys, games):
+    monkeypatch.setattr(sys, "argv", ["monopoly.sim", "--games", games])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert "--games must be at least 1." in capsys.readouterr().err
@@ -0,0 +1,78 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from monopoly.engine import GameEngine
+from monopoly.events import EventType
+from monopoly.sim import run_batch
+from monopoly.stats import QuantileSketch, RunningStats, StatsCollector
+
+
+def test_running_stats_merge_matches_single_pass():
+    values = [random.Random(3).gauss(100, 15) for _ in range(1000)]
+    whole, left, right = RunningStats(), RunningStats(), RunningStats()
+    for value in values:
+        whole.add(value)
+    for value in values[:300]:
+        left.add(value)
+    for value in values[300:]:
+        right.add(value)
+    left.merge(right)
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.variance == pytest.approx(np.var(values, ddof=1))
+    assert (left.minimum, left.maximum) == (min(values), max(values))
+
+
+def test_quantile_sketch_is_mergeable_within_relative_accuracy():
+    rng = random.Random(7)
+    values = sorted(rng.expovariate(0.01) for _ in range(5000)) + [0.0] * 100
+    first, second = QuantileSketch(), QuantileSketch()
+    for index, value in enumerate(values):
+        (first if index % 2 else second).add(value)
+    first.merge(second)
+    exact = np.quantile(values, [0.5, 0.9, 0.99])
+    for q, expected in zip((0.5, 0.9, 0.99), exact):
+        assert math.isclose(first.quantile(q), expected, rel_tol=0.03)
+    assert first.quantile(0.0) == 0.0
+    with pytest.raises(ValueError):
+        first.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_tracker_hooks_landings_rent_and_turns():
+    engine = GameEngine(["A", "B"], seed=1)
+    collector = StatsCollector()
+    tracker = collector.track(engine)
+    engine.start_turn()
+    engine._set_owner(1, 1)
+    engine._set_owner(3, 1)
+    engine.current_player().position = 1
+    engine._resolve_landing()
+    tracker.finish()
+    assert collector.landings[1] == 1
+    assert collector.rent[1].total == 4
+    assert collector.game_turns.stats.mean == 1
+    assert collector.cash[0].count == 2
+    assert engine.event_listener is None
+    seen = []
+    engine.event_listener = lambda code, player_id, args: seen.append(code)
+    engine.end_turn()
+    assert seen == [EventType.TURN_STARTED]
+
+
+def test_batch_statistics_merge_across_chunks_and_export(tmp_path):
+    first = run_batch(4, num_players=2, master_seed=3, workers=1, max_turns=200, chunk_size=1, collect_stats=True)
+    second = run_batch(4, num_players=2, master_seed=3, workers=1, max_turns=200, chunk_size=4, collect_stats=True)
+    assert first.stats.games == second.stats.games == 4
+    assert first.stats.landings == second.stats.landings
+    assert first.stats.game_turns.sketch == second.stats.game_turns.sketch
+    assert first.stats.rent_paid.stats.mean == pytest.approx(second.stats.rent_paid.stats.mean)
+    path = tmp_path / "stats.npz"
+    first.stats.save_npz(str(path))
+    data = np.load(path)
+    assert data["landings"].sum() == sum(first.stats.landings)
+    assert data["game_turns_quantiles"].shape == (3,)
+    assert int(data["games"]) == 4
@@ -0,0 +1,32 @@
+from monopoly.sessions import GameRegistry
+from monopoly.telemetry import Histogram, Telemetry
+
+
+def test_histogram_buckets_observations():
+    histogram = Histogram((0.001, 0.01))
+    for value in (0.0005, 0.001, 0.005, 2.0):
+        histogram.observe(value)
+    counts, total = histogram.snapshot()
+    assert counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert total == 0.0005 + 0.001 + 0.005 + 2.0
+
+
+def test_render_exposes_cumulative_histograms_and_gauges():
+    telemetry = Telemetry()
+    telemetry.actions.observe("roll", 0.00002)
+    telemetry.actions.observe("roll", 0.3)
+    telemetry.action_errors.inc('odd"name')
+    telemetry.serialization.observe("full", 0.0002)
+    registry = GameRegistry()
+    registry.create(["A", "B"], seed=1)
+    lines = telemetry.render(registry).splitlines()
+    assert "# TYPE monopoly_action_duration_seconds histogram" in lines
+    assert 'monopoly_action_duration_seconds_bucket{action="roll",le="5e-05"} 1' in lines
+    assert 'monopoly_action_duration_seconds_bucket{action="roll",le="0.25"} 1' in lines
+    assert 'monopoly_action_duration_seconds_bucket{action="roll",le="+Inf"} 2' in lines
+    assert 'monopoly_action_duration_seconds_count{action="roll"} 2' in lines
+    assert 'monopoly_action_errors_total{action="odd\\"name"} 1' in lines
+    assert 'monopoly_state_serialize_duration_seconds_count{mode="full"} 1' in lines
+    assert "monopoly_active_games 1" in lines
+    assert "monopoly_event_log_records 2" in lines
@@ -0,0 +1,103 @@
+import asyncio
+
+from monopoly.engine import TurnPhase
+from monopoly.sessions import GameRegistry
+from monopoly.timers import TurnTimers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_expired_turn_applies_default_actions():
+    clock = FakeClock()
+    registry = GameRegistry(clock=clock)
+    fired = []
+    timers = TurnTimers(registry, 30, 5, clock=clock, on_timeout=lambda game_id, action: fired.append(action))
+    session = registry.create(["A", "B"], seed=1)
+    engine = session.engine
+    engine.current_player().position = 1
+    with session.lock:
+        engine._resolve_landing()
+        session.commit()
+    timers.touch(session)
+    assert timers.deadline(session.game_id) == 30
+    clock.now = 29
+    assert timers.fire_due() == 0
+    clock.now = 30
+    assert timers.fire_due() == 1
+    assert engine.state.turn_state.phase == TurnPhase.AWAIT_AUCTION
+    assert timers.deadline(session.game_id) == 35
+    clock.now = 35
+    timers.fire_due()
+    clock.now = 65
+    timers.fire_due()
+    assert fired == ["decline_property", "pass_bid", "end_turn"]
+    assert engine.state.properties[1].owner_id is None
+    assert engine.state.current_player_index == 1
+    assert session.version == engine.state.version
+
+
+def test_auction_deadline_passes_idle_bidders():
+    clock = FakeClock()
+    registry = GameRegistry(clock=clock)
+    timers = TurnTimers(registry, 30, 5, clock=clock)
+    session = registry.create(["A", "B", "C"], seed=1)
+    engine = session.engine
+    engine.current_player().position = 1
+    with session.lock:
+        engine._resolve_landing()
+        engine.decline_property()
+        engine.place_bid(2, 40)
+        session.commit()
+    timers.touch(session)
+    assert timers.deadline(session.game_id) == 5
+    clock.now = 5
+    assert timers.fire_due() == 1
+    assert engine.state.properties[1].owner_id == 2
+    assert engine.state.turn_state.phase == TurnPhase.TURN_OVER
+    assert timers.deadline(session.game_id) == 35
+
+
+def test_player_actions_push_back_deadline_and_heap_stays_bounded():
+    clock = FakeClock()
+    registry = GameRegistry(clock=clock)
+    timers = TurnTimers(registry, turn_timeout=30, clock=clock)
+    session = registry.create(["A", "B"], seed=1)
+    for step in range(1000):
+        clock.now = step
+        with session.lock:
+            session.engine.state.version += 1
+            session.commit()
+            timers.touch(session)
+    assert len(timers) == 1
+    assert len(timers._heap) <= 2 * len(timers) + 65
+    clock.now = 1000
+    assert timers.fire_due() == 0
+    registry.remove(session.game_id)
+    clock.now = 2000
+    assert timers.fire_due() == 0
+    assert len(timers) == 0
+
+
+def test_run_loop_fires_deadlines():
+    registry = GameRegistry()
+    timers = TurnTimers(registry, turn_timeout=0.01, bid_timeout=0.01)
+    session = registry.create(["A", "B"], seed=3)
+    start = session.version
+
+    async def main():
+        task = asyncio.create_task(timers.run())
+        timers.touch(session)
+        for _ in range(200):
+            await asyncio.sleep(0.005)
+            if session.version > start:
+                break
+        task.cancel()
+
+    asyncio.run(main())
+    assert session.version > start
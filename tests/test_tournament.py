@@ -0,0 +1,48 @@
+import pytest
+
+from monopoly.agents import GameResult
+from monopoly.tournament import (
+    RESULT_RECORD,
+    Standings,
+    TournamentConfig,
+    placements,
+    run_tournament,
+    schedule,
+)
+
+
+def test_placements_rank_survivors_then_reverse_bankruptcy_order():
+    assert placements(GameResult(2, 50, [(0, "rent"), (3, "tax"), (1, "rent")]), 4) == (3, 1, 0, 2)
+    assert placements(GameResult(None, 50, [(1, "card")]), 3) == (0, 1, 0)
+
+
+def test_elo_moves_toward_the_winner_and_conserves_points():
+    standings = Standings(["a", "b", "c"])
+    standings.record(("a", "b", "c"), (1, 0, 2))
+    assert standings.ratings["b"] > 1500 > standings.ratings["c"]
+    assert sum(standings.ratings.values()) == pytest.approx(4500)
+    assert standings.wins == {"a": 0, "b": 1, "c": 0}
+
+
+def test_round_robin_rotates_seats_across_every_table():
+    config = TournamentConfig(["greedy", "investor", "random"], seats=2, rounds=2, games_per_match=2)
+    (matches,) = list(schedule(config, Standings(config.entrants)))
+    matches = list(matches)
+    assert [match.index for match in matches] == list(range(12))
+    assert matches[0].entrants == ("greedy", "investor") and matches[1].entrants == ("investor", "greedy")
+
+
+def test_interrupted_runs_resume_to_identical_ratings(tmp_path):
+    config = TournamentConfig(
+        ["greedy", "investor", "passive"], seats=2, format="swiss", rounds=3, games_per_match=2, max_turns=200
+    )
+    path = tmp_path / "results.bin"
+    full = run_tournament(config, str(path), workers=1, chunk_size=1)
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) - 2 * RESULT_RECORD.size - 3])
+    resumed = run_tournament(config, str(path), workers=1)
+    assert resumed == full
+    assert path.stat().st_size == len(data)
+    assert run_tournament(config, None, workers=2, chunk_size=2) == full
+    with pytest.raises(ValueError):
+        run_tournament(TournamentConfig(["greedy", "investor"], seats=2), str(path), workers=1)
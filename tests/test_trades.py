@@ -1,4 +1,7 @@
-from monopoly.engine import GameEngine
+import pytest
+
+from monopoly.engine import GameEngine, InsufficientFunds
+from monopoly.fast import FastGameEngine
 
 
 def test_trade_offer_acceptance():
@@ -19,3 +22,25 @@ def test_trade_offer_acceptance():
     assert engine.state.properties[1].owner_id == player_b.player_id
     assert player_a.cash == 1500 + 100
     assert player_b.cash == 1500 - 100
+
+
+def _holdings(engine):
+    if isinstance(engine, FastGameEngine):
+        return list(engine.cash), [engine.owner[prop_id] for prop_id in (1, 3, 5)]
+    return [player.cash for player in engine.state.players], [engine.state.properties[p].owner_id for p in (1, 3, 5)]
+
+
+@pytest.mark.parametrize("engine_cls", [GameEngine, FastGameEngine])
+def test_trade_without_cash_for_mortgage_interest_changes_nothing(engine_cls):
+    engine = engine_cls(["A", "B"], seed=1)
+    engine.start_turn()
+    for prop_id in (1, 3):
+        engine._set_owner(prop_id, 0)
+        engine._set_mortgaged(prop_id, True)
+    engine._set_owner(5, 1)
+    # B keeps 5 after paying 1495, short of the 6 interest due on the two mortgaged browns.
+    engine.create_trade_offer(0, 1, 0, [1, 3], 1495, [5])
+    before = _holdings(engine)
+    with pytest.raises(InsufficientFunds):
+        engine.accept_trade_offer(1, 1)
+    assert _holdings(engine) == before